@@ -44,6 +44,8 @@ from .setup import (
     BASE_PLATFORMS,
     DATA_SETUP_STARTED,
     DATA_SETUP_TIME,
+    DATA_SETUP_TIMINGS,
+    async_get_setup_critical_path,
     async_notify_setup_error,
     async_set_domains_to_be_loaded,
     async_setup_component,
@@ -66,8 +68,7 @@ DATA_REGISTRIES_LOADED = "bootstrap_registries_loaded"
 LOG_SLOW_STARTUP_INTERVAL = 60
 SLOW_STARTUP_CHECK_INTERVAL = 1
 
-STAGE_1_TIMEOUT = 120
-STAGE_2_TIMEOUT = 300
+STAGE_1_AND_2_TIMEOUT = 420
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
@@ -304,6 +305,7 @@ async def async_load_base_functionality(hass: core.HomeAssistant) -> None:
         issue_registry.async_load(hass),
         hass.async_add_executor_job(_cache_uname_processor),
         template.async_load_custom_templates(hass),
+        template.async_load_code_cache(hass),
         restore_state.async_load(hass),
         hass.config_entries.async_initialize(),
     )
@@ -745,32 +747,27 @@ async def _async_set_up_integrations(
         - stage_1_domains
     )
 
-    # Enables after dependencies when setting up stage 1 domains
-    async_set_domains_to_be_loaded(hass, stage_1_domains)
-
-    # Start setup
-    if stage_1_domains:
-        _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(hass, stage_1_domains, config)
-        except TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
-
-    # Add after dependencies when setting up stage 2 domains
+    # Enables after dependencies when setting up the stage 1 and 2 domains,
+    # stage 1 domains only wait for after dependencies in stage 1
+    async_set_domains_to_be_loaded(hass, stage_1_domains, early=True)
     async_set_domains_to_be_loaded(hass, stage_2_domains)
 
-    if stage_2_domains:
+    # Start setup, every domain is set up as soon as its dependencies
+    # and after dependencies have been set up
+    if stage_1_domains or stage_2_domains:
+        _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
             async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                STAGE_1_AND_2_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(hass, stage_2_domains, config)
+                # Stage 1 domains are started first
+                await asyncio.gather(
+                    async_setup_multi_components(hass, stage_1_domains, config),
+                    async_setup_multi_components(hass, stage_2_domains, config),
+                )
         except TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+            _LOGGER.warning("Setup timed out for stage 1 and 2 - moving forward")
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -792,3 +789,13 @@ async def _async_set_up_integrations(
             )
         },
     )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        timings = hass.data.get(DATA_SETUP_TIMINGS, {})
+        _LOGGER.debug(
+            "Integration setup critical path: %s",
+            " -> ".join(
+                f"{domain} ({timing.done - timing.dependencies_done:.2f}s)"
+                for domain in async_get_setup_critical_path(hass)
+                if (timing := timings[domain]).done and timing.dependencies_done
+            ),
+        )
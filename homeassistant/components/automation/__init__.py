@@ -13,6 +13,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_runs
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -84,6 +85,7 @@ from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_set,
     trace_append_element,
+    trace_enabled_cv,
     trace_get,
     trace_path,
 )
@@ -628,8 +630,9 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
                 trigger_path = f"trigger/{variables['trigger']['idx']}"
             else:
                 trigger_path = "trigger"
-            trace_element = TraceElement(variables, trigger_path)
-            trace_append_element(trace_element)
+            if trace_enabled_cv.get():
+                trace_element = TraceElement(variables, trigger_path)
+                trace_append_element(trace_element)
 
             if (
                 not skip_condition
@@ -700,6 +703,7 @@ class AutomationEntity(BaseAutomationEntity, RestoreEntity):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
         await self.async_disable()
+        async_remove_trace_runs(self.hass, f"{DOMAIN}.{self.unique_id}")
 
     async def _async_enable_automation(self, event: Event) -> None:
         """Start automation on startup."""
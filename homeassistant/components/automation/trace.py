@@ -6,11 +6,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_enabled_cv
 from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
@@ -57,7 +58,7 @@ def trace_automation(
 ) -> Generator[AutomationTrace, None, None]:
     """Trace action execution of automation with automation_id."""
     trace = AutomationTrace(automation_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_enabled_cv.set(async_start_trace(hass, trace, trace_config))
 
     try:
         yield trace
@@ -66,5 +67,7 @@ def trace_automation(
             trace.set_error(ex)
         raise ex
     finally:
+        trace_enabled_cv.reset(token)
         if automation_id:
             trace.finished()
+            async_finish_trace(hass, trace, trace_config)
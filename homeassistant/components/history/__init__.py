@@ -105,6 +105,15 @@ class HistoryPeriodView(HomeAssistantView):
         minimal_response = "minimal_response" in request.query
         no_attributes = "no_attributes" in request.query
 
+        max_points: int | None = None
+        if max_points_str := query.get("max_points"):
+            try:
+                max_points = int(max_points_str)
+            except ValueError:
+                max_points = 0
+            if max_points < 2:
+                return self.json_message("Invalid max_points", HTTPStatus.BAD_REQUEST)
+
         if (
             (end_time and not has_recorder_run_after(hass, end_time))
             or not include_start_time_state
@@ -117,7 +126,7 @@ class HistoryPeriodView(HomeAssistantView):
 
         return cast(
             web.Response,
-            await get_instance(hass).async_add_executor_job(
+            await get_instance(hass).async_add_read_executor_job(
                 self._sorted_significant_states_json,
                 hass,
                 start_time,
@@ -127,6 +136,7 @@ class HistoryPeriodView(HomeAssistantView):
                 significant_changes_only,
                 minimal_response,
                 no_attributes,
+                max_points,
             ),
         )
 
@@ -140,6 +150,7 @@ class HistoryPeriodView(HomeAssistantView):
         significant_changes_only: bool,
         minimal_response: bool,
         no_attributes: bool,
+        max_points: int | None,
     ) -> web.Response:
         """Fetch significant stats from the database as json."""
         with session_scope(hass=hass, read_only=True) as session:
@@ -156,6 +167,8 @@ class HistoryPeriodView(HomeAssistantView):
                         significant_changes_only,
                         minimal_response,
                         no_attributes,
+                        False,
+                        max_points,
                     ).values()
                 )
             )
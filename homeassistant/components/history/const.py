@@ -5,3 +5,10 @@ DOMAIN = "history"
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The maximum number of states sent in one message of a chunked history response
+MAX_STATES_PER_HISTORY_CHUNK = 2000
+
+# How often, in seconds, a chunked history response that waits for a slow
+# client checks if it has been cancelled
+HISTORY_CHUNK_ABORT_CHECK_INTERVAL = 1
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import asyncio
 from collections.abc import Callable, Iterable, MutableMapping
+from concurrent.futures import CancelledError
+from contextlib import closing
 from dataclasses import dataclass
 from datetime import datetime as dt
 import logging
@@ -38,7 +40,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import EventType
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_ABORT_CHECK_INTERVAL,
+    MAX_PENDING_HISTORY_STATES,
+    MAX_STATES_PER_HISTORY_CHUNK,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -72,6 +79,7 @@ def _ws_get_significant_states(
     significant_changes_only: bool,
     minimal_response: bool,
     no_attributes: bool,
+    max_points: int | None,
 ) -> bytes:
     """Fetch history significant_states and convert them to json in the executor."""
     return json_bytes(
@@ -88,11 +96,106 @@ def _ws_get_significant_states(
                 minimal_response,
                 no_attributes,
                 True,
+                max_points,
             ),
         )
     )
 
 
+def _generate_chunk_message(
+    msg_id: int, states: MutableMapping[str, Any], done: bool
+) -> bytes:
+    """Generate a message with a chunk of a chunked history response."""
+    return json_bytes(messages.event_message(msg_id, {"states": states, "done": done}))
+
+
+def _ws_send_significant_states_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    max_points: int | None,
+) -> None:
+    """Fetch history significant_states and send them to the client in chunks.
+
+    The chunks are converted to json in the executor while the states
+    are streamed from the database. The next chunk is only fetched once
+    the previous one has been written to the client.
+    """
+    chunks = history.get_significant_states_chunks(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        True,
+        MAX_STATES_PER_HISTORY_CHUNK,
+        max_points,
+    )
+    # Close the database session in this thread when the job is aborted
+    with closing(chunks):
+        chunk = next(chunks, {})
+        for next_chunk in chunks:
+            _send_chunk_message(
+                hass, connection, _generate_chunk_message(msg_id, chunk, False)
+            )
+            chunk = next_chunk
+    _send_chunk_message(hass, connection, _generate_chunk_message(msg_id, chunk, True))
+
+
+def _send_chunk_message(
+    hass: HomeAssistant, connection: ActiveConnection, message: bytes
+) -> None:
+    """Send a chunk message from the executor and wait until it is written.
+
+    A slow client holds up the query instead of filling up the pending
+    messages of the connection. The wait ends when the read job is
+    cancelled or times out.
+    """
+    future = asyncio.run_coroutine_threadsafe(
+        _async_send_chunk_message(connection, message), hass.loop
+    )
+    instance = get_instance(hass)
+    while True:
+        try:
+            future.result(HISTORY_CHUNK_ABORT_CHECK_INTERVAL)
+        except TimeoutError:
+            if instance.read_job_should_abort():
+                future.cancel()
+                raise CancelledError from None
+        else:
+            return
+
+
+async def _async_send_chunk_message(
+    connection: ActiveConnection, message: bytes
+) -> None:
+    """Send a chunk message and wait until the writer has sent it."""
+    connection.send_message(message)
+    await connection.async_wait_drained()
+
+
+@callback
+def _async_send_empty_history(
+    connection: ActiveConnection, msg_id: int, chunked: bool
+) -> None:
+    """Send a history response without states."""
+    if not chunked:
+        connection.send_result(msg_id, {})
+        return
+    connection.send_result(msg_id)
+    connection.send_message(_generate_chunk_message(msg_id, {}, True))
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "history/history_during_period",
@@ -103,13 +206,23 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    With chunked the command is acknowledged with an empty result and the
+    states are sent in event messages of bounded size; the last message
+    has done set.
+
+    With max_points the numeric states of each entity are downsampled
+    to about max_points states.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -128,8 +241,9 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
+    chunked: bool = msg["chunked"]
     if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg["id"], chunked)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,14 +263,34 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history(connection, msg["id"], chunked)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
 
-    connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+    if chunked:
+        connection.send_result(msg["id"])
+        with connection.cancel_on_close(msg["id"]):
+            await get_instance(hass).async_add_read_executor_job(
+                _ws_send_significant_states_chunks,
+                hass,
+                connection,
+                msg["id"],
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                no_attributes,
+                max_points,
+            )
+        return
+
+    with connection.cancel_on_close(msg["id"]):
+        response = await get_instance(hass).async_add_read_executor_job(
             _ws_get_significant_states,
             hass,
             msg["id"],
@@ -167,8 +301,10 @@ async def ws_get_history_during_period(
             significant_changes_only,
             minimal_response,
             no_attributes,
+            max_points,
         )
-    )
+
+    connection.send_message(response)
 
 
 def _generate_stream_message(
@@ -221,6 +357,7 @@ def _generate_historical_response(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None,
 ) -> tuple[float, dt | None, bytes | None]:
     """Generate a historical response."""
     states = cast(
@@ -236,6 +373,7 @@ def _generate_historical_response(
             minimal_response,
             no_attributes,
             True,
+            max_points,
         ),
     )
     last_time_ts = 0.0
@@ -276,10 +414,11 @@ async def _async_send_historical_states(
     minimal_response: bool,
     no_attributes: bool,
     send_empty: bool,
+    max_points: int | None = None,
 ) -> dt | None:
     """Fetch history significant_states and send them to the client."""
     instance = get_instance(hass)
-    last_time_ts, last_time_dt, payload = await instance.async_add_executor_job(
+    last_time_ts, last_time_dt, payload = await instance.async_add_read_executor_job(
         _generate_historical_response,
         hass,
         msg_id,
@@ -291,6 +430,7 @@ async def _async_send_historical_states(
         minimal_response,
         no_attributes,
         send_empty,
+        max_points,
     )
     if payload:
         connection.send_message(payload)
@@ -401,13 +541,18 @@ def _async_subscribe_events(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("max_points"): vol.All(int, vol.Range(min=2)),
     }
 )
 @websocket_api.async_response
 async def ws_stream(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history stream websocket command."""
+    """Handle history stream websocket command.
+
+    max_points only downsamples the states fetched from the database,
+    live states are always sent as they happen.
+    """
     start_time_str = msg["start_time"]
     msg_id: int = msg["id"]
     utc_now = dt_util.utcnow()
@@ -440,6 +585,7 @@ async def ws_stream(
     significant_changes_only = msg["significant_changes_only"]
     no_attributes = msg["no_attributes"]
     minimal_response = msg["minimal_response"]
+    max_points: int | None = msg.get("max_points")
 
     if end_time and end_time <= utc_now:
         if (
@@ -466,6 +612,7 @@ async def ws_stream(
             minimal_response,
             no_attributes,
             True,
+            max_points,
         )
         return
 
@@ -530,6 +677,7 @@ async def ws_stream(
         minimal_response,
         no_attributes,
         True,
+        max_points,
     )
 
     if msg_id not in connection.subscriptions:
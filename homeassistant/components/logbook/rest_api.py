@@ -116,5 +116,6 @@ class LogbookView(HomeAssistantView):
             )
 
         return cast(
-            web.Response, await get_instance(hass).async_add_executor_job(json_events)
+            web.Response,
+            await get_instance(hass).async_add_read_executor_job(json_events),
         )
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine, Iterable
-from dataclasses import dataclass
-from functools import lru_cache
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterable, Iterator
+from dataclasses import asdict, dataclass
 from itertools import chain, groupby
 import logging
 from operator import attrgetter
@@ -164,10 +164,16 @@ async def async_subscribe(
     msg_callback: AsyncMessageCallbackType | MessageCallbackType,
     qos: int = DEFAULT_QOS,
     encoding: str | None = DEFAULT_ENCODING,
+    coalesce_window: float | None = None,
 ) -> CALLBACK_TYPE:
     """Subscribe to an MQTT topic.
 
     Call the return value to unsubscribe.
+
+    If coalesce_window is set, messages are delivered after the window (in
+    seconds) has passed and only the latest message received per topic within
+    the window is delivered. This is meant for subscribers which only care about
+    the current state of a topic.
     """
     if not mqtt_config_entry_enabled(hass):
         raise HomeAssistantError(
@@ -186,19 +192,24 @@ async def async_subscribe(
             translation_domain=DOMAIN,
             translation_placeholders={"topic": topic},
         ) from exc
-    async_remove = await mqtt_data.client.async_subscribe(
-        topic,
-        catch_log_exception(
-            msg_callback,
-            lambda msg: (
-                f"Exception in {msg_callback.__name__} when handling msg on "
-                f"'{msg.topic}': '{msg.payload}'"
-            ),
+    wrapped_msg_callback = catch_log_exception(
+        msg_callback,
+        lambda msg: (
+            f"Exception in {msg_callback.__name__} when handling msg on "
+            f"'{msg.topic}': '{msg.payload}'"
         ),
+    )
+    if coalesce_window is None:
+        return await mqtt_data.client.async_subscribe(
+            topic, wrapped_msg_callback, qos, encoding
+        )
+    return await mqtt_data.client.async_subscribe(
+        topic,
+        wrapped_msg_callback,
         qos,
         encoding,
+        coalesce_window=coalesce_window,
     )
-    return async_remove
 
 
 @bind_hass
@@ -230,10 +241,33 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str
-    matcher: Any
     job: HassJob[[ReceiveMessage], Coroutine[Any, Any, None] | None]
     qos: int = 0
     encoding: str | None = "utf-8"
+    coalesce_window: float | None = None
+
+
+@dataclass(slots=True)
+class MessageStatistics:
+    """Counters for inbound MQTT message dispatching."""
+
+    # Messages received from the broker
+    received: int = 0
+    # Number of times the inbound message queue was drained in the event loop
+    batches: int = 0
+    # Messages handed to subscription callbacks
+    dispatched: int = 0
+    # Messages superseded by a later message on the same topic before
+    # a coalescing subscription was called
+    coalesced: int = 0
+    # Messages not delivered to a subscription because the payload could
+    # not be decoded, a retained message was already delivered or the
+    # subscription was removed while the message was pending
+    dropped: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        """Return the counters as a dictionary."""
+        return asdict(self)
 
 
 class MqttClientSetup:
@@ -302,6 +336,103 @@ def _is_simple_match(topic: str) -> bool:
     return not ("+" in topic or "#" in topic)
 
 
+class _SubscriptionTrieNode:
+    """A node in the wildcard subscription trie."""
+
+    __slots__ = ("children", "subscriptions")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _SubscriptionTrieNode] = {}
+        self.subscriptions: list[Subscription] = []
+
+
+class SubscriptionTrie:
+    """Prefix tree of wildcard subscriptions keyed by topic level.
+
+    Matching a topic walks the trie one topic level at a time, so the cost
+    depends on the depth of the topic and not on the number of subscriptions.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root = _SubscriptionTrieNode()
+
+    def add(self, subscription: Subscription) -> None:
+        """Add a subscription to the trie."""
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _SubscriptionTrieNode()
+            node = child
+        node.subscriptions.append(subscription)
+
+    def remove(self, subscription: Subscription) -> None:
+        """Remove a subscription from the trie.
+
+        Raises ValueError if the subscription is not in the trie.
+        """
+        path: list[tuple[_SubscriptionTrieNode, str]] = []
+        node = self._root
+        for level in subscription.topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                raise ValueError(subscription)
+            path.append((node, level))
+            node = child
+        node.subscriptions.remove(subscription)
+        # Prune the branch up to the first node that is still in use
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.subscriptions or child.children:
+                break
+            del parent.children[level]
+
+    def __contains__(self, topic: object) -> bool:
+        """Return if a subscription with exactly this topic filter exists."""
+        if not isinstance(topic, str):
+            return False
+        node = self._root
+        for level in topic.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.subscriptions)
+
+    def __iter__(self) -> Iterator[Subscription]:
+        """Iterate over all subscriptions in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.subscriptions
+            nodes.extend(node.children.values())
+
+    def match(self, topic: str) -> list[Subscription]:
+        """Return the subscriptions with a topic filter matching the topic."""
+        levels = topic.split("/")
+        depth = len(levels)
+        # Topics starting with $ must not be matched by a wildcard on the
+        # first level (MQTT v3.1.1 section 4.7.2)
+        normal = not topic.startswith("$")
+        matches: list[Subscription] = []
+        pending: list[tuple[_SubscriptionTrieNode, int]] = [(self._root, 0)]
+        while pending:
+            node, index = pending.pop()
+            children = node.children
+            wildcards_allowed = normal or index > 0
+            if wildcards_allowed and (multi := children.get("#")) is not None:
+                matches.extend(multi.subscriptions)
+            if index == depth:
+                matches.extend(node.subscriptions)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                pending.append((child, index + 1))
+            if wildcards_allowed and (single := children.get("+")) is not None:
+                pending.append((single, index + 1))
+        return matches
+
+
 class EnsureJobAfterCooldown:
     """Ensure a cool down period before executing a job.
 
@@ -394,7 +525,7 @@ class MQTT:
         self.conf = conf
 
         self._simple_subscriptions: dict[str, list[Subscription]] = {}
-        self._wildcard_subscriptions: list[Subscription] = []
+        self._wildcard_subscriptions = SubscriptionTrie()
         # _retained_topics prevents a Subscription from receiving a
         # retained message more than once per topic. This prevents flooding
         # already active subscribers when new subscribers subscribe to a topic
@@ -416,6 +547,14 @@ class MQTT:
             UNSUBSCRIBE_COOLDOWN, self._async_perform_unsubscribes
         )
         self._pending_unsubscribes: set[str] = set()  # topic
+        # Messages received by the paho thread waiting to be handled
+        # in the event loop
+        self._inbound_messages: deque[mqtt.MQTTMessage] = deque()
+        self._inbound_drain_scheduled = False
+        # Latest pending message per topic for subscriptions with a coalesce window
+        self._coalesced_messages: dict[Subscription, dict[str, ReceiveMessage]] = {}
+        self._coalesce_timers: dict[Subscription, asyncio.TimerHandle] = {}
+        self.message_statistics = MessageStatistics()
 
         if self.hass.state is CoreState.running:
             self._ha_started.set()
@@ -455,6 +594,10 @@ class MQTT:
         """Clean up listeners."""
         while self._cleanup_on_unload:
             self._cleanup_on_unload.pop()()
+        for timer in self._coalesce_timers.values():
+            timer.cancel()
+        self._coalesce_timers.clear()
+        self._coalesced_messages.clear()
 
     def init_client(self) -> None:
         """Initialize paho client."""
@@ -477,8 +620,8 @@ class MQTT:
 
     def _is_active_subscription(self, topic: str) -> bool:
         """Check if a topic has an active subscription."""
-        return topic in self._simple_subscriptions or any(
-            other.topic == topic for other in self._wildcard_subscriptions
+        return (
+            topic in self._simple_subscriptions or topic in self._wildcard_subscriptions
         )
 
     async def async_publish(
@@ -559,30 +702,25 @@ class MQTT:
         """Restore tracked subscriptions after reload."""
         for subscription in subscriptions:
             self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
     @callback
     def _async_track_subscription(self, subscription: Subscription) -> None:
         """Track a subscription.
 
         This method does not send a SUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         if _is_simple_match(subscription.topic):
             self._simple_subscriptions.setdefault(subscription.topic, []).append(
                 subscription
             )
         else:
-            self._wildcard_subscriptions.append(subscription)
+            self._wildcard_subscriptions.add(subscription)
 
     @callback
     def _async_untrack_subscription(self, subscription: Subscription) -> None:
         """Untrack a subscription.
 
         This method does not send an UNSUBSCRIBE message to the broker.
-
-        The caller is responsible clearing the cache of _matching_subscriptions.
         """
         topic = subscription.topic
         try:
@@ -619,6 +757,7 @@ class MQTT:
         msg_callback: AsyncMessageCallbackType | MessageCallbackType,
         qos: int,
         encoding: str | None = None,
+        coalesce_window: float | None = None,
     ) -> Callable[[], None]:
         """Set up a subscription to a topic with the provided qos.
 
@@ -628,10 +767,9 @@ class MQTT:
             raise HomeAssistantError("Topic needs to be a string!")
 
         subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
+            topic, HassJob(msg_callback), qos, encoding, coalesce_window
         )
         self._async_track_subscription(subscription)
-        self._matching_subscriptions.cache_clear()
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -641,9 +779,12 @@ class MQTT:
         def async_remove() -> None:
             """Remove subscription."""
             self._async_untrack_subscription(subscription)
-            self._matching_subscriptions.cache_clear()
             if subscription in self._retained_topics:
                 del self._retained_topics[subscription]
+            if timer := self._coalesce_timers.pop(subscription, None):
+                timer.cancel()
+            if pending := self._coalesced_messages.pop(subscription, None):
+                self.message_statistics.dropped += len(pending)
             # Only unsubscribe if currently connected
             if self.connected:
                 self._async_unsubscribe(topic)
@@ -804,16 +945,30 @@ class MQTT:
         # and since they come in via a thread and need to be processed in the event loop,
         # we want to avoid hass.add_job since most of the time is spent calling
         # inspect to figure out how to run the callback.
-        self.loop.call_soon_threadsafe(self._mqtt_handle_message, msg)
+        # Messages are queued and the event loop is only woken up if the queue
+        # is not already scheduled to be drained, so a burst of messages is
+        # handled in a single event loop iteration.
+        self._inbound_messages.append(msg)
+        if not self._inbound_drain_scheduled:
+            self._inbound_drain_scheduled = True
+            self.loop.call_soon_threadsafe(self._mqtt_handle_inbound_messages)
+
+    @callback
+    def _mqtt_handle_inbound_messages(self) -> None:
+        """Handle all messages queued by the paho thread."""
+        # Reset the flag before draining so a message queued while
+        # draining either gets handled now or schedules a new drain.
+        self._inbound_drain_scheduled = False
+        self.message_statistics.batches += 1
+        inbound_messages = self._inbound_messages
+        while inbound_messages:
+            self._mqtt_handle_message(inbound_messages.popleft())
 
-    @lru_cache(None)  # pylint: disable=method-cache-max-size-none
     def _matching_subscriptions(self, topic: str) -> list[Subscription]:
-        subscriptions: list[Subscription] = []
+        """Return the subscriptions matching a topic."""
+        subscriptions = self._wildcard_subscriptions.match(topic)
         if topic in self._simple_subscriptions:
-            subscriptions.extend(self._simple_subscriptions[topic])
-        for subscription in self._wildcard_subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
+            subscriptions[0:0] = self._simple_subscriptions[topic]
         return subscriptions
 
     @callback
@@ -830,6 +985,8 @@ class MQTT:
             msg.payload[0:8192],
         )
         timestamp = dt_util.utcnow()
+        statistics = self.message_statistics
+        statistics.received += 1
 
         subscriptions = self._matching_subscriptions(topic)
 
@@ -838,6 +995,7 @@ class MQTT:
                 retained_topics = self._retained_topics.setdefault(subscription, set())
                 # Skip if the subscription already received a retained message
                 if topic in retained_topics:
+                    statistics.dropped += 1
                     continue
                 # Remember the subscription had an initial retained message
                 self._retained_topics[subscription].add(topic)
@@ -854,20 +1012,53 @@ class MQTT:
                         subscription.encoding,
                         subscription.job,
                     )
+                    statistics.dropped += 1
                     continue
-            self.hass.async_run_hass_job(
-                subscription.job,
-                ReceiveMessage(
-                    topic,
-                    payload,
-                    msg.qos,
-                    msg.retain,
-                    subscription.topic,
-                    timestamp,
-                ),
+            receive_msg = ReceiveMessage(
+                topic,
+                payload,
+                msg.qos,
+                msg.retain,
+                subscription.topic,
+                timestamp,
             )
+            if subscription.coalesce_window is not None:
+                self._async_coalesce_message(subscription, receive_msg)
+                continue
+            statistics.dispatched += 1
+            self.hass.async_run_hass_job(subscription.job, receive_msg)
         self._mqtt_data.state_write_requests.process_write_state_requests(msg)
 
+    @callback
+    def _async_coalesce_message(
+        self, subscription: Subscription, msg: ReceiveMessage
+    ) -> None:
+        """Keep the latest message per topic until the coalesce window has passed."""
+        if (pending := self._coalesced_messages.get(subscription)) is None:
+            pending = self._coalesced_messages[subscription] = {}
+        if msg.topic in pending:
+            self.message_statistics.coalesced += 1
+        pending[msg.topic] = msg
+        if subscription not in self._coalesce_timers:
+            if TYPE_CHECKING:
+                assert subscription.coalesce_window is not None
+            self._coalesce_timers[subscription] = self.loop.call_later(
+                subscription.coalesce_window,
+                self._async_flush_coalesced_messages,
+                subscription,
+            )
+
+    @callback
+    def _async_flush_coalesced_messages(self, subscription: Subscription) -> None:
+        """Deliver the pending coalesced messages of a subscription."""
+        del self._coalesce_timers[subscription]
+        if not (pending := self._coalesced_messages.pop(subscription, None)):
+            return
+        self.message_statistics.dispatched += len(pending)
+        for msg in pending.values():
+            self.hass.async_run_hass_job(subscription.job, msg)
+            self._mqtt_data.state_write_requests.process_write_state_requests(msg)
+
     def _mqtt_on_callback(
         self,
         _mqttc: mqtt.Client,
@@ -962,13 +1153,3 @@ def _raise_on_error(result_code: int) -> None:
 
     if result_code and (message := mqtt.error_string(result_code)):
         raise HomeAssistantError(f"Error talking to MQTT: {message}")
-
-
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable-next=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
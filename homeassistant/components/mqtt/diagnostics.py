@@ -52,6 +52,7 @@ def _async_get_diagnostics(
 
     data = {
         "connected": is_connected(hass),
+        "message_statistics": mqtt_instance.message_statistics.as_dict(),
         "mqtt_config": redacted_config,
     }
 
@@ -299,7 +299,7 @@ class EntityTopicState:
         self.subscribe_calls: dict[str, Entity] = {}
 
     @callback
-    def process_write_state_requests(self, msg: MQTTMessage) -> None:
+    def process_write_state_requests(self, msg: MQTTMessage | ReceiveMessage) -> None:
         """Process the write state requests."""
         while self.subscribe_calls:
             _, entity = self.subscribe_calls.popitem()
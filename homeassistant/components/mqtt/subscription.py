@@ -25,6 +25,7 @@ class EntitySubscription:
     unsubscribe_callback: Callable[[], None] | None = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str = attr.ib(default="utf-8")
+    coalesce_window: float | None = attr.ib(default=None)
 
     def resubscribe_if_necessary(
         self, hass: HomeAssistant, other: EntitySubscription | None
@@ -51,7 +52,12 @@ class EntitySubscription:
         debug_info.add_subscription(self.hass, self.message_callback, self.topic)
 
         self.subscribe_task = mqtt.async_subscribe(
-            hass, self.topic, self.message_callback, self.qos, self.encoding
+            hass,
+            self.topic,
+            self.message_callback,
+            self.qos,
+            self.encoding,
+            coalesce_window=self.coalesce_window,
         )
 
     async def subscribe(self) -> None:
@@ -69,10 +75,12 @@ class EntitySubscription:
             self.topic,
             self.qos,
             self.encoding,
+            self.coalesce_window,
         ) != (
             other.topic,
             other.qos,
             other.encoding,
+            other.coalesce_window,
         )
 
 
@@ -103,6 +111,7 @@ def async_prepare_subscribe_topics(
             unsubscribe_callback=None,
             qos=value.get("qos", DEFAULT_QOS),
             encoding=value.get("encoding", "utf-8"),
+            coalesce_window=value.get("coalesce_window"),
             hass=hass,
             subscribe_task=None,
         )
@@ -29,9 +29,11 @@ from . import entity_registry, websocket_api
 from .const import (  # noqa: F401
     CONF_DB_INTEGRITY_CHECK,
     DATA_INSTANCE,
+    DEFAULT_HISTORY_CACHE_MAX_STATES,
     DOMAIN,
     INTEGRATION_PLATFORM_COMPILE_STATISTICS,
     INTEGRATION_PLATFORMS_LOAD_IN_RECORDER_THREAD,
+    PURGE_PARTITIONS,
     SQLITE_URL_PREFIX,
     SupportedDialect,
 )
@@ -52,11 +54,15 @@ DEFAULT_COMMIT_INTERVAL = 5
 
 CONF_AUTO_PURGE = "auto_purge"
 CONF_AUTO_REPACK = "auto_repack"
+CONF_BULK_INSERT_STATES = "bulk_insert_states"
 CONF_DB_URL = "db_url"
+CONF_DB_READ_URL = "db_read_url"
 CONF_DB_MAX_RETRIES = "db_max_retries"
 CONF_DB_RETRY_WAIT = "db_retry_wait"
+CONF_HISTORY_CACHE_MAX_STATES = "history_cache_max_states"
 CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
+CONF_PURGE_PARTITION = "purge_partition"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
 
@@ -94,11 +100,14 @@ CONFIG_SCHEMA = vol.Schema(
                 {
                     vol.Optional(CONF_AUTO_PURGE, default=True): cv.boolean,
                     vol.Optional(CONF_AUTO_REPACK, default=True): cv.boolean,
+                    vol.Optional(CONF_BULK_INSERT_STATES, default=False): cv.boolean,
                     vol.Optional(CONF_PURGE_KEEP_DAYS, default=10): vol.All(
                         vol.Coerce(int), vol.Range(min=1)
                     ),
                     vol.Optional(CONF_PURGE_INTERVAL, default=1): cv.positive_int,
+                    vol.Optional(CONF_PURGE_PARTITION): vol.In(PURGE_PARTITIONS),
                     vol.Optional(CONF_DB_URL): vol.All(cv.string, validate_db_url),
+                    vol.Optional(CONF_DB_READ_URL): vol.All(cv.string, validate_db_url),
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
@@ -111,6 +120,10 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_DB_INTEGRITY_CHECK, default=DEFAULT_DB_INTEGRITY_CHECK
                     ): cv.boolean,
+                    vol.Optional(
+                        CONF_HISTORY_CACHE_MAX_STATES,
+                        default=DEFAULT_HISTORY_CACHE_MAX_STATES,
+                    ): cv.positive_int,
                 }
             ),
         )
@@ -160,6 +173,10 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         db_retry_wait=db_retry_wait,
         entity_filter=entity_filter,
         exclude_event_types=exclude_event_types,
+        db_read_url=conf.get(CONF_DB_READ_URL),
+        purge_partition=PURGE_PARTITIONS.get(conf.get(CONF_PURGE_PARTITION)),
+        bulk_insert_states=conf[CONF_BULK_INSERT_STATES],
+        history_cache_max_states=conf[CONF_HISTORY_CACHE_MAX_STATES],
     )
     instance.async_initialize()
     instance.async_register()
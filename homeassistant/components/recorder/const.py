@@ -1,5 +1,6 @@
 """Recorder constants."""
 
+from datetime import timedelta
 from enum import StrEnum
 
 from homeassistant.const import (
@@ -40,6 +41,21 @@ SQLITE_MODERN_MAX_BIND_VARS = 4000
 DEFAULT_MAX_BIND_VARS = 4000
 
 DB_WORKER_PREFIX = "DbWorker"
+DB_READ_WORKER_PREFIX = "DbReadWorker"
+
+# Read queries that run longer than this are cancelled
+DB_READ_QUERY_TIMEOUT = 300
+
+# The number of recorded states kept in memory per entity to
+# answer history queries for recent periods without the database
+HISTORY_CACHE_MAX_STATES_PER_ENTITY = 1024
+
+# The number of recorded states kept in the history cache in total,
+# the cache is disabled when set to 0
+DEFAULT_HISTORY_CACHE_MAX_STATES = 100000
+
+# Purge drops whole partitions of states and events of this length
+PURGE_PARTITIONS = {"day": timedelta(days=1), "week": timedelta(weeks=1)}
 
 ALL_DOMAIN_EXCLUDE_ATTRS = {ATTR_ATTRIBUTION, ATTR_RESTORED, ATTR_SUPPORTED_FEATURES}
 
@@ -53,6 +69,7 @@ STATISTICS_ROWS_SCHEMA_VERSION = 23
 CONTEXT_ID_AS_BINARY_SCHEMA_VERSION = 36
 EVENT_TYPE_IDS_SCHEMA_VERSION = 37
 STATES_META_SCHEMA_VERSION = 38
+REFCOUNT_SCHEMA_VERSION = 43
 
 LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION = 28
 
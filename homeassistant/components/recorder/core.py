@@ -43,10 +43,14 @@ from homeassistant.util.enum import try_parse_enum
 from . import migration, statistics
 from .const import (
     CONTEXT_ID_AS_BINARY_SCHEMA_VERSION,
+    DB_READ_QUERY_TIMEOUT,
+    DB_READ_WORKER_PREFIX,
     DB_WORKER_PREFIX,
+    DEFAULT_HISTORY_CACHE_MAX_STATES,
     DOMAIN,
     ESTIMATED_QUEUE_ITEM_SIZE,
     EVENT_TYPE_IDS_SCHEMA_VERSION,
+    HISTORY_CACHE_MAX_STATES_PER_ENTITY,
     KEEPALIVE_TIME,
     LEGACY_STATES_EVENT_ID_INDEX_SCHEMA_VERSION,
     MARIADB_PYMYSQL_URL_PREFIX,
@@ -55,6 +59,7 @@ from .const import (
     MYSQLDB_PYMYSQL_URL_PREFIX,
     MYSQLDB_URL_PREFIX,
     QUEUE_PERCENTAGE_ALLOWED_AVAILABLE_MEMORY,
+    REFCOUNT_SCHEMA_VERSION,
     SQLITE_MAX_BIND_VARS,
     SQLITE_URL_PREFIX,
     STATES_META_SCHEMA_VERSION,
@@ -76,7 +81,8 @@ from .db_schema import (
     Statistics,
     StatisticsShortTerm,
 )
-from .executor import DBInterruptibleThreadPoolExecutor
+from .executor import DBInterruptibleThreadPoolExecutor, ReadJob
+from .history.cache import StatesHistoryCache
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
 from .queries import (
@@ -129,6 +135,7 @@ from .util import (
     move_away_broken_database,
     session_scope,
     setup_connection_for_dialect,
+    setup_read_connection_for_dialect,
     validate_or_move_away_sqlite_database,
     write_lock_db_sqlite,
 )
@@ -158,7 +165,8 @@ INVALIDATED_ERR = "Database connection invalidated"
 CONNECTIVITY_ERR = "Error in database connectivity during commit"
 
 # Pool size must accommodate Recorder thread + All db executors
-MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1
+MAX_DB_READ_EXECUTOR_WORKERS = 2
+MAX_DB_EXECUTOR_WORKERS = POOL_SIZE - 1 - MAX_DB_READ_EXECUTOR_WORKERS
 
 
 class Recorder(threading.Thread):
@@ -178,6 +186,10 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool],
         exclude_event_types: set[str],
+        db_read_url: str | None = None,
+        purge_partition: timedelta | None = None,
+        bulk_insert_states: bool = False,
+        history_cache_max_states: int = DEFAULT_HISTORY_CACHE_MAX_STATES,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -187,11 +199,14 @@ class Recorder(threading.Thread):
         self.auto_purge = auto_purge
         self.auto_repack = auto_repack
         self.keep_days = keep_days
+        self.purge_partition = purge_partition
+        self.bulk_insert_states = bulk_insert_states
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
+        self.db_read_url = db_read_url
         self.db_max_retries = db_max_retries
         self.db_retry_wait = db_retry_wait
         self.database_engine: DatabaseEngine | None = None
@@ -204,6 +219,9 @@ class Recorder(threading.Thread):
         self.async_recorder_ready = asyncio.Event()
         self._queue_watch = threading.Event()
         self.engine: Engine | None = None
+        # Engine used by the read executor, reads use the recorder
+        # engine when there is none
+        self.read_engine: Engine | None = None
         self.max_backlog: int = MAX_QUEUE_BACKLOG_MIN_VALUE
         self._psutil: ha_psutil.PsutilWrapper | None = None
 
@@ -224,9 +242,15 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        self.states_history_cache = StatesHistoryCache(
+            history_cache_max_states,
+            HISTORY_CACHE_MAX_STATES_PER_ENTITY,
+            self.recorder_runs_manager.recording_start.timestamp(),
+        )
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
+        self._get_read_session: Callable[[], Session] | None = None
         self._completed_first_database_setup: bool | None = None
         self.async_migration_event = asyncio.Event()
         self.migration_in_progress = False
@@ -234,6 +258,11 @@ class Recorder(threading.Thread):
         self.use_legacy_events_index = False
         self._database_lock_task: DatabaseLockTask | None = None
         self._db_executor: DBInterruptibleThreadPoolExecutor | None = None
+        self._db_read_executor: DBInterruptibleThreadPoolExecutor | None = None
+        # The read job running in the current read executor thread
+        self._read_job_local = threading.local()
+        self.read_jobs_cancelled = 0
+        self.read_jobs_timed_out = 0
 
         self._event_listener: CALLBACK_TYPE | None = None
         self._queue_watcher: CALLBACK_TYPE | None = None
@@ -242,6 +271,9 @@ class Recorder(threading.Thread):
         self._periodic_listener: CALLBACK_TYPE | None = None
         self._nightly_listener: CALLBACK_TYPE | None = None
         self._dialect_name: SupportedDialect | None = None
+        # States are written with multi-row INSERT ... RETURNING instead of
+        # the ORM unit of work when enabled and the database supports it
+        self._bulk_insert_states = False
         self.enabled = True
 
         # For safety we default to the lowest value for max_bind_vars
@@ -256,6 +288,13 @@ class Recorder(threading.Thread):
         """Return the number of items in the recorder backlog."""
         return self._queue.qsize()
 
+    @property
+    def read_queue_depth(self) -> int:
+        """Return the number of read jobs waiting for a read executor thread."""
+        if self._db_read_executor is None:
+            return 0
+        return self._db_read_executor.queue_depth
+
     @property
     def dialect_name(self) -> SupportedDialect | None:
         """Return the dialect the recorder uses."""
@@ -274,7 +313,15 @@ class Recorder(threading.Thread):
         return self._event_listener is not None
 
     def get_session(self) -> Session:
-        """Get a new sqlalchemy session."""
+        """Get a new sqlalchemy session.
+
+        Jobs running in the read executor get a session of the read engine.
+        """
+        if (
+            self._get_read_session is not None
+            and getattr(self._read_job_local, "job", None) is not None
+        ):
+            return self._get_read_session()
         if self._get_session is None:
             raise RuntimeError("The database connection has not been established")
         return self._get_session()
@@ -295,11 +342,17 @@ class Recorder(threading.Thread):
             max_workers=MAX_DB_EXECUTOR_WORKERS,
             shutdown_hook=self._shutdown_pool,
         )
+        self._db_read_executor = DBInterruptibleThreadPoolExecutor(
+            thread_name_prefix=DB_READ_WORKER_PREFIX,
+            max_workers=MAX_DB_READ_EXECUTOR_WORKERS,
+            shutdown_hook=self._shutdown_pool,
+        )
 
     def _shutdown_pool(self) -> None:
         """Close the dbpool connections in the current thread."""
-        if self.engine and hasattr(self.engine.pool, "shutdown"):
-            self.engine.pool.shutdown()
+        for engine in (self.engine, self.read_engine):
+            if engine and hasattr(engine.pool, "shutdown"):
+                engine.pool.shutdown()
 
     @callback
     def async_initialize(self) -> None:
@@ -368,8 +421,59 @@ class Recorder(threading.Thread):
         """Add an executor job from within the event loop."""
         return self.hass.loop.run_in_executor(self._db_executor, target, *args)
 
+    async def async_add_read_executor_job(
+        self,
+        target: Callable[..., T],
+        *args: Any,
+        timeout: float | None = DB_READ_QUERY_TIMEOUT,
+    ) -> T:
+        """Run a job that only reads from the database in the read executor.
+
+        Read jobs do not compete with the recorder and the db executor for
+        database connections. The job is aborted when the caller is cancelled
+        or the timeout is reached; running SQLite queries are interrupted,
+        other databases enforce the timeout on the server.
+        """
+        if (read_executor := self._db_read_executor) is None:
+            # Do not fall back to the default executor of the event loop
+            raise RuntimeError("The recorder read executor is not running")
+        job = ReadJob(timeout)
+        try:
+            async with asyncio.timeout(timeout):
+                return await self.hass.loop.run_in_executor(
+                    read_executor, self._run_read_job, job, target, *args
+                )
+        except TimeoutError:
+            job.cancelled = True
+            self.read_jobs_timed_out += 1
+            raise
+        except asyncio.CancelledError:
+            job.cancelled = True
+            self.read_jobs_cancelled += 1
+            raise
+
+    def _run_read_job(self, job: ReadJob, target: Callable[..., T], *args: Any) -> T:
+        """Run a read job in a read executor thread."""
+        if job.should_abort():
+            # The caller is no longer waiting for the result
+            raise CancelledError
+        local = self._read_job_local
+        local.job = job
+        try:
+            return target(*args)
+        finally:
+            local.job = None
+
+    def read_job_should_abort(self) -> bool:
+        """Return if the read job of the current thread should be aborted."""
+        job: ReadJob | None = getattr(self._read_job_local, "job", None)
+        return job is not None and job.should_abort()
+
     def _stop_executor(self) -> None:
         """Stop the executor."""
+        if self._db_read_executor is not None:
+            self._db_read_executor.shutdown()
+            self._db_read_executor = None
         if self._db_executor is None:
             return
         self._db_executor.shutdown()
@@ -777,6 +881,10 @@ class Recorder(threading.Thread):
         self._schedule_compile_missing_statistics()
         _LOGGER.debug("Recorder processing the queue")
         self._adjust_lru_size()
+        if self.schema_version >= REFCOUNT_SCHEMA_VERSION:
+            _LOGGER.debug("Activating refcounts as the schema is migrated")
+            self.state_attributes_manager.refcounts_active = True
+            self.event_data_manager.refcounts_active = True
         self.hass.add_job(self._async_set_recorder_ready_migration_done)
         self._run_event_loop()
 
@@ -1077,12 +1185,15 @@ class Recorder(threading.Thread):
         # Matching attributes found in the pending commit
         if pending_event_data := event_data_manager.get_pending(shared_data):
             dbevent.event_data_rel = pending_event_data
+            if event_data_manager.refcounts_active:
+                pending_event_data.refcount = (pending_event_data.refcount or 0) + 1
         # Matching attributes id found in the cache
         elif (data_id := event_data_manager.get_from_cache(shared_data)) or (
             (hash_ := EventData.hash_shared_data_bytes(shared_data_bytes))
             and (data_id := event_data_manager.get(shared_data, hash_, session))
         ):
             dbevent.data_id = data_id
+            event_data_manager.add_ref(data_id)
         else:
             # No matching attributes found, save them in the DB
             dbevent_data = EventData(shared_data=shared_data, hash=hash_)
@@ -1144,6 +1255,8 @@ class Recorder(threading.Thread):
         # Matching attributes found in the pending commit
         if pending_event_data := state_attributes_manager.get_pending(shared_attrs):
             dbstate.state_attributes = pending_event_data
+            if state_attributes_manager.refcounts_active:
+                pending_event_data.refcount = (pending_event_data.refcount or 0) + 1
         # Matching attributes id found in the cache
         elif (
             attributes_id := state_attributes_manager.get_from_cache(shared_attrs)
@@ -1156,6 +1269,7 @@ class Recorder(threading.Thread):
             )
         ):
             dbstate.attributes_id = attributes_id
+            state_attributes_manager.add_ref(attributes_id)
         else:
             # No matching attributes found, save them in the DB
             dbstate_attributes = StateAttributes(shared_attrs=shared_attrs, hash=hash_)
@@ -1163,7 +1277,12 @@ class Recorder(threading.Thread):
             self._add_to_session(session, dbstate_attributes)
             dbstate.state_attributes = dbstate_attributes
 
-        self._add_to_session(session, dbstate)
+        if self._bulk_insert_states:
+            self._event_session_has_pending_writes = True
+            states_manager.add_pending_insert(dbstate)
+        else:
+            self._add_to_session(session, dbstate)
+        self.states_history_cache.add_pending(dbstate, shared_attrs)
 
     def _handle_database_error(self, err: Exception) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1202,6 +1321,11 @@ class Recorder(threading.Thread):
         session = self.event_session
         self._commits_without_expire += 1
 
+        if self._bulk_insert_states:
+            self.states_manager.insert_pending(session)
+        # Count the references to existing shared rows in the same commit
+        self.state_attributes_manager.update_pending_refcounts(session)
+        self.event_data_manager.update_pending_refcounts(session)
         session.commit()
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1213,6 +1337,7 @@ class Recorder(threading.Thread):
         self.event_data_manager.post_commit_pending()
         self.event_type_manager.post_commit_pending()
         self.states_meta_manager.post_commit_pending()
+        self.states_history_cache.post_commit_pending()
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -1240,6 +1365,7 @@ class Recorder(threading.Thread):
         self.event_type_manager.reset()
         self.states_meta_manager.reset()
         self.statistics_meta_manager.reset()
+        self.states_history_cache.reset()
 
         if not self.event_session:
             return
@@ -1423,14 +1549,86 @@ class Recorder(threading.Thread):
 
         self.engine = create_engine(self.db_url, **kwargs, future=True)
         self._dialect_name = try_parse_enum(SupportedDialect, self.engine.dialect.name)
+        # MySQL and MariaDB cannot return the ids of a multi-row INSERT in
+        # parameter order, which is needed to link the old_state_id of the
+        # states in the same commit, so they keep the ORM unit of work
+        self._bulk_insert_states = (
+            self.bulk_insert_states
+            and self.engine.dialect.insert_executemany_returning_sort_by_parameter_order
+        )
+        if self.bulk_insert_states and not self._bulk_insert_states:
+            _LOGGER.warning(
+                "Bulk inserting states is not supported by %s, the"
+                " bulk_insert_states option is ignored",
+                self.engine.dialect.name,
+            )
         sqlalchemy_event.listen(self.engine, "connect", self._setup_recorder_connection)
 
         Base.metadata.create_all(self.engine)
         self._get_session = scoped_session(sessionmaker(bind=self.engine, future=True))
         _LOGGER.debug("Connected to recorder database")
+        self._setup_read_engine()
+
+    def _setup_read_engine(self) -> None:
+        """Create the engine used by the read executor.
+
+        In-memory SQLite databases cannot be shared with another engine,
+        reads use the recorder engine for them.
+        """
+        assert self.engine is not None
+        read_url = self.db_read_url or self.db_url
+        if read_url == SQLITE_URL_PREFIX or ":memory:" in read_url:
+            return
+        kwargs: dict[str, Any] = {}
+        if read_url.startswith(SQLITE_URL_PREFIX):
+            kwargs["poolclass"] = RecorderPool
+        else:
+            kwargs["echo"] = False
+            if read_url.startswith(
+                (
+                    MARIADB_URL_PREFIX,
+                    MARIADB_PYMYSQL_URL_PREFIX,
+                    MYSQLDB_URL_PREFIX,
+                    MYSQLDB_PYMYSQL_URL_PREFIX,
+                )
+            ):
+                kwargs["connect_args"] = {"charset": "utf8mb4"}
+                if read_url.startswith((MARIADB_URL_PREFIX, MYSQLDB_URL_PREFIX)):
+                    with contextlib.suppress(ImportError):
+                        kwargs["connect_args"]["conv"] = build_mysqldb_conv()
+        read_engine = create_engine(read_url, **kwargs, future=True)
+        if read_engine.dialect.name != self.engine.dialect.name:
+            _LOGGER.error(
+                "The read database uses %s while the recorder database uses %s; "
+                "reads use the recorder database",
+                read_engine.dialect.name,
+                self.engine.dialect.name,
+            )
+            read_engine.dispose()
+            return
+        sqlalchemy_event.listen(read_engine, "connect", self._setup_read_connection)
+        self.read_engine = read_engine
+        self._get_read_session = scoped_session(
+            sessionmaker(bind=read_engine, future=True)
+        )
+
+    def _setup_read_connection(
+        self, dbapi_connection: DBAPIConnection, connection_record: Any
+    ) -> None:
+        """Dbapi specific read connection settings."""
+        assert self.read_engine is not None
+        setup_read_connection_for_dialect(
+            self.read_engine.dialect.name,
+            dbapi_connection,
+            self.read_job_should_abort,
+        )
 
     def _close_connection(self) -> None:
         """Close the connection."""
+        self._get_read_session = None
+        if self.read_engine:
+            self.read_engine.dispose()
+            self.read_engine = None
         if self.engine:
             self.engine.dispose()
             self.engine = None
@@ -16,6 +16,7 @@ from sqlalchemy import (
     Boolean,
     ColumnElement,
     DateTime,
+    FetchedValue,
     Float,
     ForeignKey,
     Identity,
@@ -67,7 +68,7 @@ class Base(DeclarativeBase):
     """Base class for tables."""
 
 
-SCHEMA_VERSION = 42
+SCHEMA_VERSION = 43
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -332,18 +333,26 @@ class EventData(Base):
 
     __table_args__ = (_DEFAULT_TABLE_ARGS,)
     __tablename__ = TABLE_EVENT_DATA
+    # The refcount is only written when set so rows can still be inserted
+    # into a database that has not been migrated to the refcount column yet
+    __mapper_args__ = {"eager_defaults": False}
     data_id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
     hash: Mapped[int | None] = mapped_column(UINT_32_TYPE, index=True)
     # Note that this is not named attributes to avoid confusion with the states table
     shared_data: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The number of events using the data, None if it has not been counted yet
+    refcount: Mapped[int | None] = mapped_column(
+        Integer, index=True, server_default=FetchedValue()
+    )
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
         return (
             "<recorder.EventData("
-            f"id={self.data_id}, hash='{self.hash}', data='{self.shared_data}'"
+            f"id={self.data_id}, hash='{self.hash}', data='{self.shared_data}',"
+            f" refcount={self.refcount}"
             ")>"
         )
 
@@ -545,18 +554,25 @@ class StateAttributes(Base):
 
     __table_args__ = (_DEFAULT_TABLE_ARGS,)
     __tablename__ = TABLE_STATE_ATTRIBUTES
+    # The refcount is only written when set so rows can still be inserted
+    # into a database that has not been migrated to the refcount column yet
+    __mapper_args__ = {"eager_defaults": False}
     attributes_id: Mapped[int] = mapped_column(Integer, Identity(), primary_key=True)
     hash: Mapped[int | None] = mapped_column(UINT_32_TYPE, index=True)
     # Note that this is not named attributes to avoid confusion with the states table
     shared_attrs: Mapped[str | None] = mapped_column(
         Text().with_variant(mysql.LONGTEXT, "mysql", "mariadb")
     )
+    # The number of states using the attributes, None if it has not been counted yet
+    refcount: Mapped[int | None] = mapped_column(
+        Integer, index=True, server_default=FetchedValue()
+    )
 
     def __repr__(self) -> str:
         """Return string representation of instance for debugging."""
         return (
             f"<recorder.StateAttributes(id={self.attributes_id}, hash='{self.hash}',"
-            f" attributes='{self.shared_attrs}')>"
+            f" attributes='{self.shared_attrs}', refcount={self.refcount})>"
         )
 
     @staticmethod
@@ -4,6 +4,7 @@ from __future__ import annotations
 from collections.abc import Callable
 from concurrent.futures.thread import _threads_queues, _worker
 import threading
+import time
 from typing import Any
 import weakref
 
@@ -26,6 +27,11 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
         self._shutdown_hook: Callable[[], None] = kwargs.pop("shutdown_hook")
         super().__init__(*args, **kwargs)
 
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of jobs waiting for a worker."""
+        return self._work_queue.qsize()
+
     def _adjust_thread_count(self) -> None:
         """Overridden to add support for shutdown hook.
 
@@ -62,3 +68,24 @@ class DBInterruptibleThreadPoolExecutor(InterruptibleThreadPoolExecutor):
             executor_thread.start()
             self._threads.add(executor_thread)  # type: ignore[attr-defined]
             _threads_queues[executor_thread] = self._work_queue  # type: ignore[index]
+
+
+class ReadJob:
+    """The state of a job running in the database read executor.
+
+    The job is aborted by the worker once it is cancelled or
+    its deadline has passed.
+    """
+
+    __slots__ = ("cancelled", "deadline")
+
+    def __init__(self, timeout: float | None) -> None:
+        """Initialize the read job."""
+        self.cancelled = False
+        self.deadline = time.monotonic() + timeout if timeout else None
+
+    def should_abort(self) -> bool:
+        """Return if the job should be aborted."""
+        return self.cancelled or (
+            self.deadline is not None and time.monotonic() > self.deadline
+        )
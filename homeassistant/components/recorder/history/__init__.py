@@ -1,7 +1,7 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
-from collections.abc import MutableMapping
+from collections.abc import Iterator, MutableMapping
 from datetime import datetime
 from typing import Any
 
@@ -16,8 +16,11 @@ from .modern import (
     get_full_significant_states_with_session as _modern_get_full_significant_states_with_session,
     get_last_state_changes as _modern_get_last_state_changes,
     get_significant_states as _modern_get_significant_states,
+    get_significant_states_chunks as _modern_get_significant_states_chunks,
+    get_significant_states_columns_with_session as _modern_get_significant_states_columns_with_session,
     get_significant_states_with_session as _modern_get_significant_states_with_session,
     state_changes_during_period as _modern_state_changes_during_period,
+    states_lists_to_chunks,
 )
 
 # These are the APIs of this package
@@ -27,6 +30,8 @@ __all__ = [
     "get_full_significant_states_with_session",
     "get_last_state_changes",
     "get_significant_states",
+    "get_significant_states_chunks",
+    "get_significant_states_columns_with_session",
     "get_significant_states_with_session",
     "state_changes_during_period",
 ]
@@ -91,17 +96,32 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
-    if not recorder.get_instance(hass).states_meta_manager.active:
-        from .legacy import (  # pylint: disable=import-outside-toplevel
-            get_significant_states as _legacy_get_significant_states,
+    """Return a dict of significant states during a time period.
+
+    max_points is ignored while the legacy schema is in use.
+    """
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            max_points,
         )
 
-        _target = _legacy_get_significant_states
-    else:
-        _target = _modern_get_significant_states
-    return _target(
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    return _legacy_get_significant_states(
         hass,
         start_time,
         end_time,
@@ -115,6 +135,98 @@ def get_significant_states(
     )
 
 
+def get_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool = True,
+    significant_changes_only: bool = True,
+    minimal_response: bool = False,
+    no_attributes: bool = False,
+    compressed_state_format: bool = False,
+    max_states: int = 5000,
+    max_points: int | None = None,
+) -> Iterator[MutableMapping[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states during a time period in chunks.
+
+    max_points is ignored while the legacy schema is in use.
+    """
+    if recorder.get_instance(hass).states_meta_manager.active:
+        yield from _modern_get_significant_states_chunks(
+            hass,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            max_states,
+            max_points,
+        )
+        return
+
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states as _legacy_get_significant_states,
+    )
+
+    # The legacy schema is only used during the migration,
+    # the states are fetched at once and split afterwards
+    states = _legacy_get_significant_states(
+        hass,
+        start_time,
+        end_time,
+        entity_ids,
+        None,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        no_attributes,
+        compressed_state_format,
+    )
+    yield from states_lists_to_chunks(states.items(), max_states)
+
+
+def get_significant_states_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    significant_changes_only: bool = True,
+) -> dict[str, tuple[list[str | None], list[float], list[dict[str, Any]]]]:
+    """Return the states, timestamps and attributes of each entity as columns.
+
+    The states are converted from State objects while the legacy schema is in use.
+    """
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_columns_with_session(
+            hass, session, start_time, end_time, entity_ids, significant_changes_only
+        )
+
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_full_significant_states_with_session as _legacy_get_full_significant_states_with_session,
+    )
+
+    return {
+        entity_id: (
+            [state.state for state in states],
+            [state.last_updated_timestamp for state in states],
+            [state.attributes for state in states],
+        )
+        for entity_id, states in _legacy_get_full_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            significant_changes_only=significant_changes_only,
+        ).items()
+    }
+
+
 def get_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -127,17 +239,33 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
-    """Return a dict of significant states during a time period."""
-    if not recorder.get_instance(hass).states_meta_manager.active:
-        from .legacy import (  # pylint: disable=import-outside-toplevel
-            get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    """Return a dict of significant states during a time period.
+
+    max_points is ignored while the legacy schema is in use.
+    """
+    if recorder.get_instance(hass).states_meta_manager.active:
+        return _modern_get_significant_states_with_session(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            compressed_state_format,
+            max_points,
         )
 
-        _target = _legacy_get_significant_states_with_session
-    else:
-        _target = _modern_get_significant_states_with_session
-    return _target(
+    from .legacy import (  # pylint: disable=import-outside-toplevel
+        get_significant_states_with_session as _legacy_get_significant_states_with_session,
+    )
+
+    return _legacy_get_significant_states_with_session(
         hass,
         session,
         start_time,
@@ -0,0 +1,377 @@
+"""In-memory cache of recently recorded states for history queries."""
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+from collections.abc import Iterable
+import math
+import sys
+import threading
+import time
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from ..db_schema import States
+
+
+class CachedStateRow(NamedTuple):
+    """A state row served from the cache.
+
+    The fields match the columns selected by the history queries so
+    the rows can be converted with the same code as database rows.
+    """
+
+    metadata_id: int
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    attributes: str | None
+
+
+class _EntityHistory:
+    """Columnar ring of the recorded states of a single metadata_id.
+
+    Rows are appended to the columns and the oldest rows are dropped by
+    moving the head forward. The columns are compacted once the dropped
+    rows take up as much space as the live rows.
+    """
+
+    __slots__ = (
+        "complete_after_ts",
+        "head",
+        "last_updated_ts",
+        "last_changed_ts",
+        "states",
+        "attributes_ids",
+    )
+
+    def __init__(self, complete_after_ts: float) -> None:
+        """Initialize the entity history."""
+        # All states recorded after this timestamp are in the columns
+        self.complete_after_ts = complete_after_ts
+        self.head = 0
+        self.last_updated_ts = array("d")
+        # 0.0 is used when last_changed_ts matches last_updated_ts
+        self.last_changed_ts = array("d")
+        self.states: list[str | None] = []
+        self.attributes_ids = array("q")
+
+    def __len__(self) -> int:
+        """Return the number of rows in the ring."""
+        return len(self.last_updated_ts) - self.head
+
+    def compact(self) -> None:
+        """Drop the rows before the head from the columns."""
+        head = self.head
+        del self.last_updated_ts[:head]
+        del self.last_changed_ts[:head]
+        del self.states[:head]
+        del self.attributes_ids[:head]
+        self.head = 0
+
+
+class StatesHistoryCache:
+    """Cache the states recorded in this run per metadata_id.
+
+    The recorder thread adds states when they are committed to the database
+    and history queries running in the executor read from the cache,
+    so all access to the columns is guarded by a lock.
+
+    A query is only answered from the cache when the cache is known to hold
+    every state the database would return for it.
+
+    At most max_states states are kept, the states of the least recently
+    used entities are evicted first. The cache is disabled when max_states
+    is 0.
+    """
+
+    def __init__(
+        self, max_states: int, max_states_per_entity: int, recording_start_ts: float
+    ) -> None:
+        """Initialize the cache.
+
+        Every state recorded after recording_start_ts is added to the cache.
+        """
+        self.max_states = max_states
+        self.max_states_per_entity = max_states_per_entity
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._pending: list[tuple[States, str]] = []
+        # Ordered from the least to the most recently used
+        self._entities: OrderedDict[int, _EntityHistory] = OrderedDict()
+        # The complete_after_ts of the entities that have been evicted
+        self._evicted_complete_after_ts: dict[int, float] = {}
+        self._num_states = 0
+        self._shared_attrs: dict[int, str] = {}
+        self._shared_attrs_refs: dict[int, int] = {}
+        # States recorded at the recording start are also added
+        self._complete_after_ts = math.nextafter(recording_start_ts, -math.inf)
+
+    def add_pending(self, dbstate: States, shared_attrs: str) -> None:
+        """Add a state that has been added to the session but not yet committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self.max_states:
+            self._pending.append((dbstate, shared_attrs))
+
+    def post_commit_pending(self) -> None:
+        """Move the committed states into the cache.
+
+        This call must be called from the recorder thread.
+        """
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        with self._lock:
+            for dbstate, shared_attrs in pending:
+                if (metadata_id := dbstate.metadata_id) is None or (
+                    attributes_id := dbstate.attributes_id
+                ) is None:
+                    continue
+                self._append(
+                    metadata_id,
+                    dbstate.state,
+                    dbstate.last_updated_ts or 0.0,
+                    dbstate.last_changed_ts or 0.0,
+                    attributes_id,
+                    shared_attrs,
+                )
+            if self._num_states > self.max_states:
+                self._evict_least_recently_used()
+
+    def _append(
+        self,
+        metadata_id: int,
+        state: str | None,
+        last_updated_ts: float,
+        last_changed_ts: float,
+        attributes_id: int,
+        shared_attrs: str,
+    ) -> None:
+        """Append a row to the ring of a metadata_id."""
+        if (history := self._entities.get(metadata_id)) is None:
+            history = self._entities[metadata_id] = _EntityHistory(
+                self._evicted_complete_after_ts.pop(
+                    metadata_id, self._complete_after_ts
+                )
+            )
+        else:
+            self._entities.move_to_end(metadata_id)
+        if last_updated_ts <= history.complete_after_ts:
+            return
+        if len(history) and history.last_updated_ts[-1] > last_updated_ts:
+            # States must be in order to be searched, start over
+            # from the newest state we have seen.
+            self._drop_rows(history, len(history.last_updated_ts))
+            history.complete_after_ts = history.last_updated_ts[-1]
+            history.compact()
+            return
+        history.last_updated_ts.append(last_updated_ts)
+        history.last_changed_ts.append(last_changed_ts)
+        history.states.append(sys.intern(state) if state else state)
+        history.attributes_ids.append(attributes_id)
+        self._num_states += 1
+        if attributes_id in self._shared_attrs_refs:
+            self._shared_attrs_refs[attributes_id] += 1
+        else:
+            self._shared_attrs_refs[attributes_id] = 1
+            self._shared_attrs[attributes_id] = shared_attrs
+        if len(history) > self.max_states_per_entity:
+            # We no longer know about the states before the new head
+            history.complete_after_ts = history.last_updated_ts[history.head]
+            self._drop_rows(history, history.head + 1)
+            if history.head >= self.max_states_per_entity:
+                history.compact()
+
+    def _drop_rows(self, history: _EntityHistory, new_head: int) -> None:
+        """Release the attributes of the rows before new_head and move the head."""
+        refs = self._shared_attrs_refs
+        for attributes_id in history.attributes_ids[history.head : new_head]:
+            if refs[attributes_id] == 1:
+                del refs[attributes_id]
+                del self._shared_attrs[attributes_id]
+            else:
+                refs[attributes_id] -= 1
+        self._num_states -= new_head - history.head
+        history.head = new_head
+
+    def _evict_least_recently_used(self) -> None:
+        """Evict the least recently used entities until max_states is not exceeded."""
+        entities = self._entities
+        while self._num_states > self.max_states:
+            metadata_id, history = entities.popitem(last=False)
+            if len(history):
+                # We no longer know about the states we drop
+                complete_after_ts = history.last_updated_ts[-1]
+                self._drop_rows(history, len(history.last_updated_ts))
+            else:
+                complete_after_ts = history.complete_after_ts
+            self._evicted_complete_after_ts[metadata_id] = complete_after_ts
+
+    def evict_before(self, purge_before_ts: float) -> None:
+        """Evict states that are older than purge_before_ts.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            for history in self._entities.values():
+                idx = bisect_left(
+                    history.last_updated_ts, purge_before_ts, lo=history.head
+                )
+                if idx > history.head:
+                    self._drop_rows(history, idx)
+                    history.compact()
+
+    def evict_metadata_ids(self, metadata_ids: Iterable[int]) -> None:
+        """Forget all states of metadata_ids that have been purged.
+
+        This call must be called from the recorder thread.
+        """
+        now_ts = time.time()
+        with self._lock:
+            for metadata_id in metadata_ids:
+                if (history := self._entities.get(metadata_id)) is None:
+                    self._evicted_complete_after_ts[metadata_id] = now_ts
+                    continue
+                self._drop_rows(history, len(history.last_updated_ts))
+                history.compact()
+                history.complete_after_ts = now_ts
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call must be called from the recorder thread.
+        """
+        with self._lock:
+            self._pending.clear()
+            self._entities.clear()
+            self._evicted_complete_after_ts.clear()
+            self._num_states = 0
+            self._shared_attrs.clear()
+            self._shared_attrs_refs.clear()
+            self._complete_after_ts = time.time()
+
+    def get_significant_states(
+        self,
+        metadata_ids: list[int],
+        start_time_ts: float,
+        end_time_ts: float | None,
+        metadata_ids_in_significant_domains: list[int],
+        significant_changes_only: bool,
+        no_attributes: bool,
+        include_start_time_state: bool,
+        run_start_ts: float | None,
+    ) -> list[CachedStateRow] | None:
+        """Return the rows the significant states query would return.
+
+        The rows are sorted by metadata_id and last_updated_ts. None is
+        returned if the cache does not hold every state needed to answer
+        the query.
+        """
+        if not self.max_states:
+            return None
+        single_metadata_id = len(metadata_ids) == 1
+        significant_domain_ids = set(metadata_ids_in_significant_domains)
+        shared_attrs = self._shared_attrs
+        rows: list[CachedStateRow] = []
+        with self._lock:
+            for metadata_id in sorted(metadata_ids):
+                if (history := self._entities.get(metadata_id)) is not None:
+                    self._entities.move_to_end(metadata_id)
+                    complete_after_ts = history.complete_after_ts
+                else:
+                    complete_after_ts = self._evicted_complete_after_ts.get(
+                        metadata_id, self._complete_after_ts
+                    )
+                if start_time_ts <= complete_after_ts:
+                    self.misses += 1
+                    return None
+                if history is None or not len(history):
+                    if include_start_time_state and (
+                        single_metadata_id
+                        or run_start_ts is None
+                        or run_start_ts <= complete_after_ts
+                    ):
+                        # The state at the start time is older than
+                        # what we know about
+                        self.misses += 1
+                        return None
+                    continue
+                head = history.head
+                last_updated_ts_column = history.last_updated_ts
+                last_changed_ts_column = history.last_changed_ts
+                states = history.states
+                attributes_ids = history.attributes_ids
+                # Rows before before_idx are older than the start time and
+                # the query returns the rows newer than the start time
+                before_idx = bisect_left(last_updated_ts_column, start_time_ts, lo=head)
+                start_idx = bisect_right(
+                    last_updated_ts_column, start_time_ts, lo=before_idx
+                )
+                end_idx = (
+                    bisect_left(last_updated_ts_column, end_time_ts, lo=start_idx)
+                    if end_time_ts
+                    else len(last_updated_ts_column)
+                )
+                if include_start_time_state:
+                    if before_idx > head:
+                        start_state_idx = before_idx - 1
+                        # When querying multiple entities the database only
+                        # looks for the start state in the current run
+                        if single_metadata_id or (
+                            run_start_ts is not None
+                            and last_updated_ts_column[start_state_idx] >= run_start_ts
+                        ):
+                            rows.append(
+                                CachedStateRow(
+                                    metadata_id,
+                                    states[start_state_idx],
+                                    0,
+                                    None,
+                                    None
+                                    if no_attributes
+                                    else shared_attrs[attributes_ids[start_state_idx]],
+                                )
+                            )
+                    elif (
+                        single_metadata_id
+                        or run_start_ts is None
+                        or run_start_ts <= complete_after_ts
+                    ):
+                        # The state at the start time is older than
+                        # what we know about
+                        self.misses += 1
+                        return None
+                only_significant = (
+                    significant_changes_only
+                    and metadata_id not in significant_domain_ids
+                )
+                for idx in range(start_idx, end_idx):
+                    last_updated_ts = last_updated_ts_column[idx]
+                    last_changed_ts = last_changed_ts_column[idx]
+                    if (
+                        only_significant
+                        and last_changed_ts
+                        and last_changed_ts != last_updated_ts
+                    ):
+                        continue
+                    rows.append(
+                        CachedStateRow(
+                            metadata_id,
+                            states[idx],
+                            last_updated_ts,
+                            None
+                            if significant_changes_only
+                            else (last_changed_ts or None),
+                            None
+                            if no_attributes
+                            else shared_attrs[attributes_ids[idx]],
+                        )
+                    )
+            self.hits += 1
+        return rows
@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from collections.abc import Callable, Iterable, Iterator, MutableMapping
 from datetime import datetime
-from itertools import groupby
+from itertools import chain, groupby, islice
 from operator import itemgetter
 from typing import Any, cast
 
@@ -35,6 +35,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..models.state_attributes import decode_attributes_from_source
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -102,6 +103,7 @@ def get_significant_states(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Wrap get_significant_states_with_session with an sql session."""
     with session_scope(hass=hass, read_only=True) as session:
@@ -117,6 +119,7 @@ def get_significant_states(
             minimal_response,
             no_attributes,
             compressed_state_format,
+            max_points,
         )
 
 
@@ -195,6 +198,7 @@ def get_significant_states_with_session(
     minimal_response: bool = False,
     no_attributes: bool = False,
     compressed_state_format: bool = False,
+    max_points: int | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Return states changes during UTC period start_time - end_time.
 
@@ -206,11 +210,140 @@ def get_significant_states_with_session(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    max_points downsamples the numeric states of each entity to about
+    max_points states, see _downsample_rows.
     """
     if filters is not None:
         raise NotImplementedError("Filters are no longer supported")
     if not entity_ids:
         raise ValueError("entity_ids must be provided")
+    if (
+        query := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            no_attributes,
+            False,
+        )
+    ) is None:
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    return _sorted_states_to_dict(
+        rows,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes=no_attributes,
+        downsample=_downsample_buckets(start_time, end_time, max_points),
+    )
+
+
+def get_significant_states_chunks(
+    hass: HomeAssistant,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    max_states: int,
+    max_points: int | None = None,
+) -> Iterator[MutableMapping[str, list[State | dict[str, Any]]]]:
+    """Yield the significant states during a period in chunks.
+
+    Each chunk holds at most max_states states and the states of an
+    entity can be split over multiple consecutive chunks. Long periods
+    are read from the database with a streaming cursor so the memory used
+    does not depend on the length of the period.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    with session_scope(hass=hass, read_only=True) as session:
+        if (
+            query := _significant_states_rows(
+                hass,
+                session,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                no_attributes,
+                True,
+            )
+        ) is None:
+            return
+        rows, start_time_ts, entity_id_to_metadata_id = query
+        yield from states_lists_to_chunks(
+            _sorted_states_to_lists(
+                rows,
+                start_time_ts,
+                entity_ids,
+                entity_id_to_metadata_id,
+                minimal_response,
+                compressed_state_format,
+                no_attributes,
+                max_states,
+                _downsample_buckets(start_time, end_time, max_points),
+            ),
+            max_states,
+        )
+
+
+def states_lists_to_chunks(
+    states_lists: Iterable[tuple[str, list[State | dict[str, Any]]]],
+    max_states: int,
+) -> Iterator[MutableMapping[str, list[State | dict[str, Any]]]]:
+    """Group lists of states per entity into chunks of max_states states.
+
+    Lists that do not fit in the current chunk are split over the next chunks.
+    """
+    chunk: dict[str, list[State | dict[str, Any]]] = {}
+    room = max_states
+    for entity_id, states in states_lists:
+        while len(states) > room:
+            if room:
+                chunk.setdefault(entity_id, []).extend(states[:room])
+                states = states[room:]
+            yield chunk
+            chunk = {}
+            room = max_states
+        if states:
+            chunk.setdefault(entity_id, []).extend(states)
+            room -= len(states)
+    if chunk:
+        yield chunk
+
+
+def _significant_states_rows(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    no_attributes: bool,
+    stream: bool,
+) -> tuple[Iterable[Row], float | None, dict[str, int | None]] | None:
+    """Return the rows of the significant states during a period.
+
+    The rows are returned with the timestamp of the start time if the states
+    at the start time are included and the metadata_ids of the entity_ids.
+    None is returned if none of the entities has been recorded.
+
+    With stream the rows of long periods are fetched from the database
+    while they are iterated.
+    """
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = recorder.get_instance(hass)
@@ -219,7 +352,7 @@ def get_significant_states_with_session(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        return None
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -235,6 +368,25 @@ def get_significant_states_with_session(
         include_start_time_state = False
     start_time_ts = dt_util.utc_to_timestamp(start_time)
     end_time_ts = datetime_to_timestamp_or_none(end_time)
+    result_start_time_ts = start_time_ts if include_start_time_state else None
+    if (
+        cached_rows := instance.states_history_cache.get_significant_states(
+            metadata_ids,
+            start_time_ts,
+            end_time_ts,
+            metadata_ids_in_significant_domains,
+            significant_changes_only,
+            no_attributes,
+            include_start_time_state,
+            run_start_ts,
+        )
+    ) is not None:
+        # Recent periods can be answered without the database
+        return (
+            cast(list[Row], cached_rows),
+            result_start_time_ts,
+            entity_id_to_metadata_id,
+        )
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
@@ -257,14 +409,16 @@ def get_significant_states_with_session(
             include_start_time_state,
         ],
     )
-    return _sorted_states_to_dict(
-        execute_stmt_lambda_element(session, stmt, None, end_time, orm_rows=False),
-        start_time_ts if include_start_time_state else None,
-        entity_ids,
+    return (
+        execute_stmt_lambda_element(
+            session,
+            stmt,
+            start_time if stream else None,
+            end_time,
+            orm_rows=False,
+        ),
+        result_start_time_ts,
         entity_id_to_metadata_id,
-        minimal_response,
-        compressed_state_format,
-        no_attributes=no_attributes,
     )
 
 
@@ -301,6 +455,60 @@ def get_full_significant_states_with_session(
     )
 
 
+def get_significant_states_columns_with_session(
+    hass: HomeAssistant,
+    session: Session,
+    start_time: datetime,
+    end_time: datetime | None,
+    entity_ids: list[str],
+    significant_changes_only: bool = True,
+) -> dict[str, tuple[list[str | None], list[float], list[dict[str, Any]]]]:
+    """Return the significant states during a period as columns.
+
+    The states, last_updated timestamps and attributes of each entity are
+    returned as parallel lists, without creating State objects. The states
+    at the start time are included with the timestamp of the start time.
+    The attributes are decoded once per distinct attributes of an entity
+    and shared between its rows.
+    """
+    if not entity_ids:
+        raise ValueError("entity_ids must be provided")
+    if (
+        query := _significant_states_rows(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            True,
+            significant_changes_only,
+            False,
+            False,
+        )
+    ) is None:
+        return {}
+    rows, start_time_ts, entity_id_to_metadata_id = query
+    metadata_id_to_entity_id = {
+        v: k for k, v in entity_id_to_metadata_id.items() if v is not None
+    }
+    result: dict[str, tuple[list[str | None], list[float], list[dict[str, Any]]]] = {}
+    for metadata_id, group in groupby(rows, itemgetter(_FIELD_MAP["metadata_id"])):
+        attr_cache: dict[str, dict[str, Any]] = {}
+        states: list[str | None] = []
+        timestamps: list[float] = []
+        attributes: list[dict[str, Any]] = []
+        for row in group:
+            states.append(row.state)
+            timestamps.append(row.last_updated_ts or start_time_ts)  # type: ignore[arg-type]
+            attributes.append(decode_attributes_from_source(row.attributes, attr_cache))
+        result[metadata_id_to_entity_id[metadata_id]] = (
+            states,
+            timestamps,
+            attributes,
+        )
+    return result
+
+
 def _state_changed_during_period_stmt(
     start_time_ts: float,
     end_time_ts: float | None,
@@ -642,6 +850,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    downsample: tuple[float, float] | None = None,
 ) -> MutableMapping[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -654,6 +863,49 @@ def _sorted_states_to_dict(
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
     """
+    # Set all entity IDs to empty lists in result set to maintain the order
+    result: dict[str, list[State | dict[str, Any]]] = {
+        entity_id: [] for entity_id in entity_ids
+    }
+    for entity_id, ent_results in _sorted_states_to_lists(
+        states,
+        start_time_ts,
+        entity_ids,
+        entity_id_to_metadata_id,
+        minimal_response,
+        compressed_state_format,
+        no_attributes,
+        None,
+        downsample,
+    ):
+        result[entity_id] = ent_results
+
+    if descending:
+        for ent_results in result.values():
+            ent_results.reverse()
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _sorted_states_to_lists(
+    states: Iterable[Row],
+    start_time_ts: float | None,
+    entity_ids: list[str],
+    entity_id_to_metadata_id: dict[str, int | None],
+    minimal_response: bool,
+    compressed_state_format: bool,
+    no_attributes: bool,
+    max_states: int | None,
+    downsample: tuple[float, float] | None,
+) -> Iterator[tuple[str, list[State | dict[str, Any]]]]:
+    """Convert SQL results into lists of JSON friendly states per entity.
+
+    States must be sorted by entity_id and last_updated. Entities without
+    states are skipped and the states of an entity are split into lists
+    of at most max_states states. The rows are downsampled before they
+    are converted when downsample holds the start and width of the buckets.
+    """
     field_map = _FIELD_MAP
     state_class: Callable[
         [Row, dict[str, dict[str, Any]], float | None, str, str, float | None, bool],
@@ -668,10 +920,6 @@ def _sorted_states_to_dict(
         attr_time = LAST_CHANGED_KEY
         attr_state = STATE_KEY
 
-    # Set all entity IDs to empty lists in result set to maintain the order
-    result: dict[str, list[State | dict[str, Any]]] = {
-        entity_id: [] for entity_id in entity_ids
-    }
     metadata_id_to_entity_id: dict[int, str] = {}
     metadata_id_to_entity_id = {
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
@@ -694,12 +942,14 @@ def _sorted_states_to_dict(
     for metadata_id, group in states_iter:
         entity_id = metadata_id_to_entity_id[metadata_id]
         attr_cache: dict[str, dict[str, Any]] = {}
-        ent_results = result[entity_id]
+        ent_states: Iterator[State | dict[str, Any]]
+        if downsample is not None:
+            group = _downsample_rows(group, *downsample)
         if (
             not minimal_response
             or split_entity_id(entity_id)[0] in NEED_ATTRIBUTE_DOMAINS
         ):
-            ent_results.extend(
+            ent_states = (
                 state_class(
                     db_state,
                     attr_cache,
@@ -711,62 +961,142 @@ def _sorted_states_to_dict(
                 )
                 for db_state in group
             )
-            continue
-
-        prev_state: str | None = None
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
+        else:
+            # With minimal response we only provide a native
+            # State for the first and last response. All the states
+            # in-between only provide the "state" and the
+            # "last_changed".
             if (first_state := next(group, None)) is None:
                 continue
-            prev_state = first_state[state_idx]
-            ent_results.append(
-                state_class(
-                    first_state,
-                    attr_cache,
-                    start_time_ts,
-                    entity_id,
-                    prev_state,  # type: ignore[arg-type]
-                    first_state[last_updated_ts_idx],
-                    no_attributes,
-                )
+            prev_state: str | None = first_state[state_idx]
+            first_ent_state = state_class(
+                first_state,
+                attr_cache,
+                start_time_ts,
+                entity_id,
+                prev_state,  # type: ignore[arg-type]
+                first_state[last_updated_ts_idx],
+                no_attributes,
             )
 
-        #
-        # minimal_response only makes sense with last_updated == last_updated
-        #
-        # We use last_updated for for last_changed since its the same
-        #
-        # With minimal response we do not care about attribute
-        # changes so we can filter out duplicate states
-        if compressed_state_format:
-            # Compressed state format uses the timestamp directly
-            ent_results.extend(
-                {
-                    attr_state: (prev_state := state),
-                    attr_time: row[last_updated_ts_idx],
-                }
-                for row in group
-                if (state := row[state_idx]) != prev_state
-            )
+            #
+            # minimal_response only makes sense with last_updated == last_updated
+            #
+            # We use last_updated for for last_changed since its the same
+            #
+            # With minimal response we do not care about attribute
+            # changes so we can filter out duplicate states
+            if compressed_state_format:
+                # Compressed state format uses the timestamp directly
+                ent_states = chain(
+                    (first_ent_state,),
+                    (
+                        {
+                            attr_state: (prev_state := state),
+                            attr_time: row[last_updated_ts_idx],
+                        }
+                        for row in group
+                        if (state := row[state_idx]) != prev_state
+                    ),
+                )
+            else:
+                # Non-compressed state format returns an ISO formatted string
+                _utc_from_timestamp = dt_util.utc_from_timestamp
+                ent_states = chain(
+                    (first_ent_state,),
+                    (
+                        {
+                            attr_state: (prev_state := state),  # noqa: F841
+                            attr_time: _utc_from_timestamp(
+                                row[last_updated_ts_idx]
+                            ).isoformat(),
+                        }
+                        for row in group
+                        if (state := row[state_idx]) != prev_state
+                    ),
+                )
+
+        if max_states is None:
+            if ent_results := list(ent_states):
+                yield entity_id, ent_results
             continue
+        while ent_results := list(islice(ent_states, max_states)):
+            yield entity_id, ent_results
+
 
-        # Non-compressed state format returns an ISO formatted string
-        _utc_from_timestamp = dt_util.utc_from_timestamp
-        ent_results.extend(
-            {
-                attr_state: (prev_state := state),  # noqa: F841
-                attr_time: _utc_from_timestamp(row[last_updated_ts_idx]).isoformat(),
-            }
-            for row in group
-            if (state := row[state_idx]) != prev_state
+def _downsample_buckets(
+    start_time: datetime, end_time: datetime | None, max_points: int | None
+) -> tuple[float, float] | None:
+    """Return the start and width of the buckets to downsample a period with."""
+    if max_points is None:
+        return None
+    start_time_ts = start_time.timestamp()
+    end_time_ts = (end_time or dt_util.utcnow()).timestamp()
+    # Each bucket keeps its minimum and maximum
+    return start_time_ts, max(end_time_ts - start_time_ts, 1) / max(max_points // 2, 1)
+
+
+def _downsample_rows(
+    rows: Iterator[Row], start_time_ts: float, bucket_width: float
+) -> Iterator[Row]:
+    """Downsample the sorted rows of an entity with min/max buckets.
+
+    The period is split into buckets of bucket_width seconds and only the
+    rows with the minimum and maximum numeric state of each bucket are kept.
+    The first and last row and rows with a non-numeric state, such as
+    unavailable, are always kept so gaps and the current state are not lost.
+    """
+    state_idx = _FIELD_MAP["state"]
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    if (first_row := next(rows, None)) is None:
+        return
+    yield first_row
+    last_row = first_row
+    yielded_last = True
+    bucket = -1
+    min_row = max_row = first_row
+    min_pos = max_pos = 0
+    min_value = max_value = 0.0
+    for pos, row in enumerate(rows, 1):
+        last_row = row
+        try:
+            value = float(row[state_idx])
+        except (TypeError, ValueError):
+            if bucket != -1:
+                yield from _bucket_rows(min_row, min_pos, max_row, max_pos)
+                bucket = -1
+            yield row
+            yielded_last = True
+            continue
+        yielded_last = False
+        row_bucket = int(
+            ((row[last_updated_ts_idx] or start_time_ts) - start_time_ts)
+            // bucket_width
         )
+        if row_bucket != bucket:
+            if bucket != -1:
+                yield from _bucket_rows(min_row, min_pos, max_row, max_pos)
+            bucket = row_bucket
+            min_row = max_row = row
+            min_pos = max_pos = pos
+            min_value = max_value = value
+        elif value < min_value:
+            min_row, min_pos, min_value = row, pos, value
+        elif value > max_value:
+            max_row, max_pos, max_value = row, pos, value
+    if bucket != -1:
+        yield from _bucket_rows(min_row, min_pos, max_row, max_pos)
+        yielded_last = last_row is min_row or last_row is max_row
+    if not yielded_last:
+        yield last_row
 
-    if descending:
-        for ent_results in result.values():
-            ent_results.reverse()
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+def _bucket_rows(
+    min_row: Row, min_pos: int, max_row: Row, max_pos: int
+) -> tuple[Row, ...]:
+    """Return the rows kept for a bucket in the order they were recorded."""
+    if min_pos == max_pos:
+        return (min_row,)
+    if min_pos < max_pos:
+        return (min_row, max_row)
+    return (max_row, min_row)
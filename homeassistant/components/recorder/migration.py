@@ -1061,6 +1061,13 @@ def _apply_update(  # noqa: C901
         _migrate_statistics_columns_to_timestamp_removing_duplicates(
             hass, instance, session_maker, engine
         )
+    elif new_version == 43:
+        # The existing rows are counted by the purge when
+        # the first state or event using them is purged
+        _add_columns(session_maker, "state_attributes", ["refcount INTEGER"])
+        _create_index(session_maker, "state_attributes", "ix_state_attributes_refcount")
+        _add_columns(session_maker, "event_data", ["refcount INTEGER"])
+        _create_index(session_maker, "event_data", "ix_event_data_refcount")
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
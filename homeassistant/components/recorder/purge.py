@@ -1,45 +1,67 @@
 """Purge old data helper."""
 from __future__ import annotations
 
-from collections.abc import Callable
-from datetime import datetime
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from sqlalchemy.engine.row import Row
 from sqlalchemy.orm.session import Session
 
+import homeassistant.util.dt as dt_util
+
 from .db_schema import Events, States, StatesMeta
 from .models import DatabaseEngine
 from .queries import (
     attributes_ids_exist_in_states,
     attributes_ids_exist_in_states_with_fast_in_distinct,
+    count_attributes_refs,
+    count_event_data_refs,
     data_ids_exist_in_events,
     data_ids_exist_in_events_with_fast_in_distinct,
     delete_event_data_rows,
     delete_event_rows,
+    delete_event_rows_in_range,
     delete_event_types_rows,
     delete_recorder_runs_rows,
     delete_states_attributes_rows,
     delete_states_meta_rows,
     delete_states_rows,
+    delete_states_rows_in_range,
     delete_statistics_runs_rows,
     delete_statistics_short_term_rows,
     disconnect_states_rows,
+    disconnect_states_rows_in_range,
+    find_attributes_refs_in_states,
+    find_attributes_refs_in_states_range,
+    find_data_refs_in_events,
+    find_data_refs_in_events_range,
     find_entity_ids_to_purge,
     find_event_types_to_purge,
+    find_events_partition_end_id,
     find_events_to_purge,
     find_latest_statistics_runs_run_id,
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_max_event_id,
+    find_max_state_id,
+    find_next_event_id,
+    find_next_state_id,
     find_short_term_statistics_to_purge,
+    find_states_partition_end_id,
     find_states_to_purge,
     find_statistics_runs_to_purge,
+    find_uncounted_attributes_ids,
+    find_uncounted_data_ids,
+    find_unreferenced_attributes_ids,
+    find_unreferenced_data_ids,
 )
 from .repack import repack_database
-from .util import chunked_or_all, retryable_database_job, session_scope
+from .util import chunked, chunked_or_all, retryable_database_job, session_scope
 
 if TYPE_CHECKING:
     from . import Recorder
@@ -50,6 +72,9 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# Partitions are aligned to Monday 1970-01-05 UTC so weeks start on Monday
+_PARTITION_EPOCH_TS = 4 * 86400
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -63,11 +88,18 @@ def purge_old_data(
     """Purge events and states older than purge_before.
 
     Cleans up an timeframe of an hour, based on the oldest record.
+
+    When the recorder has a purge partition, purge_before is moved back to
+    the start of its partition so states and events are purged in whole
+    partitions.
     """
+    if instance.purge_partition is not None:
+        purge_before = _partition_start(purge_before, instance.purge_partition)
     _LOGGER.debug(
         "Purging states and events before target %s",
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
+    instance.states_history_cache.evict_before(purge_before.timestamp())
     with session_scope(session=instance.get_session()) as session:
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
@@ -83,12 +115,22 @@ def purge_old_data(
                 " remaining"
             )
             # Once we are done purging legacy rows, we use the new method
-            has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
-            )
-            has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
-            )
+            if instance.purge_partition is not None:
+                has_more_to_purge |= _purge_states_partitions(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_partitions(
+                    instance, session, events_batch_size, purge_before
+                )
+            if not has_more_to_purge:
+                # With partitions this only finds the rows that were
+                # recorded out of order and are outside of their partition
+                has_more_to_purge |= _purge_states_and_attributes_ids(
+                    instance, session, states_batch_size, purge_before
+                )
+                has_more_to_purge |= _purge_events_and_data_ids(
+                    instance, session, events_batch_size, purge_before
+                )
 
         statistics_runs = _select_statistics_runs_to_purge(
             session, purge_before, instance.max_bind_vars
@@ -125,6 +167,14 @@ def purge_old_data(
     return True
 
 
+def _partition_start(when: datetime, partition: timedelta) -> datetime:
+    """Return the start of the partition when falls in."""
+    when_ts = when.timestamp()
+    return dt_util.utc_from_timestamp(
+        when_ts - (when_ts - _PARTITION_EPOCH_TS) % partition.total_seconds()
+    )
+
+
 def _purging_legacy_format(session: Session) -> bool:
     """Check if there are any legacy event_id linked states rows remaining."""
     return bool(session.execute(find_legacy_row()).scalar())
@@ -144,7 +194,7 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, state_ids)
     _purge_unused_attributes_ids(instance, session, attributes_ids)
-    _purge_event_ids(session, event_ids)
+    _purge_event_ids(instance, session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
 
     # The database may still have some rows that have an event_id but are not
@@ -180,8 +230,6 @@ def _purge_states_and_attributes_ids(
 
     Returns true if there are more states to purge.
     """
-    database_engine = instance.database_engine
-    assert database_engine is not None
     has_remaining_state_ids_to_purge = True
     # There are more states relative to attributes_ids so
     # we purge enough state_ids to try to generate a full
@@ -207,6 +255,118 @@ def _purge_states_and_attributes_ids(
     return has_remaining_state_ids_to_purge
 
 
+def _purge_states_partitions(
+    instance: Recorder,
+    session: Session,
+    states_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge the states of the partitions before purge_before by state_id range.
+
+    States are recorded in time order so the partitions before purge_before
+    are the states before the first state recorded after purge_before. They
+    are deleted in ranges of max_bind_vars state_ids by primary key instead
+    of selecting the state_ids first. States in the range that are newer than
+    purge_before, which only happens if the clock went backwards, are kept
+    but states may lose the link to them as their old state.
+
+    Returns true if there are more states to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    end_state_id = session.execute(
+        find_states_partition_end_id(purge_before_ts)
+    ).scalar()
+    if end_state_id is None:
+        end_state_id = (session.execute(find_max_state_id()).scalar() or 0) + 1
+    has_remaining_state_ids_to_purge = True
+    attributes_ids_batch: set[int] = set()
+    max_bind_vars = instance.max_bind_vars
+    next_state_id = 0
+    for _ in range(states_batch_size):
+        start_state_id = session.execute(find_next_state_id(next_state_id)).scalar()
+        if start_state_id is None or start_state_id >= end_state_id:
+            has_remaining_state_ids_to_purge = False
+            break
+        next_state_id = min(start_state_id + max_bind_vars, end_state_id)
+        attributes_refs = _released_refs(
+            session.execute(
+                find_attributes_refs_in_states_range(
+                    start_state_id, next_state_id, purge_before_ts
+                )
+            )
+        )
+        instance.state_attributes_manager.update_refcounts(session, attributes_refs)
+        attributes_ids_batch.update(attributes_refs)
+        disconnected_rows = session.execute(
+            disconnect_states_rows_in_range(start_state_id, next_state_id)
+        )
+        _LOGGER.debug("Updated %s states to remove old_state_id", disconnected_rows)
+        deleted_rows = session.execute(
+            delete_states_rows_in_range(start_state_id, next_state_id, purge_before_ts)
+        )
+        _LOGGER.debug("Deleted %s states", deleted_rows)
+        instance.states_manager.evict_purged_state_id_range(
+            start_state_id, next_state_id
+        )
+
+    _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
+    _LOGGER.debug(
+        "After purging states partitions remaining=%s",
+        has_remaining_state_ids_to_purge,
+    )
+    return has_remaining_state_ids_to_purge
+
+
+def _purge_events_partitions(
+    instance: Recorder,
+    session: Session,
+    events_batch_size: int,
+    purge_before: datetime,
+) -> bool:
+    """Purge the events of the partitions before purge_before by event_id range.
+
+    See _purge_states_partitions for how the ranges are found.
+
+    Returns true if there are more events to purge.
+    """
+    purge_before_ts = purge_before.timestamp()
+    end_event_id = session.execute(
+        find_events_partition_end_id(purge_before_ts)
+    ).scalar()
+    if end_event_id is None:
+        end_event_id = (session.execute(find_max_event_id()).scalar() or 0) + 1
+    has_remaining_event_ids_to_purge = True
+    data_ids_batch: set[int] = set()
+    max_bind_vars = instance.max_bind_vars
+    next_event_id = 0
+    for _ in range(events_batch_size):
+        start_event_id = session.execute(find_next_event_id(next_event_id)).scalar()
+        if start_event_id is None or start_event_id >= end_event_id:
+            has_remaining_event_ids_to_purge = False
+            break
+        next_event_id = min(start_event_id + max_bind_vars, end_event_id)
+        data_refs = _released_refs(
+            session.execute(
+                find_data_refs_in_events_range(
+                    start_event_id, next_event_id, purge_before_ts
+                )
+            )
+        )
+        instance.event_data_manager.update_refcounts(session, data_refs)
+        data_ids_batch.update(data_refs)
+        deleted_rows = session.execute(
+            delete_event_rows_in_range(start_event_id, next_event_id, purge_before_ts)
+        )
+        _LOGGER.debug("Deleted %s events", deleted_rows)
+
+    _purge_unused_data_ids(instance, session, data_ids_batch)
+    _LOGGER.debug(
+        "After purging events partitions remaining=%s",
+        has_remaining_event_ids_to_purge,
+    )
+    return has_remaining_event_ids_to_purge
+
+
 def _purge_events_and_data_ids(
     instance: Recorder,
     session: Session,
@@ -231,7 +391,7 @@ def _purge_events_and_data_ids(
         if not event_ids:
             has_remaining_event_ids_to_purge = False
             break
-        _purge_event_ids(session, event_ids)
+        _purge_event_ids(instance, session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
@@ -358,20 +518,6 @@ def _select_unused_attributes_ids(
     return to_remove
 
 
-def _purge_unused_attributes_ids(
-    instance: Recorder,
-    session: Session,
-    attributes_ids_batch: set[int],
-) -> None:
-    """Purge unused attributes ids."""
-    database_engine = instance.database_engine
-    assert database_engine is not None
-    if unused_attribute_ids_set := _select_unused_attributes_ids(
-        instance, session, attributes_ids_batch, database_engine
-    ):
-        _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
-
-
 def _select_unused_event_data_ids(
     instance: Recorder,
     session: Session,
@@ -408,15 +554,81 @@ def _select_unused_event_data_ids(
     return to_remove
 
 
+def _released_refs(rows: Iterable[Row[tuple[Any, int]]]) -> dict[int, int]:
+    """Return the refcount changes to release the references counted in rows."""
+    return {id_: -refs for id_, refs in rows if id_ is not None}
+
+
+def _purge_unused_attributes_ids(
+    instance: Recorder,
+    session: Session,
+    attributes_ids_batch: set[int],
+) -> None:
+    """Purge unused attributes ids.
+
+    Attributes recorded before refcounts were added have not been counted
+    yet, they are counted when the first state using them is purged. All
+    attributes with a refcount of zero are then purged.
+    """
+    if not instance.state_attributes_manager.refcounts_active:
+        database_engine = instance.database_engine
+        assert database_engine is not None
+        if unused_attribute_ids_set := _select_unused_attributes_ids(
+            instance, session, attributes_ids_batch, database_engine
+        ):
+            _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
+        return
+    max_bind_vars = instance.max_bind_vars
+    for attributes_ids_chunk in chunked_or_all(attributes_ids_batch, max_bind_vars):
+        if uncounted_attributes_ids := [
+            attributes_id
+            for (attributes_id,) in session.execute(
+                find_uncounted_attributes_ids(attributes_ids_chunk)
+            )
+        ]:
+            session.execute(count_attributes_refs(uncounted_attributes_ids))
+            _LOGGER.debug("Counted %s shared attributes", len(uncounted_attributes_ids))
+    while unused_attributes_ids := {
+        attributes_id
+        for (attributes_id,) in session.execute(
+            find_unreferenced_attributes_ids(max_bind_vars)
+        )
+    }:
+        _LOGGER.debug(
+            "Selected %s shared attributes to remove", len(unused_attributes_ids)
+        )
+        _purge_batch_attributes_ids(instance, session, unused_attributes_ids)
+
+
 def _purge_unused_data_ids(
     instance: Recorder, session: Session, data_ids_batch: set[int]
 ) -> None:
-    database_engine = instance.database_engine
-    assert database_engine is not None
-    if unused_data_ids_set := _select_unused_event_data_ids(
-        instance, session, data_ids_batch, database_engine
-    ):
-        _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    """Purge unused event data ids.
+
+    See _purge_unused_attributes_ids for how event data is counted.
+    """
+    if not instance.event_data_manager.refcounts_active:
+        database_engine = instance.database_engine
+        assert database_engine is not None
+        if unused_data_ids_set := _select_unused_event_data_ids(
+            instance, session, data_ids_batch, database_engine
+        ):
+            _purge_batch_data_ids(instance, session, unused_data_ids_set)
+        return
+    max_bind_vars = instance.max_bind_vars
+    for data_ids_chunk in chunked_or_all(data_ids_batch, max_bind_vars):
+        if uncounted_data_ids := [
+            data_id
+            for (data_id,) in session.execute(find_uncounted_data_ids(data_ids_chunk))
+        ]:
+            session.execute(count_event_data_refs(uncounted_data_ids))
+            _LOGGER.debug("Counted %s shared event data", len(uncounted_data_ids))
+    while unused_data_ids := {
+        data_id
+        for (data_id,) in session.execute(find_unreferenced_data_ids(max_bind_vars))
+    }:
+        _LOGGER.debug("Selected %s shared event data to remove", len(unused_data_ids))
+        _purge_batch_data_ids(instance, session, unused_data_ids)
 
 
 def _select_statistics_runs_to_purge(
@@ -511,6 +723,17 @@ def _purge_state_ids(instance: Recorder, session: Session, state_ids: set[int])
     if not state_ids:
         return
 
+    # Release the attributes used by the states
+    state_attributes_manager = instance.state_attributes_manager
+    if state_attributes_manager.refcounts_active:
+        for state_ids_chunk in chunked(state_ids, instance.max_bind_vars):
+            state_attributes_manager.update_refcounts(
+                session,
+                _released_refs(
+                    session.execute(find_attributes_refs_in_states(state_ids_chunk))
+                ),
+            )
+
     # Update old_state_id to NULL before deleting to ensure
     # the delete does not fail due to a foreign key constraint
     # since some databases (MSSQL) cannot do the ON DELETE SET NULL
@@ -567,10 +790,20 @@ def _purge_short_term_statistics(
     _LOGGER.debug("Deleted %s short term statistics", deleted_rows)
 
 
-def _purge_event_ids(session: Session, event_ids: set[int]) -> None:
+def _purge_event_ids(instance: Recorder, session: Session, event_ids: set[int]) -> None:
     """Delete by event id."""
     if not event_ids:
         return
+    # Release the event data used by the events
+    event_data_manager = instance.event_data_manager
+    if event_data_manager.refcounts_active:
+        for event_ids_chunk in chunked(event_ids, instance.max_bind_vars):
+            event_data_manager.update_refcounts(
+                session,
+                _released_refs(
+                    session.execute(find_data_refs_in_events(event_ids_chunk))
+                ),
+            )
     deleted_rows = session.execute(delete_event_rows(event_ids))
     _LOGGER.debug("Deleted %s events", deleted_rows)
 
@@ -625,19 +858,18 @@ def _purge_old_entity_ids(instance: Recorder, session: Session) -> None:
     # Evict any entries in the event_type cache referring to a purged state
     instance.states_meta_manager.evict_purged(purge_entity_ids)
     instance.states_manager.evict_purged_entity_ids(purge_entity_ids)
+    instance.states_history_cache.evict_metadata_ids(states_metadata_ids)
 
 
 def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     """Remove filtered states and events that shouldn't be in the database."""
     _LOGGER.debug("Cleanup filtered data")
-    database_engine = instance.database_engine
-    assert database_engine is not None
     now_timestamp = time.time()
 
     # Check if excluded entity_ids are in database
     entity_filter = instance.entity_filter
     has_more_states_to_purge = False
-    excluded_metadata_ids: list[str] = [
+    excluded_metadata_ids: list[int] = [
         metadata_id
         for (metadata_id, entity_id) in session.query(
             StatesMeta.metadata_id, StatesMeta.entity_id
@@ -646,7 +878,7 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
     ]
     if excluded_metadata_ids:
         has_more_states_to_purge = _purge_filtered_states(
-            instance, session, excluded_metadata_ids, database_engine, now_timestamp
+            instance, session, excluded_metadata_ids, now_timestamp
         )
 
     # Check if excluded event_types are in database
@@ -673,14 +905,16 @@ def _purge_filtered_data(instance: Recorder, session: Session) -> bool:
 def _purge_filtered_states(
     instance: Recorder,
     session: Session,
-    metadata_ids_to_purge: list[str],
-    database_engine: DatabaseEngine,
+    metadata_ids_to_purge: list[int],
     purge_before_timestamp: float,
 ) -> bool:
     """Remove filtered states and linked events.
 
     Return true if all states are purged
     """
+    # The history cache can no longer know which states of
+    # these entities are still in the database
+    instance.states_history_cache.evict_metadata_ids(metadata_ids_to_purge)
     state_ids: tuple[int, ...]
     attributes_ids: tuple[int, ...]
     event_ids: tuple[int, ...]
@@ -702,14 +936,10 @@ def _purge_filtered_states(
     # These are legacy events that are linked to a state that are no longer
     # created but since we did not remove them when we stopped adding new ones
     # we will need to purge them here.
-    _purge_event_ids(session, filtered_event_ids)
-    unused_attribute_ids_set = _select_unused_attributes_ids(
-        instance,
-        session,
-        {id_ for id_ in attributes_ids if id_ is not None},
-        database_engine,
+    _purge_event_ids(instance, session, filtered_event_ids)
+    _purge_unused_attributes_ids(
+        instance, session, {id_ for id_ in attributes_ids if id_ is not None}
     )
-    _purge_batch_attributes_ids(instance, session, unused_attribute_ids_set)
     return False
 
 
@@ -723,8 +953,6 @@ def _purge_filtered_events(
 
     Return true if all events are purged.
     """
-    database_engine = instance.database_engine
-    assert database_engine is not None
     to_purge = list(
         session.query(Events.event_id, Events.data_id)
         .filter(Events.event_type_id.in_(excluded_event_type_ids))
@@ -752,11 +980,10 @@ def _purge_filtered_events(
         # created but since we did not remove them when we stopped adding new ones
         # we will need to purge them here.
         _purge_state_ids(instance, session, state_ids)
-    _purge_event_ids(session, event_ids_set)
-    if unused_data_ids_set := _select_unused_event_data_ids(
-        instance, session, set(data_ids), database_engine
-    ):
-        _purge_batch_data_ids(instance, session, unused_data_ids_set)
+    _purge_event_ids(instance, session, event_ids_set)
+    _purge_unused_data_ids(
+        instance, session, {id_ for id_ in data_ids if id_ is not None}
+    )
     return False
 
 
@@ -765,11 +992,9 @@ def purge_entity_data(
     instance: Recorder, entity_filter: Callable[[str], bool], purge_before: datetime
 ) -> bool:
     """Purge states and events of specified entities."""
-    database_engine = instance.database_engine
-    assert database_engine is not None
     purge_before_timestamp = purge_before.timestamp()
     with session_scope(session=instance.get_session()) as session:
-        selected_metadata_ids: list[str] = [
+        selected_metadata_ids: list[int] = [
             metadata_id
             for (metadata_id, entity_id) in session.query(
                 StatesMeta.metadata_id, StatesMeta.entity_id
@@ -786,7 +1011,6 @@ def purge_entity_data(
             instance,
             session,
             selected_metadata_ids,
-            database_engine,
             purge_before_timestamp,
         ):
             _LOGGER.debug("Purging entity data hasn't fully completed yet")
@@ -634,6 +634,223 @@ def find_states_to_purge(
     )
 
 
+def find_states_partition_end_id(partition_end: float) -> StatementLambdaElement:
+    """Find the first state_id recorded at or after partition_end."""
+    return lambda_stmt(
+        lambda: select(States.state_id)
+        .filter(States.last_updated_ts >= partition_end)
+        .order_by(States.last_updated_ts)
+        .limit(1)
+    )
+
+
+def find_max_state_id() -> StatementLambdaElement:
+    """Find the newest state_id."""
+    return lambda_stmt(lambda: select(func.max(States.state_id)))
+
+
+def find_next_state_id(state_id: int) -> StatementLambdaElement:
+    """Find the first state_id at or after state_id."""
+    return lambda_stmt(
+        lambda: select(func.min(States.state_id)).filter(States.state_id >= state_id)
+    )
+
+
+def find_attributes_refs_in_states_range(
+    start_state_id: int, end_state_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find how often the states in a range older than purge_before use attributes."""
+    return lambda_stmt(
+        lambda: select(States.attributes_id, func.count(States.state_id))
+        .filter(States.state_id >= start_state_id)
+        .filter(States.state_id < end_state_id)
+        .filter(States.last_updated_ts < purge_before)
+        .group_by(States.attributes_id)
+    )
+
+
+def disconnect_states_rows_in_range(
+    start_state_id: int, end_state_id: int
+) -> StatementLambdaElement:
+    """Disconnect states rows from a range of old states."""
+    return lambda_stmt(
+        lambda: update(States)
+        .where(States.old_state_id >= start_state_id)
+        .where(States.old_state_id < end_state_id)
+        .values(old_state_id=None)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def delete_states_rows_in_range(
+    start_state_id: int, end_state_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Delete the states rows in a range that are older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(States)
+        .where(States.state_id >= start_state_id)
+        .where(States.state_id < end_state_id)
+        .where(States.last_updated_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_events_partition_end_id(partition_end: float) -> StatementLambdaElement:
+    """Find the first event_id fired at or after partition_end."""
+    return lambda_stmt(
+        lambda: select(Events.event_id)
+        .filter(Events.time_fired_ts >= partition_end)
+        .order_by(Events.time_fired_ts)
+        .limit(1)
+    )
+
+
+def find_max_event_id() -> StatementLambdaElement:
+    """Find the newest event_id."""
+    return lambda_stmt(lambda: select(func.max(Events.event_id)))
+
+
+def find_next_event_id(event_id: int) -> StatementLambdaElement:
+    """Find the first event_id at or after event_id."""
+    return lambda_stmt(
+        lambda: select(func.min(Events.event_id)).filter(Events.event_id >= event_id)
+    )
+
+
+def find_data_refs_in_events_range(
+    start_event_id: int, end_event_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Find how often the events in a range older than purge_before use data."""
+    return lambda_stmt(
+        lambda: select(Events.data_id, func.count(Events.event_id))
+        .filter(Events.event_id >= start_event_id)
+        .filter(Events.event_id < end_event_id)
+        .filter(Events.time_fired_ts < purge_before)
+        .group_by(Events.data_id)
+    )
+
+
+def delete_event_rows_in_range(
+    start_event_id: int, end_event_id: int, purge_before: float
+) -> StatementLambdaElement:
+    """Delete the events rows in a range that are older than purge_before."""
+    return lambda_stmt(
+        lambda: delete(Events)
+        .where(Events.event_id >= start_event_id)
+        .where(Events.event_id < end_event_id)
+        .where(Events.time_fired_ts < purge_before)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_attributes_refs_in_states(state_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find how often states use attributes."""
+    return lambda_stmt(
+        lambda: select(States.attributes_id, func.count(States.state_id))
+        .filter(States.state_id.in_(state_ids))
+        .group_by(States.attributes_id)
+    )
+
+
+def find_data_refs_in_events(event_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find how often events use event data."""
+    return lambda_stmt(
+        lambda: select(Events.data_id, func.count(Events.event_id))
+        .filter(Events.event_id.in_(event_ids))
+        .group_by(Events.data_id)
+    )
+
+
+def update_attributes_refcounts(
+    attributes_ids: Iterable[int], refs: int
+) -> StatementLambdaElement:
+    """Add refs to the refcount of state attributes."""
+    return lambda_stmt(
+        lambda: update(StateAttributes)
+        .where(StateAttributes.attributes_id.in_(attributes_ids))
+        .values(refcount=StateAttributes.refcount + refs)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def update_event_data_refcounts(
+    data_ids: Iterable[int], refs: int
+) -> StatementLambdaElement:
+    """Add refs to the refcount of event data."""
+    return lambda_stmt(
+        lambda: update(EventData)
+        .where(EventData.data_id.in_(data_ids))
+        .values(refcount=EventData.refcount + refs)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_uncounted_attributes_ids(
+    attributes_ids: Iterable[int],
+) -> StatementLambdaElement:
+    """Find state attributes that have not been counted yet."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .filter(StateAttributes.attributes_id.in_(attributes_ids))
+        .filter(StateAttributes.refcount.is_(None))
+    )
+
+
+def find_uncounted_data_ids(data_ids: Iterable[int]) -> StatementLambdaElement:
+    """Find event data that have not been counted yet."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .filter(EventData.data_id.in_(data_ids))
+        .filter(EventData.refcount.is_(None))
+    )
+
+
+def count_attributes_refs(attributes_ids: Iterable[int]) -> StatementLambdaElement:
+    """Set the refcount of state attributes to the number of states using them."""
+    return lambda_stmt(
+        lambda: update(StateAttributes)
+        .where(StateAttributes.attributes_id.in_(attributes_ids))
+        .values(
+            refcount=select(func.count(States.state_id))
+            .where(States.attributes_id == StateAttributes.attributes_id)
+            .scalar_subquery()
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def count_event_data_refs(data_ids: Iterable[int]) -> StatementLambdaElement:
+    """Set the refcount of event data to the number of events using them."""
+    return lambda_stmt(
+        lambda: update(EventData)
+        .where(EventData.data_id.in_(data_ids))
+        .values(
+            refcount=select(func.count(Events.event_id))
+            .where(Events.data_id == EventData.data_id)
+            .scalar_subquery()
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def find_unreferenced_attributes_ids(max_bind_vars: int) -> StatementLambdaElement:
+    """Find state attributes that are no longer used by any state."""
+    return lambda_stmt(
+        lambda: select(StateAttributes.attributes_id)
+        .filter(StateAttributes.refcount == 0)
+        .limit(max_bind_vars)
+    )
+
+
+def find_unreferenced_data_ids(max_bind_vars: int) -> StatementLambdaElement:
+    """Find event data that are no longer used by any event."""
+    return lambda_stmt(
+        lambda: select(EventData.data_id)
+        .filter(EventData.refcount == 0)
+        .limit(max_bind_vars)
+    )
+
+
 def find_short_term_statistics_to_purge(
     purge_before: datetime, max_bind_vars: int
 ) -> StatementLambdaElement:
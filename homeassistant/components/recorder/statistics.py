@@ -766,7 +766,7 @@ async def async_list_statistic_ids(
             result = _statistic_by_id_from_metadata(hass, metadata)
             return _flatten_list_statistic_ids_metadata_result(result)
 
-    return await instance.async_add_executor_job(
+    return await instance.async_add_read_executor_job(
         list_statistic_ids,
         hass,
         statistic_ids,
@@ -62,6 +62,11 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
     database_name = urlparse(instance.db_url).path.lstrip("/")
     db_engine_info = _async_get_db_engine_info(instance)
     db_stats: dict[str, Any] = {}
+    history_cache = instance.states_history_cache
+    history_cache_info = {
+        "history_cache_hits": history_cache.hits,
+        "history_cache_misses": history_cache.misses,
+    }
 
     if instance.async_db_ready.done():
         db_stats = await instance.async_add_executor_job(
@@ -71,4 +76,4 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
-    return db_runs | db_stats | db_engine_info
+    return db_runs | db_stats | db_engine_info | history_cache_info
@@ -1,8 +1,14 @@
 """Managers for each table."""
 
+from collections import defaultdict
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from lru import LRU
+from sqlalchemy.orm.session import Session
+from sqlalchemy.sql.lambdas import StatementLambdaElement
+
+from ..util import chunked
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -73,3 +79,79 @@ class BaseLRUTableManager(BaseTableManager[_DataT]):
         lru = self._id_map
         if new_size > lru.get_size():
             lru.set_size(new_size)
+
+
+class BaseRefCountedLRUTableManager(BaseLRUTableManager[_DataT]):
+    """Base class for LRU table managers of rows shared by refcount."""
+
+    def __init__(
+        self,
+        recorder: "Recorder",
+        lru_size: int,
+        update_refcounts_stmt: Callable[[Iterable[int], int], StatementLambdaElement],
+    ) -> None:
+        """Initialize the refcounted LRU table manager.
+
+        References added to existing rows are counted in memory and
+        written to the database with the next commit. The statement
+        returned by update_refcounts_stmt adds refs to the refcount of ids.
+        """
+        super().__init__(recorder, lru_size)
+        self._update_refcounts_stmt = update_refcounts_stmt
+        # Only counted once the refcount columns have been added
+        self.refcounts_active = False
+        self._pending_refs: dict[int, int] = {}
+
+    def add_ref(self, id_: int) -> None:
+        """Add a reference to an existing row.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self.refcounts_active:
+            self._pending_refs[id_] = self._pending_refs.get(id_, 0) + 1
+
+    def update_pending_refcounts(self, session: Session) -> None:
+        """Write the pending references to the database before commit.
+
+        The references are kept until the commit succeeds so they are
+        written again when the commit is retried.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if self._pending_refs:
+            self.update_refcounts(session, self._pending_refs)
+
+    def post_commit_pending(self) -> None:
+        """Call after commit to forget the references written with the commit.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_refs.clear()
+
+    def update_refcounts(self, session: Session, refs: dict[int, int]) -> None:
+        """Add refs to the refcount of each id.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self.refcounts_active:
+            return
+        ids_by_refs: defaultdict[int, list[int]] = defaultdict(list)
+        for id_, id_refs in refs.items():
+            if id_refs:
+                ids_by_refs[id_refs].append(id_)
+        for id_refs, ids in ids_by_refs.items():
+            for ids_chunk in chunked(ids, self.recorder.max_bind_vars):
+                session.execute(self._update_refcounts_stmt(ids_chunk, id_refs))
+
+    def reset(self) -> None:
+        """Reset after the database has been reset or changed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        super().reset()
+        self._pending_refs.clear()
@@ -11,9 +11,9 @@ from homeassistant.core import Event
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import EventData
-from ..queries import get_shared_event_datas
+from ..queries import get_shared_event_datas, update_event_data_refcounts
 from ..util import chunked, execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseRefCountedLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -24,12 +24,12 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class EventDataManager(BaseLRUTableManager[EventData]):
+class EventDataManager(BaseRefCountedLRUTableManager[EventData]):
     """Manage the EventData table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, update_event_data_refcounts)
         self.active = True  # always active
 
     def serialize_from_event(self, event: Event) -> bytes | None:
@@ -112,6 +112,8 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         """
         assert db_event_data.shared_data is not None
         shared_data: str = db_event_data.shared_data
+        if self.refcounts_active:
+            db_event_data.refcount = 1
         self._pending[shared_data] = db_event_data
 
     def post_commit_pending(self) -> None:
@@ -123,6 +125,7 @@ class EventDataManager(BaseLRUTableManager[EventData]):
         for shared_data, db_event_data in self._pending.items():
             self._id_map[shared_data] = db_event_data.data_id
         self._pending.clear()
+        super().post_commit_pending()
 
     def evict_purged(self, data_ids: set[int]) -> None:
         """Evict purged data_ids from the cache when they are no longer used.
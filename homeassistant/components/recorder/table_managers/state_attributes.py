@@ -11,9 +11,9 @@ from homeassistant.core import Event
 from homeassistant.util.json import JSON_ENCODE_EXCEPTIONS
 
 from ..db_schema import StateAttributes
-from ..queries import get_shared_attributes
+from ..queries import get_shared_attributes, update_attributes_refcounts
 from ..util import chunked, execute_stmt_lambda_element
-from . import BaseLRUTableManager
+from . import BaseRefCountedLRUTableManager
 
 if TYPE_CHECKING:
     from ..core import Recorder
@@ -29,12 +29,12 @@ CACHE_SIZE = 2048
 _LOGGER = logging.getLogger(__name__)
 
 
-class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
+class StateAttributesManager(BaseRefCountedLRUTableManager[StateAttributes]):
     """Manage the StateAttributes table."""
 
     def __init__(self, recorder: Recorder) -> None:
         """Initialize the event type manager."""
-        super().__init__(recorder, CACHE_SIZE)
+        super().__init__(recorder, CACHE_SIZE, update_attributes_refcounts)
         self.active = True  # always active
 
     def serialize_from_event(self, event: Event) -> bytes | None:
@@ -121,6 +121,8 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         """
         assert db_state_attributes.shared_attrs is not None
         shared_attrs: str = db_state_attributes.shared_attrs
+        if self.refcounts_active:
+            db_state_attributes.refcount = 1
         self._pending[shared_attrs] = db_state_attributes
 
     def post_commit_pending(self) -> None:
@@ -132,6 +134,7 @@ class StateAttributesManager(BaseLRUTableManager[StateAttributes]):
         for shared_attrs, db_state_attributes in self._pending.items():
             self._id_map[shared_attrs] = db_state_attributes.attributes_id
         self._pending.clear()
+        super().post_commit_pending()
 
     def evict_purged(self, attributes_ids: set[int]) -> None:
         """Evict purged attributes_ids from the cache when they are no longer used.
@@ -1,8 +1,18 @@
 """Support managing States."""
 from __future__ import annotations
 
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
 from ..db_schema import States
 
+# Everything but the state_id which is allocated by the database
+_INSERT_KEYS = tuple(
+    column.key for column in States.__table__.columns if column.key != "state_id"
+)
+
 
 class StatesManager:
     """Manage the states table."""
@@ -10,6 +20,7 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_inserts: list[States] = []
         self._last_committed_id: dict[str, int] = {}
 
     def pop_pending(self, entity_id: str) -> States | None:
@@ -43,6 +54,57 @@ class StatesManager:
         """
         self._pending[entity_id] = state
 
+    def add_pending_insert(self, state: States) -> None:
+        """Add a state to insert in bulk instead of adding it to the session.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_inserts.append(state)
+
+    def insert_pending(self, session: Session) -> None:
+        """Insert the states added with add_pending_insert before commit.
+
+        The session is flushed first so the pending StatesMeta and
+        StateAttributes have their ids. The states are then written with
+        multi-row INSERT ... RETURNING statements, a state which links to
+        a pending old state is written after the old state has its state_id.
+
+        The database must support RETURNING for executemany in parameter
+        order. This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        if not self._pending_inserts:
+            return
+        session.flush()
+        pending = self._pending_inserts
+        # The state_ids left by a previous attempt to commit are not used
+        # since they are only known to be valid once a state is inserted
+        not_inserted = set(pending)
+        stmt = insert(States).returning(States.state_id, sort_by_parameter_order=True)
+        while pending:
+            batch: list[States] = []
+            deferred: list[States] = []
+            rows: list[dict[str, Any]] = []
+            for state in pending:
+                if (old_state := state.old_state) is not None:
+                    if old_state in not_inserted:
+                        deferred.append(state)
+                        continue
+                    state.old_state_id = old_state.state_id
+                if (states_meta := state.states_meta_rel) is not None:
+                    state.metadata_id = states_meta.metadata_id
+                if (state_attributes := state.state_attributes) is not None:
+                    state.attributes_id = state_attributes.attributes_id
+                batch.append(state)
+                rows.append({key: getattr(state, key) for key in _INSERT_KEYS})
+            for state, state_id in zip(
+                batch, session.execute(stmt, rows).scalars(), strict=True
+            ):
+                state.state_id = state_id
+            not_inserted.difference_update(batch)
+            pending = deferred
+
     def post_commit_pending(self) -> None:
         """Call after commit to load the state_id of the new States into committed.
 
@@ -52,6 +114,7 @@ class StatesManager:
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def reset(self) -> None:
         """Reset after the database has been reset or changed.
@@ -61,6 +124,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_inserts.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -80,6 +144,19 @@ class StatesManager:
         ):
             last_committed_ids.pop(last_committed_ids_reversed[purged_state_id], None)
 
+    def evict_purged_state_id_range(
+        self, start_state_id: int, end_state_id: int
+    ) -> None:
+        """Evict a purged range of state_ids from the committed states.
+
+        When we purge states we need to make sure the next call to record a state
+        does not link the old_state_id to the purged state.
+        """
+        last_committed_ids = self._last_committed_id
+        for entity_id, state_id in list(last_committed_ids.items()):
+            if start_state_id <= state_id < end_state_id:
+                del last_committed_ids[entity_id]
+
     def evict_purged_entity_ids(self, purged_entity_ids: set[str]) -> None:
         """Evict purged entity_ids from the committed states.
 
@@ -33,6 +33,7 @@ import homeassistant.util.dt as dt_util
 
 from .const import (
     DATA_INSTANCE,
+    DB_READ_QUERY_TIMEOUT,
     DEFAULT_MAX_BIND_VARS,
     DOMAIN,
     SQLITE_MAX_BIND_VARS,
@@ -68,6 +69,9 @@ RETRIES = 3
 QUERY_RETRY_WAIT = 0.1
 SQLITE3_POSTFIXES = ["", "-wal", "-shm"]
 DEFAULT_YIELD_STATES_ROWS = 32768
+# The number of SQLite virtual machine instructions between
+# checks if a read query should be aborted
+SQLITE_READ_PROGRESS_HANDLER_INSTRUCTIONS = 10000
 
 
 # Our minimum versions for each database
@@ -603,6 +607,52 @@ def setup_connection_for_dialect(
     )
 
 
+def setup_read_connection_for_dialect(
+    dialect_name: str,
+    dbapi_connection: DBAPIConnection,
+    should_abort: Callable[[], bool],
+) -> None:
+    """Execute statements needed for a read-only dialect connection.
+
+    Queries on SQLite call should_abort periodically and are interrupted
+    when it returns True. Other databases enforce the read query timeout
+    on the server.
+    """
+    if dialect_name == SupportedDialect.SQLITE:
+        execute_on_connection(dbapi_connection, "PRAGMA cache_size = -16384")
+        # The connection shares the WAL with the recorder connection
+        # and must never write to the database
+        execute_on_connection(dbapi_connection, "PRAGMA query_only = ON")
+        dbapi_connection.set_progress_handler(  # type: ignore[attr-defined]
+            should_abort, SQLITE_READ_PROGRESS_HANDLER_INSTRUCTIONS
+        )
+    elif dialect_name == SupportedDialect.MYSQL:
+        execute_on_connection(dbapi_connection, "SET session wait_timeout=28800")
+        execute_on_connection(dbapi_connection, "SET SESSION TRANSACTION READ ONLY")
+        version_string = query_on_connection(dbapi_connection, "SELECT VERSION()")[0][0]
+        if "mariadb" in version_string.lower():
+            execute_on_connection(
+                dbapi_connection,
+                f"SET SESSION max_statement_time={DB_READ_QUERY_TIMEOUT}",
+            )
+        else:
+            execute_on_connection(
+                dbapi_connection,
+                f"SET SESSION max_execution_time={DB_READ_QUERY_TIMEOUT * 1000}",
+            )
+        # Ensure all times are using UTC to avoid issues with daylight savings
+        execute_on_connection(dbapi_connection, "SET time_zone = '+00:00'")
+    elif dialect_name == SupportedDialect.POSTGRESQL:
+        execute_on_connection(
+            dbapi_connection, "SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY"
+        )
+        execute_on_connection(
+            dbapi_connection, f"SET statement_timeout = {DB_READ_QUERY_TIMEOUT * 1000}"
+        )
+    else:
+        _fail_unsupported_dialect(dialect_name)
+
+
 def end_incomplete_runs(session: Session, start_time: datetime) -> None:
     """End any incomplete recorder runs."""
     for run in session.query(RecorderRuns).filter_by(end=None):
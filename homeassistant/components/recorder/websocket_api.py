@@ -130,8 +130,8 @@ async def ws_get_statistic_during_period(
 
     start_time, end_time = resolve_period(cast(StatisticPeriod, msg))
 
-    connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+    with connection.cancel_on_close(msg["id"]):
+        response = await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistic_during_period,
             hass,
             msg["id"],
@@ -141,7 +141,8 @@ async def ws_get_statistic_during_period(
             msg.get("types"),
             msg.get("units"),
         )
-    )
+
+    connection.send_message(response)
 
 
 def _ws_get_statistics_during_period(
@@ -199,8 +200,8 @@ async def ws_handle_get_statistics_during_period(
 
     if (types := msg.get("types")) is None:
         types = {"change", "last_reset", "max", "mean", "min", "state", "sum"}
-    connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+    with connection.cancel_on_close(msg["id"]):
+        response = await get_instance(hass).async_add_read_executor_job(
             _ws_get_statistics_during_period,
             hass,
             msg["id"],
@@ -211,7 +212,8 @@ async def ws_handle_get_statistics_during_period(
             msg.get("units"),
             types,
         )
-    )
+
+    connection.send_message(response)
 
 
 @websocket_api.websocket_command(
@@ -254,14 +256,15 @@ async def ws_handle_list_statistic_ids(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict
 ) -> None:
     """Fetch a list of available statistic_id."""
-    connection.send_message(
-        await get_instance(hass).async_add_executor_job(
+    with connection.cancel_on_close(msg["id"]):
+        response = await get_instance(hass).async_add_read_executor_job(
             _ws_get_list_statistic_ids,
             hass,
             msg["id"],
             msg.get("statistic_type"),
         )
-    )
+
+    connection.send_message(response)
 
 
 @websocket_api.websocket_command(
@@ -500,6 +503,7 @@ def ws_info(
         # for the thread state lock which will block the event loop.
         is_running = instance.is_running
         max_backlog = instance.max_backlog
+        read_queue_depth = instance.read_queue_depth
     else:
         backlog = None
         migration_in_progress = False
@@ -507,10 +511,12 @@ def ws_info(
         recording = False
         is_running = False
         max_backlog = None
+        read_queue_depth = None
 
     recorder_info = {
         "backlog": backlog,
         "max_backlog": max_backlog,
+        "read_queue_depth": read_queue_depth,
         "migration_in_progress": migration_in_progress,
         "migration_is_live": migration_is_live,
         "recording": recording,
@@ -11,6 +11,7 @@ import voluptuous as vol
 
 from homeassistant.components import websocket_api
 from homeassistant.components.blueprint import CONF_USE_BLUEPRINT
+from homeassistant.components.trace import async_remove_trace_runs
 from homeassistant.const import (
     ATTR_ENTITY_ID,
     ATTR_MODE,
@@ -645,6 +646,7 @@ class ScriptEntity(BaseScriptEntity, RestoreEntity):
 
         # remove service
         self.hass.services.async_remove(DOMAIN, self.unique_id)
+        async_remove_trace_runs(self.hass, f"{DOMAIN}.{self.unique_id}")
 
 
 @websocket_api.websocket_command({"type": "script/config", "entity_id": str})
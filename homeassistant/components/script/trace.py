@@ -6,11 +6,12 @@ from contextlib import contextmanager
 from typing import Any
 
 from homeassistant.components.trace import (
-    CONF_STORED_TRACES,
     ActionTrace,
-    async_store_trace,
+    async_finish_trace,
+    async_start_trace,
 )
 from homeassistant.core import Context, HomeAssistant
+from homeassistant.helpers.trace import trace_enabled_cv
 
 from .const import DOMAIN
 
@@ -32,7 +33,7 @@ def trace_script(
 ) -> Iterator[ScriptTrace]:
     """Trace execution of a script."""
     trace = ScriptTrace(item_id, config, blueprint_inputs, context)
-    async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    token = trace_enabled_cv.set(async_start_trace(hass, trace, trace_config))
 
     try:
         yield trace
@@ -41,5 +42,7 @@ def trace_script(
             trace.set_error(ex)
         raise ex
     finally:
+        trace_enabled_cv.reset(token)
         if item_id:
             trace.finished()
+            async_finish_trace(hass, trace, trace_config)
@@ -4,10 +4,9 @@ from __future__ import annotations
 from collections import defaultdict
 from collections.abc import Callable, Iterable, MutableMapping
 import datetime
-import itertools
 import logging
 import math
-from typing import Any
+from typing import Any, TypeVar
 
 from sqlalchemy.orm.session import Session
 
@@ -46,6 +45,8 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 DEFAULT_STATISTICS = {
     SensorStateClass.MEASUREMENT: {"mean", "min", "max"},
     SensorStateClass.TOTAL: {"sum"},
@@ -92,41 +93,26 @@ def _get_sensor_states(hass: HomeAssistant) -> list[State]:
 
 
 def _time_weighted_average(
-    fstates: list[tuple[float, State]], start: datetime.datetime, end: datetime.datetime
+    fstates: list[tuple[float, float]], start: datetime.datetime, end: datetime.datetime
 ) -> float:
     """Calculate a time weighted average.
 
     The average is calculated by weighting the states by duration in seconds between
     state changes.
     Note: there's no interpolation of values between state changes.
-    """
-    old_fstate: float | None = None
-    old_start_time: datetime.datetime | None = None
-    accumulated = 0.0
-
-    for fstate, state in fstates:
-        # The recorder will give us the last known state, which may be well
-        # before the requested start time for the statistics
-        start_time = start if state.last_updated < start else state.last_updated
-        if old_start_time is None:
-            # Adjust start time, if there was no last known state
-            start = start_time
-        else:
-            duration = start_time - old_start_time
-            # Accumulate the value, weighted by duration until next state change
-            assert old_fstate is not None
-            accumulated += old_fstate * duration.total_seconds()
-
-        old_fstate = fstate
-        old_start_time = start_time
 
-    if old_fstate is not None:
-        # Accumulate the value, weighted by duration until end of the period
-        assert old_start_time is not None
-        duration = end - old_start_time
-        accumulated += old_fstate * duration.total_seconds()
-
-    period_seconds = (end - start).total_seconds()
+    fstates holds the value and the last_updated timestamp of each state.
+    """
+    if not fstates:
+        return 0.0
+    start_ts = start.timestamp()
+    # The recorder will give us the last known state, which may be well
+    # before the requested start time for the statistics
+    timestamps = [start_ts if ts < start_ts else ts for _, ts in fstates]
+    # Adjust start time, if there was no last known state
+    start_ts = timestamps[0]
+    end_ts = end.timestamp()
+    period_seconds = end_ts - start_ts
     if period_seconds == 0:
         # If the only state changed that happened was at the exact moment
         # at the end of the period, we can't calculate a meaningful average
@@ -135,14 +121,16 @@ def _time_weighted_average(
         # column schema in the database is incorrect but it is actually possible
         # to happen if the state change event fired at the exact microsecond
         return 0.0
+    timestamps.append(end_ts)
+    # Accumulate the values, weighted by duration until the next state change
+    # or the end of the period
+    accumulated = math.fsum(
+        fstate * (next_ts - ts)
+        for (fstate, _), ts, next_ts in zip(fstates, timestamps, timestamps[1:])
+    )
     return accumulated / period_seconds
 
 
-def _get_units(fstates: list[tuple[float, State]]) -> set[str | None]:
-    """Return a set of all units."""
-    return {item[1].attributes.get(ATTR_UNIT_OF_MEASUREMENT) for item in fstates}
-
-
 def _equivalent_units(units: set[str | None]) -> bool:
     """Return True if the units are equivalent."""
     if len(units) == 1:
@@ -172,16 +160,45 @@ def _entity_history_to_float_and_state(
     return float_states
 
 
+def _entity_columns_to_float_and_timestamp(
+    states: list[str | None],
+    timestamps: list[float],
+    attributes: list[dict[str, Any]],
+) -> tuple[list[tuple[float, float]], list[str | None]]:
+    """Return a list of (float, timestamp) tuples and their units for an entity.
+
+    The columns are the states, last_updated timestamps and attributes of the
+    history rows of the entity.
+    """
+    float_states: list[tuple[float, float]] = []
+    units: list[str | None] = []
+    append = float_states.append
+    append_unit = units.append
+    isfinite = math.isfinite
+    for state, timestamp, state_attributes in zip(states, timestamps, attributes):
+        try:
+            if isfinite(float_state := float(state)):  # type: ignore[arg-type]
+                append((float_state, timestamp))
+                append_unit(state_attributes.get(ATTR_UNIT_OF_MEASUREMENT))
+        except (ValueError, TypeError):
+            pass
+    return float_states, units
+
+
 def _normalize_states(
     hass: HomeAssistant,
     old_metadatas: dict[str, tuple[int, StatisticMetaData]],
-    fstates: list[tuple[float, State]],
+    fstates: list[tuple[float, _T]],
+    units: list[str | None],
     entity_id: str,
-) -> tuple[str | None, list[tuple[float, State]]]:
-    """Normalize units."""
+) -> tuple[str | None, list[tuple[float, _T]]]:
+    """Normalize units.
+
+    units holds the unit of each of the float states.
+    """
     state_unit: str | None = None
     statistics_unit: str | None
-    state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    state_unit = units[0]
     old_metadata = old_metadatas[entity_id][1] if entity_id in old_metadatas else None
     if not old_metadata:
         # We've not seen this sensor before, the first valid state determines the unit
@@ -194,7 +211,7 @@ def _normalize_states(
     if statistics_unit not in statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER:
         # The unit used by this sensor doesn't support unit conversion
 
-        all_units = _get_units(fstates)
+        all_units = set(units)
         if not _equivalent_units(all_units):
             if WARN_UNSTABLE_UNIT not in hass.data:
                 hass.data[WARN_UNSTABLE_UNIT] = set()
@@ -218,17 +235,15 @@ def _normalize_states(
                     LINK_DEV_STATISTICS,
                 )
             return None, []
-        state_unit = fstates[0][1].attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         return state_unit, fstates
 
     converter = statistics.STATISTIC_UNIT_TO_UNIT_CONVERTER[statistics_unit]
-    valid_fstates: list[tuple[float, State]] = []
+    valid_fstates: list[tuple[float, _T]] = []
     convert: Callable[[float], float] | None = None
     last_unit: str | None | object = object()
     valid_units = converter.VALID_UNITS
 
-    for fstate, state in fstates:
-        state_unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+    for (fstate, item), state_unit in zip(fstates, units):
         # Exclude states with unsupported unit from statistics
         if state_unit not in valid_units:
             if WARN_UNSUPPORTED_UNIT not in hass.data:
@@ -262,7 +277,7 @@ def _normalize_states(
         if convert is not None:
             fstate = convert(fstate)
 
-        valid_fstates.append((fstate, state))
+        valid_fstates.append((fstate, item))
 
     return statistics_unit, valid_fstates
 
@@ -416,26 +431,52 @@ def compile_statistics(  # noqa: C901
         for i in sensor_states
         if "sum" not in wanted_statistics[i.entity_id]
     ]
+    # The measurements are only needed as floats and timestamps, they are
+    # read as columns of the history rows without creating State objects
+    history_columns: dict[
+        str, tuple[list[str | None], list[float], list[dict[str, Any]]]
+    ] = {}
     if entities_significant_history:
-        _history_list = history.get_full_significant_states_with_session(
+        history_columns = history.get_significant_states_columns_with_session(
             hass,
             session,
             start - datetime.timedelta.resolution,
             end,
             entity_ids=entities_significant_history,
         )
-        history_list = {**history_list, **_history_list}
 
-    entities_with_float_states: dict[str, list[tuple[float, State]]] = {}
+    # The float states of sum entities are paired with their states and those
+    # of measurement entities with their timestamps, with the unit of each
+    entities_with_float_states: dict[
+        str, tuple[list[tuple[float, Any]], list[str | None]]
+    ] = {}
     for _state in sensor_states:
         entity_id = _state.entity_id
+        float_states: list[tuple[float, Any]]
         # If there are no recent state changes, the sensor's state may already be pruned
         # from the recorder. Get the state from the state machine instead.
-        if not (entity_history := history_list.get(entity_id, [_state])):
-            continue
-        if not (float_states := _entity_history_to_float_and_state(entity_history)):
+        if "sum" in wanted_statistics[entity_id]:
+            if not (entity_history := history_list.get(entity_id, [_state])):
+                continue
+            float_states = _entity_history_to_float_and_state(entity_history)
+            units = [
+                state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+                for _, state in float_states
+            ]
+        else:
+            float_states, units = _entity_columns_to_float_and_timestamp(
+                *history_columns.get(
+                    entity_id,
+                    (
+                        [_state.state],
+                        [_state.last_updated_timestamp],
+                        [_state.attributes],
+                    ),
+                )
+            )
+        if not float_states:
             continue
-        entities_with_float_states[entity_id] = float_states
+        entities_with_float_states[entity_id] = (float_states, units)
 
     # Only lookup metadata for entities that have valid float states
     # since it will result in cache misses for statistic_ids
@@ -444,7 +485,7 @@ def compile_statistics(  # noqa: C901
     old_metadatas = statistics.get_metadata_with_session(
         get_instance(hass), session, statistic_ids=set(entities_with_float_states)
     )
-    to_process: list[tuple[str, str | None, str, list[tuple[float, State]]]] = []
+    to_process: list[tuple[str, str | None, str, list[tuple[float, Any]]]] = []
     to_query: set[str] = set()
     for _state in sensor_states:
         entity_id = _state.entity_id
@@ -453,7 +494,7 @@ def compile_statistics(  # noqa: C901
         statistics_unit, valid_float_states = _normalize_states(
             hass,
             old_metadatas,
-            maybe_float_states,
+            *maybe_float_states,
             entity_id,
         )
         if not valid_float_states:
@@ -510,9 +551,9 @@ def compile_statistics(  # noqa: C901
         # Make calculations
         stat: StatisticData = {"start": start}
         if "max" in wanted_statistics[entity_id]:
-            stat["max"] = max(*itertools.islice(zip(*valid_float_states), 1))
+            stat["max"] = max(fstate for fstate, _ in valid_float_states)
         if "min" in wanted_statistics[entity_id]:
-            stat["min"] = min(*itertools.islice(zip(*valid_float_states), 1))
+            stat["min"] = min(fstate for fstate, _ in valid_float_states)
 
         if "mean" in wanted_statistics[entity_id]:
             stat["mean"] = _time_weighted_average(valid_float_states, start, end)
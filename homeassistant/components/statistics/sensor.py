@@ -1,13 +1,13 @@
 """Support for statistics for sensor values."""
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import deque
 from collections.abc import Callable
 import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -271,6 +271,193 @@ async def async_setup_platform(
     )
 
 
+def _sin_cos(degrees: float) -> tuple[float, float]:
+    """Return the sine and cosine of an angle in degrees."""
+    radians = math.radians(degrees)
+    return math.sin(radians), math.cos(radians)
+
+
+class SampleWindow:
+    """Sliding window of samples with incrementally maintained statistics.
+
+    Samples are appended at the end and removed from the start, so the
+    running sums, the monotonic min/max queues and the sorted values
+    are updated in constant or logarithmic time instead of iterating all
+    samples for every update. The running sums are recalculated from the
+    samples once as many samples have been removed as are in the window
+    to keep the floating point error bounded.
+
+    The samples must be finite, the running sums can not recover from
+    removing an infinite or NaN sample.
+    """
+
+    def __init__(self, max_size: int | None) -> None:
+        """Initialize the window."""
+        self.max_size = max_size
+        self.states: deque[float | bool] = deque(maxlen=max_size)
+        self.ages: deque[datetime] = deque(maxlen=max_size)
+        self.sorted_states: list[float | bool] = []
+        self.count_on = 0
+        # Index of the oldest sample, used to expire the min/max candidates
+        self._first_index = 0
+        # Candidates for the min/max as (index, value, age), the first
+        # one being the oldest occurrence of the current min/max
+        self._min_candidates: deque[tuple[int, float | bool, datetime]] = deque()
+        self._max_candidates: deque[tuple[int, float | bool, datetime]] = deque()
+        self._removed = 0
+        self._reset_sums()
+
+    def _reset_sums(self) -> None:
+        """Reset the running sums."""
+        self.sum: float = 0.0
+        self.mean: float = 0.0
+        # Sum of squared differences from the mean (Welford)
+        self._m2: float = 0.0
+        self.sin_sum: float = 0.0
+        self.cos_sum: float = 0.0
+        self.sum_differences: float = 0.0
+        self.sum_differences_nonnegative: float = 0.0
+        self.area_linear: float = 0.0
+        self.area_step: float = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self.states)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return max(self._m2, 0.0) / (len(self.states) - 1)
+
+    @property
+    def min(self) -> float | bool:
+        """Return the lowest sample value."""
+        return self._min_candidates[0][1]
+
+    @property
+    def max(self) -> float | bool:
+        """Return the highest sample value."""
+        return self._max_candidates[0][1]
+
+    @property
+    def min_age(self) -> datetime:
+        """Return the age of the oldest sample with the lowest value."""
+        return self._min_candidates[0][2]
+
+    @property
+    def max_age(self) -> datetime:
+        """Return the age of the oldest sample with the highest value."""
+        return self._max_candidates[0][2]
+
+    def append(self, value: float | bool, age: datetime) -> None:
+        """Add a sample to the end of the window."""
+        if self.max_size is not None and len(self.states) >= self.max_size:
+            self.popleft()
+        states = self.states
+        if states:
+            previous = states[-1]
+            self._add_pair(previous, value, (age - self.ages[-1]).total_seconds(), 1)
+        index = self._first_index + len(states)
+        states.append(value)
+        self.ages.append(age)
+        insort(self.sorted_states, value)
+        if value is True:
+            self.count_on += 1
+
+        self.sum += value
+        delta = value - self.mean
+        self.mean += delta / len(states)
+        self._m2 += delta * (value - self.mean)
+        sin, cos = _sin_cos(value)
+        self.sin_sum += sin
+        self.cos_sum += cos
+
+        min_candidates = self._min_candidates
+        while min_candidates and min_candidates[-1][1] > value:
+            min_candidates.pop()
+        min_candidates.append((index, value, age))
+        max_candidates = self._max_candidates
+        while max_candidates and max_candidates[-1][1] < value:
+            max_candidates.pop()
+        max_candidates.append((index, value, age))
+
+    def popleft(self) -> None:
+        """Remove the oldest sample from the window."""
+        states = self.states
+        ages = self.ages
+        value = states.popleft()
+        age = ages.popleft()
+        if states:
+            self._add_pair(value, states[0], (ages[0] - age).total_seconds(), -1)
+        sorted_states = self.sorted_states
+        del sorted_states[bisect_left(sorted_states, value)]
+        if value is True:
+            self.count_on -= 1
+        if self._min_candidates[0][0] == self._first_index:
+            self._min_candidates.popleft()
+        if self._max_candidates[0][0] == self._first_index:
+            self._max_candidates.popleft()
+        self._first_index += 1
+
+        if not states:
+            self._removed = 0
+            self._reset_sums()
+            return
+        self._removed += 1
+        if self._removed >= len(states):
+            self._removed = 0
+            self._recalculate_sums()
+            return
+
+        count = len(states)
+        self.sum -= value
+        mean = self.mean
+        self.mean -= (value - mean) / count
+        self._m2 -= (value - mean) * (value - self.mean)
+        sin, cos = _sin_cos(value)
+        self.sin_sum -= sin
+        self.cos_sum -= cos
+
+    def _add_pair(
+        self,
+        previous: float | bool,
+        value: float | bool,
+        seconds: float,
+        sign: int,
+    ) -> None:
+        """Add or remove the contribution of two consecutive samples."""
+        self.sum_differences += sign * abs(value - previous)
+        self.sum_differences_nonnegative += sign * (
+            value - previous if value >= previous else value
+        )
+        self.area_linear += sign * 0.5 * (value + previous) * seconds
+        self.area_step += sign * previous * seconds
+
+    def _recalculate_sums(self) -> None:
+        """Recalculate the running sums from the samples."""
+        states = self.states
+        ages = self.ages
+        self.sum = sum(states)
+        self.mean = self.sum / len(states)
+        self._m2 = sum((value - self.mean) ** 2 for value in states)
+        sin_cos = [_sin_cos(value) for value in states]
+        self.sin_sum = sum(sin for sin, _ in sin_cos)
+        self.cos_sum = sum(cos for _, cos in sin_cos)
+        pairs = list(zip(states, list(states)[1:]))
+        seconds = [
+            (newer - older).total_seconds()
+            for older, newer in zip(ages, list(ages)[1:])
+        ]
+        self.sum_differences = sum(abs(j - i) for i, j in pairs)
+        self.sum_differences_nonnegative = sum(
+            (j - i if j >= i else j) for i, j in pairs
+        )
+        self.area_linear = sum(
+            0.5 * (i + j) * delta for (i, j), delta in zip(pairs, seconds)
+        )
+        self.area_step = sum(i * delta for (i, _), delta in zip(pairs, seconds))
+
+
 class StatisticsSensor(SensorEntity):
     """Representation of a Statistics sensor."""
 
@@ -303,8 +490,9 @@ class StatisticsSensor(SensorEntity):
         self._unit_of_measurement: str | None = None
         self._available: bool = False
 
-        self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
-        self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
+        self._window = SampleWindow(self._samples_max_buffer_size)
+        self.states: deque[float | bool] = self._window.states
+        self.ages: deque[datetime] = self._window.ages
         self.attributes: dict[str, StateType] = {}
 
         self._state_characteristic_fn: Callable[
@@ -356,10 +544,12 @@ class StatisticsSensor(SensorEntity):
         try:
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value: float | bool = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = float(new_state.state)
+                if not math.isfinite(value):
+                    raise ValueError
+            self._window.append(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -467,8 +657,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._window.popleft()
 
     def _next_to_purge_timestamp(self) -> datetime | None:
         """Find the timestamp when the next purge would occur."""
@@ -599,27 +788,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_average_linear(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    0.5
-                    * (self.states[i] + self.states[i - 1])
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._window.area_linear / age_range_seconds
         return None
 
     def _stat_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            area: float = 0
-            for i in range(1, len(self.states)):
-                area += (
-                    self.states[i - 1]
-                    * (self.ages[i] - self.ages[i - 1]).total_seconds()
-                )
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
-            return area / age_range_seconds
+            return self._window.area_step / age_range_seconds
         return None
 
     def _stat_average_timeless(self) -> StateType:
@@ -657,12 +833,12 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_datetime_value_max(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(max(self.states))]
+            return self._window.max_age
         return None
 
     def _stat_datetime_value_min(self) -> datetime | None:
         if len(self.states) > 0:
-            return self.ages[self.states.index(min(self.states))]
+            return self._window.min_age
         return None
 
     def _stat_distance_95_percent_of_values(self) -> StateType:
@@ -677,24 +853,28 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            return self._window.max - self._window.min
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            return self._window.mean
         return None
 
     def _stat_mean_circular(self) -> StateType:
         if len(self.states) > 0:
-            sin_sum = sum(math.sin(math.radians(x)) for x in self.states)
-            cos_sum = sum(math.cos(math.radians(x)) for x in self.states)
+            sin_sum = self._window.sin_sum
+            cos_sum = self._window.cos_sum
             return (math.degrees(math.atan2(sin_sum, cos_sum)) + 360) % 360
         return None
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            sorted_states = self._window.sorted_states
+            middle = len(sorted_states) // 2
+            if len(sorted_states) % 2:
+                return sorted_states[middle]
+            return (sorted_states[middle - 1] + sorted_states[middle]) / 2
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -704,35 +884,35 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            # Same as statistics.quantiles(n=100, method="exclusive")
+            sorted_states = self._window.sorted_states
+            count = len(sorted_states)
+            scaled = self._percentile * (count + 1)
+            index = min(max(scaled // 100, 1), count - 1)
+            delta = scaled - index * 100
+            return (
+                sorted_states[index - 1] * (100 - delta) + sorted_states[index] * delta
+            ) / 100
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            return math.sqrt(self._window.variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            return self._window.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum = sum(
-                abs(j - i) for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum
+            return self._window.sum_differences
         return None
 
     def _stat_sum_differences_nonnegative(self) -> StateType:
         if len(self.states) >= 2:
-            diff_sum_nn = sum(
-                (j - i if j >= i else j - 0)
-                for i, j in zip(list(self.states), list(self.states)[1:])
-            )
-            return diff_sum_nn
+            return self._window.sum_differences_nonnegative
         return None
 
     def _stat_total(self) -> StateType:
@@ -740,27 +920,24 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            return self._window.max
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            return self._window.min
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            return self._window.variance
         return None
 
     # Statistics for binary sensor
 
     def _stat_binary_average_step(self) -> StateType:
         if len(self.states) >= 2:
-            on_seconds: float = 0
-            for i in range(1, len(self.states)):
-                if self.states[i - 1] is True:
-                    on_seconds += (self.ages[i] - self.ages[i - 1]).total_seconds()
+            on_seconds = self._window.area_step
             age_range_seconds = (self.ages[-1] - self.ages[0]).total_seconds()
             return 100 / age_range_seconds * on_seconds
         return None
@@ -772,10 +949,10 @@ class StatisticsSensor(SensorEntity):
         return len(self.states)
 
     def _stat_binary_count_on(self) -> StateType:
-        return self.states.count(True)
+        return self._window.count_on
 
     def _stat_binary_count_off(self) -> StateType:
-        return self.states.count(False)
+        return len(self.states) - self._window.count_on
 
     def _stat_binary_datetime_newest(self) -> datetime | None:
         return self._stat_datetime_newest()
@@ -785,5 +962,5 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_binary_mean(self) -> StateType:
         if len(self.states) > 0:
-            return 100.0 / len(self.states) * self.states.count(True)
+            return 100.0 / len(self.states) * self._window.count_on
         return None
@@ -0,0 +1,38 @@
+"""Diagnostics support for Template."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from .const import DOMAIN
+from .template_entity import TemplateEntity
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, config_entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    entity_ids = {
+        entry.entity_id
+        for entry in er.async_entries_for_config_entry(
+            er.async_get(hass), config_entry.entry_id
+        )
+    }
+    render_stats: dict[str, dict[str, dict[str, Any]]] = {}
+    for platform in async_get_platforms(hass, DOMAIN):
+        for entity_id, entity in platform.entities.items():
+            if entity_id in entity_ids and isinstance(entity, TemplateEntity):
+                render_stats[entity_id] = {
+                    template: asdict(stats)
+                    for template, stats in entity.async_get_render_stats().items()
+                }
+
+    return {
+        "config_entry": config_entry.as_dict(),
+        "render_stats": render_stats,
+    }
@@ -30,6 +30,7 @@ import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import (
     EventStateChangedData,
+    TemplateRenderStats,
     TrackTemplate,
     TrackTemplateResult,
     TrackTemplateResultInfo,
@@ -549,6 +550,13 @@ class TemplateEntity(Entity):
         assert self._template_result_info
         self._template_result_info.async_refresh()
 
+    @callback
+    def async_get_render_stats(self) -> dict[str, TemplateRenderStats]:
+        """Return statistics about the renders of the templates."""
+        if self._template_result_info is None:
+            return {}
+        return self._template_result_info.render_stats
+
     async def async_run_script(
         self,
         script: Script,
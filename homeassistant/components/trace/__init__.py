@@ -18,11 +18,21 @@ from homeassistant.util.limited_size_dict import LimitedSizeDict
 
 from . import websocket_api
 from .const import (
+    CONF_MAX_STORED_BYTES,
+    CONF_SAMPLE_RATE,
     CONF_STORED_TRACES,
+    CONF_TRACE_LEVEL,
     DATA_TRACE,
+    DATA_TRACE_RUNS,
     DATA_TRACE_STORE,
     DATA_TRACES_RESTORED,
+    DEFAULT_SAMPLE_RATE,
     DEFAULT_STORED_TRACES,
+    TRACE_LEVEL_ERRORS,
+    TRACE_LEVEL_FULL,
+    TRACE_LEVEL_OFF,
+    TRACE_LEVEL_SAMPLED,
+    TRACE_LEVELS,
 )
 from .models import ActionTrace, BaseTrace, RestoredTrace
 
@@ -34,7 +44,12 @@ STORAGE_KEY = "trace.saved_traces"
 STORAGE_VERSION = 1
 
 TRACE_CONFIG_SCHEMA = {
-    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int
+    vol.Optional(CONF_STORED_TRACES, default=DEFAULT_STORED_TRACES): cv.positive_int,
+    vol.Optional(CONF_TRACE_LEVEL, default=TRACE_LEVEL_FULL): vol.In(TRACE_LEVELS),
+    vol.Optional(CONF_SAMPLE_RATE, default=DEFAULT_SAMPLE_RATE): vol.All(
+        vol.Coerce(int), vol.Range(min=1)
+    ),
+    vol.Optional(CONF_MAX_STORED_BYTES): cv.positive_int,
 }
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -50,6 +65,7 @@ def _get_data(hass: HomeAssistant) -> TraceData:
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Initialize the trace integration."""
     hass.data[DATA_TRACE] = {}
+    hass.data[DATA_TRACE_RUNS] = {}
     websocket_api.async_setup(hass)
     store = Store[dict[str, list]](
         hass, STORAGE_VERSION, STORAGE_KEY, encoder=ExtendedJSONEncoder
@@ -151,6 +167,73 @@ def async_store_trace(
         traces[key][trace.run_id] = trace
 
 
+@callback
+def async_start_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> bool:
+    """Start a trace according to the trace level of the traced item.
+
+    Runs of items with the full level and every sample_rate'th run of items
+    with the sampled level are stored right away, so they can be followed
+    while they run. Runs of items with the errors level are stored by
+    async_finish_trace if they fail.
+
+    Returns False if the steps of the run should not be recorded.
+    """
+    level = trace_config.get(CONF_TRACE_LEVEL, TRACE_LEVEL_FULL)
+    if level == TRACE_LEVEL_OFF:
+        return False
+    if level == TRACE_LEVEL_SAMPLED:
+        runs: dict[str, int] = hass.data[DATA_TRACE_RUNS]
+        run = runs.get(trace.key, 0)
+        runs[trace.key] = run + 1
+        if run % trace_config.get(CONF_SAMPLE_RATE, DEFAULT_SAMPLE_RATE):
+            return False
+    if level != TRACE_LEVEL_ERRORS:
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    return True
+
+
+@callback
+def async_remove_trace_runs(hass: HomeAssistant, key: str) -> None:
+    """Forget the number of runs of a removed automation or script."""
+    hass.data[DATA_TRACE_RUNS].pop(key, None)
+
+
+@callback
+def async_finish_trace(
+    hass: HomeAssistant, trace: ActionTrace, trace_config: ConfigType
+) -> None:
+    """Store a failed run and drop the oldest traces over the byte limit."""
+    if trace_config.get(CONF_TRACE_LEVEL) == TRACE_LEVEL_ERRORS:
+        if not trace.has_error:
+            return
+        async_store_trace(hass, trace, trace_config[CONF_STORED_TRACES])
+    if (max_stored_bytes := trace_config.get(CONF_MAX_STORED_BYTES)) is not None and (
+        traces := _get_data(hass).get(trace.key)
+    ):
+        _async_limit_stored_bytes(traces, max_stored_bytes)
+
+
+@callback
+def _async_limit_stored_bytes(
+    traces: LimitedSizeDict[str, BaseTrace], max_stored_bytes: int
+) -> None:
+    """Drop the oldest traces until the traces fit in max_stored_bytes.
+
+    The newest trace is always kept.
+    """
+    stored_bytes = 0
+    keep = 0
+    for trace in reversed(traces.values()):
+        stored_bytes += trace.size
+        if keep and stored_bytes > max_stored_bytes:
+            break
+        keep += 1
+    for _ in range(len(traces) - keep):
+        traces.popitem(last=False)
+
+
 def _async_store_restored_trace(hass: HomeAssistant, trace: RestoredTrace) -> None:
     """Store a restored trace and move it to the end of the LimitedSizeDict."""
     key = trace.key
@@ -1,7 +1,23 @@
 """Shared constants for script and automation tracing and debugging."""
 
+CONF_MAX_STORED_BYTES = "max_stored_bytes"
+CONF_SAMPLE_RATE = "sample_rate"
 CONF_STORED_TRACES = "stored_traces"
+CONF_TRACE_LEVEL = "level"
 DATA_TRACE = "trace"
+DATA_TRACE_RUNS = "trace_runs"
 DATA_TRACE_STORE = "trace_store"
 DATA_TRACES_RESTORED = "trace_traces_restored"
+DEFAULT_SAMPLE_RATE = 10  # Trace one in every 10 runs
 DEFAULT_STORED_TRACES = 5  # Stored traces per script or automation
+
+TRACE_LEVEL_ERRORS = "errors"
+TRACE_LEVEL_FULL = "full"
+TRACE_LEVEL_OFF = "off"
+TRACE_LEVEL_SAMPLED = "sampled"
+TRACE_LEVELS = [
+    TRACE_LEVEL_ERRORS,
+    TRACE_LEVEL_FULL,
+    TRACE_LEVEL_OFF,
+    TRACE_LEVEL_SAMPLED,
+]
@@ -4,9 +4,11 @@ from __future__ import annotations
 import abc
 from collections import deque
 import datetime as dt
+import json
 from typing import Any
 
 from homeassistant.core import Context
+from homeassistant.helpers.json import ExtendedJSONEncoder, json_bytes
 from homeassistant.helpers.trace import (
     TraceElement,
     script_execution_get,
@@ -24,6 +26,7 @@ class BaseTrace(abc.ABC):
     context: Context
     key: str
     run_id: str
+    _size: int | None = None
 
     def as_dict(self) -> dict[str, Any]:
         """Return an dictionary version of this ActionTrace for saving."""
@@ -32,6 +35,30 @@ class BaseTrace(abc.ABC):
             "short_dict": self.as_short_dict(),
         }
 
+    @property
+    def size(self) -> int:
+        """Return the estimated size of the trace in bytes.
+
+        The size is the length of the steps of the trace serialized to JSON,
+        the steps only hold the variables that changed. It is calculated
+        once the run has finished, a running trace has a size of 0.
+        """
+        if self._size is not None:
+            return self._size
+        if not self.finished_running:
+            return 0
+        steps = self.as_extended_dict()["trace"]
+        try:
+            self._size = len(json_bytes(steps))
+        except TypeError:
+            self._size = len(json.dumps(steps, cls=ExtendedJSONEncoder))
+        return self._size
+
+    @property
+    def finished_running(self) -> bool:
+        """Return True if the traced run has stopped."""
+        return True
+
     @abc.abstractmethod
     def as_extended_dict(self) -> dict[str, Any]:
         """Return an extended dictionary version of this ActionTrace."""
@@ -79,6 +106,16 @@ class ActionTrace(BaseTrace):
         """Set error."""
         self._error = ex
 
+    @property
+    def finished_running(self) -> bool:
+        """Return True if the traced run has stopped."""
+        return self._state == "stopped"
+
+    @property
+    def has_error(self) -> bool:
+        """Return True if the traced run failed."""
+        return self._error is not None or self._script_execution == "error"
+
     def finished(self) -> None:
         """Set finish time."""
         self._timestamp_finish = dt_util.utcnow()
@@ -56,6 +56,7 @@ class AuthPhase:
         cancel_ws: CALLBACK_TYPE,
         request: Request,
         send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+        wait_drained: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize the authenticated connection."""
         self._hass = hass
@@ -66,6 +67,8 @@ class AuthPhase:
         self._request = request
         # send_bytes_text will directly send a message to the client.
         self._send_bytes_text = send_bytes_text
+        # wait_drained waits until the queued messages have been sent.
+        self._wait_drained = wait_drained
 
     async def async_handle(self, msg: JsonValueType) -> ActiveConnection:
         """Handle authentication."""
@@ -88,6 +91,7 @@ class AuthPhase:
                 self._send_message,
                 refresh_token.user,
                 refresh_token,
+                self._wait_drained,
             )
             conn.subscriptions[
                 "auth"
@@ -1,7 +1,7 @@
 """Commands part of Websocket API."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 import datetime as dt
 from functools import lru_cache, partial
 import json
@@ -39,6 +39,7 @@ from homeassistant.helpers.event import (
     EventStateChangedData,
     TrackTemplate,
     TrackTemplateResult,
+    TrackTemplateResultInfo,
     async_track_template_result,
 )
 from homeassistant.helpers.json import (
@@ -56,7 +57,11 @@ from homeassistant.loader import (
     async_get_integration_descriptions,
     async_get_integrations,
 )
-from homeassistant.setup import DATA_SETUP_TIME, async_get_loaded_integrations
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    async_get_loaded_integrations,
+    async_get_setup_trace,
+)
 from homeassistant.util.json import format_unserializable_data
 
 from . import const, decorators, messages
@@ -64,6 +69,7 @@ from .connection import ActiveConnection
 from .messages import construct_result_message
 
 ALL_SERVICE_DESCRIPTIONS_JSON_CACHE = "websocket_api_all_service_descriptions_json"
+SHARED_TEMPLATE_SUBSCRIPTIONS = "websocket_api_shared_template_subscriptions"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -83,6 +89,7 @@ def async_register_commands(
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_integration_setup_info)
+    async_reg(hass, handle_integration_setup_trace)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
@@ -368,6 +375,7 @@ def _forward_entity_changes(
     entity_ids: set[str],
     user: User,
     msg_id: int,
+    interned_entity_ids: dict[str, int] | None,
     event: Event,
 ) -> None:
     """Forward entity state changed events to websocket."""
@@ -383,7 +391,12 @@ def _forward_entity_changes(
         and not permissions.check_entity(event.data["entity_id"], POLICY_READ)
     ):
         return
-    send_message(messages.cached_state_diff_message(msg_id, event))
+    if interned_entity_ids is None:
+        send_message(messages.cached_state_diff_message(msg_id, event))
+    elif message := messages.compact_state_diff_message(
+        msg_id, interned_entity_ids, event
+    ):
+        send_message(message)
 
 
 @callback
@@ -398,6 +411,13 @@ def handle_subscribe_entities(
 ) -> None:
     """Handle subscribe entities command."""
     entity_ids = set(msg.get("entity_ids", []))
+    # Clients that support compact entity ids get changes keyed by
+    # an id that is assigned when the entity_id is first sent
+    interned_entity_ids: dict[str, int] | None = (
+        {}
+        if const.FEATURE_COMPACT_ENTITY_IDS in connection.supported_features
+        else None
+    )
     # We must never await between sending the states and listening for
     # state changed events or we will introduce a race condition
     # where some states are missed
@@ -410,6 +430,7 @@ def handle_subscribe_entities(
             entity_ids,
             connection.user,
             msg["id"],
+            interned_entity_ids,
         ),
         run_immediately=True,
     )
@@ -427,10 +448,20 @@ def handle_subscribe_entities(
     except (ValueError, TypeError):
         pass
     else:
+        if interned_entity_ids is not None:
+            _intern_entity_ids(
+                interned_entity_ids,
+                (
+                    state.entity_id
+                    for state in states
+                    if not entity_ids or state.entity_id in entity_ids
+                ),
+            )
         _send_handle_entities_init_response(connection, msg["id"], serialized_states)
         return
 
     serialized_states = []
+    sent_entity_ids: list[str] = []
     for state in states:
         try:
             serialized_states.append(state.as_compressed_state_json)
@@ -441,10 +472,22 @@ def handle_subscribe_entities(
                     find_paths_unserializable_data(state, dump=JSON_DUMP)
                 ),
             )
+        else:
+            sent_entity_ids.append(state.entity_id)
 
+    if interned_entity_ids is not None:
+        _intern_entity_ids(interned_entity_ids, sent_entity_ids)
     _send_handle_entities_init_response(connection, msg["id"], serialized_states)
 
 
+def _intern_entity_ids(
+    interned_entity_ids: dict[str, int], entity_ids: Iterable[str]
+) -> None:
+    """Intern the entity_ids in the order they are sent to the client."""
+    for entity_id in entity_ids:
+        interned_entity_ids[entity_id] = len(interned_entity_ids)
+
+
 def _send_handle_entities_init_response(
     connection: ActiveConnection, msg_id: int, serialized_states: list[bytes]
 ) -> None:
@@ -551,6 +594,15 @@ def handle_integration_setup_info(
     )
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/setup_trace"})
+def handle_integration_setup_trace(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle integration setup trace command."""
+    connection.send_result(msg["id"], async_get_setup_trace(hass))
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(
@@ -590,6 +642,15 @@ async def handle_render_template(
         template_obj = _cached_template(template_str, hass)
     variables = msg.get("variables")
     timeout = msg.get("timeout")
+    shared_key: tuple[str, str, bool, str] | None = None
+    if not report_errors:
+        # Subscriptions that report errors have their own error listener
+        shared_key = (
+            template_str,
+            json.dumps(variables, sort_keys=True),
+            msg["strict"],
+            connection.user.id,
+        )
 
     @callback
     def _error_listener(level: int, template_error: str) -> None:
@@ -621,6 +682,22 @@ async def handle_render_template(
             )
             return
 
+    if shared_key is not None:
+        shared_subscriptions: dict[
+            tuple[str, str, bool, str], _SharedTemplateSubscription
+        ] = hass.data.setdefault(SHARED_TEMPLATE_SUBSCRIPTIONS, {})
+        if (shared := shared_subscriptions.get(shared_key)) is None:
+            shared = _SharedTemplateSubscription(shared_subscriptions, shared_key)
+            try:
+                shared.async_setup(hass, template_obj, variables, msg["strict"])
+            except TemplateError as ex:
+                connection.send_error(msg["id"], const.ERR_TEMPLATE_ERROR, str(ex))
+                return
+            shared_subscriptions[shared_key] = shared
+            hass.loop.call_soon_threadsafe(shared.async_refresh)
+        shared.async_subscribe(connection, msg["id"])
+        return
+
     @callback
     def _template_listener(
         event: EventType[EventStateChangedData] | None,
@@ -664,6 +741,102 @@ async def handle_render_template(
     hass.loop.call_soon_threadsafe(info.async_refresh)
 
 
+class _SharedTemplateSubscription:
+    """A template tracker shared by render_template subscriptions.
+
+    Subscriptions that render the same template with the same variables for
+    the same user share one tracker. Each result is rendered and serialized
+    once and sent to every subscriber. The tracker is removed when the last
+    subscriber unsubscribes.
+    """
+
+    __slots__ = (
+        "_shared_subscriptions",
+        "_key",
+        "_info",
+        "_last_message",
+        "_subscribers",
+    )
+
+    def __init__(
+        self,
+        shared_subscriptions: dict[
+            tuple[str, str, bool, str], _SharedTemplateSubscription
+        ],
+        key: tuple[str, str, bool, str],
+    ) -> None:
+        """Initialize the shared subscription."""
+        self._shared_subscriptions = shared_subscriptions
+        self._key = key
+        self._info: TrackTemplateResultInfo | None = None
+        self._last_message: bytes | None = None
+        self._subscribers: dict[tuple[ActiveConnection, int], None] = {}
+
+    @callback
+    def async_setup(
+        self,
+        hass: HomeAssistant,
+        template_obj: template.Template,
+        variables: dict[str, Any] | None,
+        strict: bool,
+    ) -> None:
+        """Start tracking the template."""
+        self._info = async_track_template_result(
+            hass,
+            [TrackTemplate(template_obj, variables)],
+            self._template_listener,
+            strict=strict,
+        )
+
+    @callback
+    def async_refresh(self) -> None:
+        """Render the template and send the result to every subscriber."""
+        if self._info is not None:
+            self._info.async_refresh()
+
+    @callback
+    def async_subscribe(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Add a subscriber and send it the last result."""
+        self._subscribers[(connection, msg_id)] = None
+        connection.subscriptions[msg_id] = partial(
+            self._async_unsubscribe, connection, msg_id
+        )
+        connection.send_result(msg_id)
+        if self._last_message is not None:
+            connection.send_message(
+                messages.message_with_id(self._last_message, msg_id)
+            )
+
+    @callback
+    def _async_unsubscribe(self, connection: ActiveConnection, msg_id: int) -> None:
+        """Remove a subscriber and stop tracking once there are none left."""
+        del self._subscribers[(connection, msg_id)]
+        if self._subscribers:
+            return
+        del self._shared_subscriptions[self._key]
+        if self._info is not None:
+            self._info.async_remove()
+            self._info = None
+
+    @callback
+    def _template_listener(
+        self,
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        """Send a new result to every subscriber."""
+        assert self._info is not None
+        result = updates.pop().result
+        if isinstance(result, TemplateError):
+            self._last_message = None
+            return
+        self._last_message = message = messages.partial_event_message(
+            {"result": result, "listeners": self._info.listeners}
+        )
+        for connection, msg_id in self._subscribers:
+            connection.send_message(messages.message_with_id(message, msg_id))
+
+
 def _serialize_entity_sources(
     entity_infos: dict[str, entity.EntityInfo],
 ) -> dict[str, Any]:
@@ -1,7 +1,9 @@
 """Connection session."""
 from __future__ import annotations
 
-from collections.abc import Callable, Hashable
+import asyncio
+from collections.abc import Callable, Coroutine, Generator, Hashable
+from contextlib import contextmanager
 from contextvars import ContextVar
 from typing import TYPE_CHECKING, Any
 
@@ -36,9 +38,11 @@ class ActiveConnection:
         "logger",
         "hass",
         "send_message",
+        "_wait_drained",
         "user",
         "refresh_token_id",
         "subscriptions",
+        "cancel_on_close_tasks",
         "last_id",
         "can_coalesce",
         "supported_features",
@@ -53,14 +57,17 @@ class ActiveConnection:
         send_message: Callable[[bytes | str | dict[str, Any]], None],
         user: User,
         refresh_token: RefreshToken,
+        wait_drained: Callable[[], Coroutine[Any, Any, None]] | None = None,
     ) -> None:
         """Initialize an active connection."""
         self.logger = logger
         self.hass = hass
         self.send_message = send_message
+        self._wait_drained = wait_drained
         self.user = user
         self.refresh_token_id = refresh_token.id
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
+        self.cancel_on_close_tasks: dict[int, asyncio.Task[Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
         self.supported_features: dict[str, float] = {}
@@ -86,6 +93,15 @@ class ActiveConnection:
             description += " " + describe_request(request)
         return description
 
+    async def async_wait_drained(self) -> None:
+        """Wait until the messages sent so far have been written to the client.
+
+        Commands that send a large response in many messages use this to
+        avoid queueing more messages than a slow client can read.
+        """
+        if self._wait_drained is not None:
+            await self._wait_drained()
+
     def context(self, msg: dict[str, Any]) -> Context:
         """Return a context."""
         return Context(user_id=self.user.id)
@@ -122,6 +138,21 @@ class ActiveConnection:
 
         return index + 1, unsub
 
+    @contextmanager
+    def cancel_on_close(self, msg_id: int) -> Generator[None, None, None]:
+        """Cancel the current task if the connection is closed inside the block.
+
+        This is used by commands that only fetch data, their result is not
+        needed anymore once the client has gone away.
+        """
+        task = asyncio.current_task()
+        assert task is not None
+        self.cancel_on_close_tasks[msg_id] = task
+        try:
+            yield
+        finally:
+            self.cancel_on_close_tasks.pop(msg_id, None)
+
     @callback
     def send_result(self, msg_id: int, result: Any | None = None) -> None:
         """Send a result message."""
@@ -237,6 +268,9 @@ class ActiveConnection:
                     "Error unsubscribing from subscription: %s", unsub
                 )
         self.subscriptions.clear()
+        for task in self.cancel_on_close_tasks.values():
+            task.cancel()
+        self.cancel_on_close_tasks.clear()
         self.send_message = self._connect_closed_error
         current_request.set(None)
         current_connection.set(None)
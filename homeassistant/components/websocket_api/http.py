@@ -76,6 +76,7 @@ class WebSocketHandler:
         "_connection",
         "_message_queue",
         "_ready_future",
+        "_drained_future",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -97,6 +98,8 @@ class WebSocketHandler:
         # an asyncio.Queue.
         self._message_queue: deque[bytes | None] = deque()
         self._ready_future: asyncio.Future[None] | None = None
+        # Set once the writer has sent all queued messages
+        self._drained_future: asyncio.Future[None] | None = None
 
     def __repr__(self) -> str:
         """Return the representation."""
@@ -132,6 +135,7 @@ class WebSocketHandler:
         try:
             while not wsock.closed:
                 if (messages_remaining := len(message_queue)) == 0:
+                    self._release_drained_future()
                     self._ready_future = loop.create_future()
                     await self._ready_future
                     messages_remaining = len(message_queue)
@@ -174,6 +178,31 @@ class WebSocketHandler:
             debug("%s: Writer done", self.description)
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
+            self._release_drained_future()
+
+    @callback
+    def _release_drained_future(self) -> None:
+        """Release the callers waiting for the queued messages to be sent."""
+        if (drained_future := self._drained_future) is not None:
+            self._drained_future = None
+            if not drained_future.done():
+                drained_future.set_result(None)
+
+    async def _async_wait_drained(self) -> None:
+        """Wait until the writer has sent all queued messages to the client.
+
+        Returns right away if the connection is closing.
+        """
+        if (
+            self._closing
+            or not self._message_queue
+            or (writer_task := self._writer_task) is None
+            or writer_task.done()
+        ):
+            return
+        if self._drained_future is None:
+            self._drained_future = self._hass.loop.create_future()
+        await asyncio.shield(self._drained_future)
 
     @callback
     def _cancel_peak_checker(self) -> None:
@@ -299,7 +328,13 @@ class WebSocketHandler:
 
         send_bytes_text = partial(writer.send, binary=False)
         auth = AuthPhase(
-            logger, hass, self._send_message, self._cancel, request, send_bytes_text
+            logger,
+            hass,
+            self._send_message,
+            self._cancel,
+            request,
+            send_bytes_text,
+            self._async_wait_drained,
         )
         connection = None
         disconnect_warn = None
@@ -57,6 +57,9 @@ INVALID_JSON_PARTIAL_MESSAGE = json_bytes(
         },
     }
 )
+# The invalid JSON message without the closing brace
+# so the id can be appended with _message_id_suffix
+_INVALID_JSON_PARTIAL_MESSAGE_WITHOUT_ID = INVALID_JSON_PARTIAL_MESSAGE[:-1]
 
 
 def result_message(iden: int, result: Any = None) -> dict[str, Any]:
@@ -117,27 +120,47 @@ def cached_event_message(iden: int, event: Event) -> bytes:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return b"".join(
-        (
-            _partial_cached_event_message(event)[:-1],
-            b',"id":',
-            str(iden).encode(),
-            b"}",
-        )
-    )
+    return _partial_cached_event_message(event) + _message_id_suffix(iden)
+
+
+@lru_cache(maxsize=256)
+def _message_id_suffix(iden: int) -> bytes:
+    """Return the JSON that adds the id to a partial message and closes it.
+
+    Subscriptions keep their id so the suffix is shared by every
+    message that is sent for the subscription.
+    """
+    return b"".join((b',"id":', str(iden).encode(), b"}"))
 
 
 @lru_cache(maxsize=128)
 def _partial_cached_event_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which appended
-    in cached_event_message.
+    The message is constructed without the id and the closing brace
+    which are appended in cached_event_message.
     """
-    return (
-        _message_to_json_bytes_or_none({"type": "event", "event": event.json_fragment})
-        or INVALID_JSON_PARTIAL_MESSAGE
-    )
+    if message := _message_to_json_bytes_or_none(
+        {"type": "event", "event": event.json_fragment}
+    ):
+        return message[:-1]
+    return _INVALID_JSON_PARTIAL_MESSAGE_WITHOUT_ID
+
+
+def partial_event_message(event: Any) -> bytes:
+    """Serialize an event message that is sent to multiple subscriptions.
+
+    The message is constructed without the id and the closing brace
+    which are appended with message_with_id.
+    """
+    if message := _message_to_json_bytes_or_none({"type": "event", "event": event}):
+        return message[:-1]
+    return _INVALID_JSON_PARTIAL_MESSAGE_WITHOUT_ID
+
+
+def message_with_id(partial_message: bytes, iden: int) -> bytes:
+    """Return a message from partial_event_message with the id added."""
+    return partial_message + _message_id_suffix(iden)
 
 
 def cached_state_diff_message(iden: int, event: Event) -> bytes:
@@ -149,31 +172,102 @@ def cached_state_diff_message(iden: int, event: Event) -> bytes:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
+    return _partial_cached_state_diff_message(event) + _message_id_suffix(iden)
+
+
+@lru_cache(maxsize=128)
+def _partial_cached_state_diff_message(event: Event) -> bytes:
+    """Cache and serialize the event to json.
+
+    The message is constructed without the id and the closing brace
+    which are appended in cached_state_diff_message.
+    """
+    if message := _message_to_json_bytes_or_none(
+        {"type": "event", "event": _state_diff_event(event)}
+    ):
+        return message[:-1]
+    return _INVALID_JSON_PARTIAL_MESSAGE_WITHOUT_ID
+
+
+def compact_state_diff_message(
+    iden: int, interned_entity_ids: dict[str, int], event: Event
+) -> bytes | None:
+    """Return an event message that references entity_ids by an interned id.
+
+    Entity ids are interned in the order they are first sent to the
+    client as a key of an add ("a") event, the first one gets id 0.
+    Changes ("c") and removals ("r") of interned entity_ids are keyed
+    by the id instead of the entity_id. A change of an entity_id the
+    client does not know about is sent as an add.
+
+    Returns None if there is nothing to send to the client.
+    """
+    entity_id: str = event.data["entity_id"]
+    new_state: State | None = event.data["new_state"]
+    if (interned_id := interned_entity_ids.get(entity_id)) is None:
+        if new_state is None:
+            # The client never received the entity
+            return None
+        message: bytes | None = None
+        if event.data["old_state"] is not None:
+            message = _message_to_json_bytes_or_none(
+                event_message(
+                    iden, {ENTITY_EVENT_ADD: {entity_id: new_state.as_compressed_state}}
+                )
+            )
+        elif (
+            _partial_cached_state_diff_message(event)
+            is not _INVALID_JSON_PARTIAL_MESSAGE_WITHOUT_ID
+        ):
+            message = cached_state_diff_message(iden, event)
+        if message is None:
+            # Do not intern the entity_id since the client did not receive it
+            return _invalid_json_message(iden)
+        interned_entity_ids[entity_id] = len(interned_entity_ids)
+        return message
+    if new_state is None:
+        return b"".join(
+            (
+                b'{"type":"event","event":{"r":[',
+                str(interned_id).encode(),
+                b"]}",
+                _message_id_suffix(iden),
+            )
+        )
+    if event.data["old_state"] is None:
+        # The entity was removed and added back, it keeps its id
+        return cached_state_diff_message(iden, event)
+    if (diff := _partial_cached_compact_state_diff(event)) is None:
+        return _invalid_json_message(iden)
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
-            b',"id":',
-            str(iden).encode(),
-            b"}",
+            b'{"type":"event","event":{"c":{"',
+            str(interned_id).encode(),
+            b'":',
+            diff,
+            b"}}",
+            _message_id_suffix(iden),
         )
     )
 
 
 @lru_cache(maxsize=128)
-def _partial_cached_state_diff_message(event: Event) -> bytes:
-    """Cache and serialize the event to json.
+def _partial_cached_compact_state_diff(event: Event) -> bytes | None:
+    """Cache and serialize the diff of a state_changed event to json.
 
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    Only the diff is serialized so it can be keyed by
+    the interned id in compact_state_diff_message.
     """
-    return (
-        _message_to_json_bytes_or_none(
-            {"type": "event", "event": _state_diff_event(event)}
-        )
-        or INVALID_JSON_PARTIAL_MESSAGE
+    return _message_to_json_bytes_or_none(
+        _state_diff_compressed(event.data["old_state"], event.data["new_state"])
     )
 
 
+def _invalid_json_message(iden: int) -> bytes:
+    """Return an error message for an event that can not be serialized."""
+    return _INVALID_JSON_PARTIAL_MESSAGE_WITHOUT_ID + _message_id_suffix(iden)
+
+
 def _state_diff_event(event: Event) -> dict:
     """Convert a state_changed event to the minimal version.
 
@@ -204,6 +298,17 @@ def _state_diff(
     old_state: State, new_state: State
 ) -> dict[str, dict[str, dict[str, dict[str, str | list[str]]]]]:
     """Create a diff dict that can be used to overlay changes."""
+    return {
+        ENTITY_EVENT_CHANGE: {
+            new_state.entity_id: _state_diff_compressed(old_state, new_state)
+        }
+    }
+
+
+def _state_diff_compressed(
+    old_state: State, new_state: State
+) -> dict[str, dict[str, Any]]:
+    """Create the diff of a single state that can be used to overlay changes."""
     additions: dict[str, Any] = {}
     diff: dict[str, dict[str, Any]] = {STATE_DIFF_ADDITIONS: additions}
     new_state_context = new_state.context
@@ -226,9 +331,10 @@ def _state_diff(
             additions[COMPRESSED_STATE_CONTEXT]["id"] = new_state_context.id
         else:
             additions[COMPRESSED_STATE_CONTEXT] = new_state_context.id
-    if (old_attributes := old_state.attributes) != (
+    # States that share their attributes do not need to be compared
+    if (old_attributes := old_state.attributes) is not (
         new_attributes := new_state.attributes
-    ):
+    ) and old_attributes != new_attributes:
         for key, value in new_attributes.items():
             if old_attributes.get(key) != value:
                 additions.setdefault(COMPRESSED_STATE_ATTRIBUTES, {})[key] = value
@@ -237,7 +343,7 @@ def _state_diff(
             # here if there are any values to avoid jumping into the json_encoder_default
             # for every state diff with a removed attribute
             diff[STATE_DIFF_REMOVALS] = {COMPRESSED_STATE_ATTRIBUTES: list(removed)}
-    return {ENTITY_EVENT_CHANGE: {new_state.entity_id: diff}}
+    return diff
 
 
 def _message_to_json_bytes_or_none(message: dict[str, Any]) -> bytes | None:
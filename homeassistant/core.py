@@ -1151,6 +1151,10 @@ _FilterableJobType = tuple[
     bool,  # run_immediately
 ]
 
+_KeyedListenersType = dict[
+    str, list[HassJob[[Event], Coroutine[Any, Any, None] | None]]
+]
+
 
 @dataclass(slots=True)
 class _OneTimeListener:
@@ -1179,13 +1183,18 @@ class _OneTimeListener:
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_listeners", "_match_all_listeners", "_hass")
+    __slots__ = ("_listeners", "_match_all_listeners", "_keyed_listeners", "_hass")
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[_FilterableJobType]] = {}
         self._match_all_listeners: list[_FilterableJobType] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
+        # Listeners by (event_type, data_key) and then by the value of the key
+        # along with the callback that removes the listener routing to them
+        self._keyed_listeners: dict[
+            tuple[str, str], tuple[_KeyedListenersType, CALLBACK_TYPE]
+        ] = {}
         self._hass = hass
 
     @callback
@@ -1196,6 +1205,32 @@ class EventBus:
         """
         return {key: len(listeners) for key, listeners in self._listeners.items()}
 
+    @callback
+    def async_keyed_listeners(self, event_type: str, data_key: str) -> dict[str, int]:
+        """Return dictionary with keys and the number of keyed listeners.
+
+        This method must be run in the event loop.
+        """
+        if not (keyed := self._keyed_listeners.get((event_type, data_key))):
+            return {}
+        return {key: len(jobs) for key, jobs in keyed[0].items()}
+
+    @callback
+    def async_keyed_listener_jobs(
+        self, event_type: str, data_key: str
+    ) -> Mapping[str, list[HassJob[[Event], Coroutine[Any, Any, None] | None]]]:
+        """Return the jobs of the keyed listeners by key.
+
+        The mapping is the index the events are routed with and must not
+        be changed. A new index is used once all of its listeners are
+        removed.
+
+        This method must be run in the event loop.
+        """
+        if not (keyed := self._keyed_listeners.get((event_type, data_key))):
+            return {}
+        return keyed[0]
+
     @property
     def listeners(self) -> dict[str, int]:
         """Return dictionary with events and the number of listeners."""
@@ -1330,6 +1365,105 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: str,
+        data_key: str,
+        keys: Iterable[str],
+        listener: Callable[[Event], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type with specific event data values.
+
+        The listener is called for the events where event.data[data_key]
+        is one of the keys. The events are routed with a single dict lookup
+        per event, no matter how many keyed listeners there are, so the
+        listener is never called for events with other values.
+
+        This method must be run in the event loop.
+        """
+        keys = list(keys)
+        listeners_key = (event_type, data_key)
+        if (keyed := self._keyed_listeners.get(listeners_key)) is None:
+            keyed_listeners: _KeyedListenersType = {}
+            remove_router = self._async_listen_filterable_job(
+                event_type,
+                (
+                    HassJob(
+                        functools.partial(
+                            self._async_route_keyed_event, data_key, keyed_listeners
+                        ),
+                        f"route {event_type} by {data_key}",
+                        job_type=HassJobType.Callback,
+                    ),
+                    None,
+                    True,
+                ),
+            )
+            keyed = self._keyed_listeners[listeners_key] = (
+                keyed_listeners,
+                remove_router,
+            )
+        keyed_listeners = keyed[0]
+        job = HassJob(listener, f"listen {event_type} {data_key} {keys}")
+        for key in keys:
+            if jobs := keyed_listeners.get(key):
+                jobs.append(job)
+            else:
+                keyed_listeners[key] = [job]
+        return functools.partial(
+            self._async_remove_keyed_listener, listeners_key, keys, job
+        )
+
+    @callback
+    def _async_route_keyed_event(
+        self, data_key: str, keyed_listeners: _KeyedListenersType, event: Event
+    ) -> None:
+        """Schedule the dispatch of an event to the listeners of its key."""
+        if (key := event.data.get(data_key)) in keyed_listeners:
+            self._hass.loop.call_soon(
+                self._async_dispatch_keyed_event, key, keyed_listeners, event
+            )
+
+    @callback
+    def _async_dispatch_keyed_event(
+        self, key: str, keyed_listeners: _KeyedListenersType, event: Event
+    ) -> None:
+        """Dispatch an event to the listeners of its key."""
+        if not (jobs := keyed_listeners.get(key)):
+            return
+        for job in jobs.copy():
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error running job: %s", job)
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        listeners_key: tuple[str, str],
+        keys: list[str],
+        job: HassJob[[Event], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a keyed listener.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_listeners, remove_router = self._keyed_listeners[listeners_key]
+            for key in keys:
+                keyed_listeners[key].remove(job)
+                if not keyed_listeners[key]:
+                    del keyed_listeners[key]
+        except (KeyError, ValueError):
+            # KeyError is key listeners_key or key did not exist
+            # ValueError if listener did not exist within key
+            _LOGGER.exception("Unable to remove unknown keyed listener %s", job)
+            return
+        if not keyed_listeners:
+            remove_router()
+            del self._keyed_listeners[listeners_key]
+
     def listen_once(
         self,
         event_type: str,
@@ -1418,6 +1552,10 @@ class State:
     object_id: Object id of this state.
     """
 
+    # JSON fragment of the attributes, shared with the states
+    # created from this state while the attributes are unchanged
+    _attributes_json: json_fragment | None = None
+
     def __init__(
         self,
         entity_id: str,
@@ -1523,10 +1661,25 @@ class State:
             as_dict["context"] = ReadOnlyDict(context)
         return ReadOnlyDict(as_dict)
 
+    @property
+    def _attributes_json_fragment(self) -> json_fragment:
+        """Return a JSON fragment of the attributes of the State.
+
+        The fragment is shared between states that share the
+        same attributes so it is only serialized once.
+        """
+        if (attributes_json := self._attributes_json) is None:
+            attributes_json = self._attributes_json = json_fragment(
+                json_bytes(self.attributes)
+            )
+        return attributes_json
+
     @cached_property
     def as_dict_json(self) -> bytes:
         """Return a JSON string of the State."""
-        return json_bytes(self._as_dict)
+        return json_bytes(
+            {**self._as_dict, "attributes": self._attributes_json_fragment}
+        )
 
     @cached_property
     def json_fragment(self) -> json_fragment:
@@ -1569,7 +1722,14 @@ class State:
 
         It is used for sending multiple states in a single message.
         """
-        return json_bytes({self.entity_id: self.as_compressed_state})[1:-1]
+        return json_bytes(
+            {
+                self.entity_id: {
+                    **self.as_compressed_state,
+                    COMPRESSED_STATE_ATTRIBUTES: self._attributes_json_fragment,
+                }
+            }
+        )[1:-1]
 
     @classmethod
     def from_dict(cls, json_dict: dict[str, Any]) -> Self | None:
@@ -1892,7 +2052,11 @@ class StateMachine:
             last_changed = None
         else:
             same_state = old_state.state == new_state and not force_update
-            same_attr = old_state.attributes == attributes
+            # Entities that pass the attributes of the old state
+            # back do not need the attributes compared
+            same_attr = (
+                old_state.attributes is attributes or old_state.attributes == attributes
+            )
             last_changed = old_state.last_changed if same_state else None
 
         if same_state and same_attr:
@@ -1931,6 +2095,14 @@ class StateMachine:
             old_state is None,
             state_info,
         )
+        if same_attr:
+            if TYPE_CHECKING:
+                assert old_state is not None
+            # Share the serialized attributes with the old state
+            # so they are only serialized again when they change
+            state._attributes_json = (  # pylint: disable=protected-access
+                old_state._attributes_json  # pylint: disable=protected-access
+            )
         if old_state is not None:
             old_state.expire()
         self._states[entity_id] = state
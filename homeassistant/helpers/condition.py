@@ -61,8 +61,10 @@ from . import config_validation as cv, entity_registry as er
 from .sun import get_astral_event_date
 from .template import Template, attach as template_attach, render_complex
 from .trace import (
+    NOOP_TRACE_ELEMENT,
     TraceElement,
     trace_append_element,
+    trace_enabled_cv,
     trace_path,
     trace_path_get,
     trace_stack_cv,
@@ -119,6 +121,8 @@ ConditionCheckerType = Callable[[HomeAssistant, TemplateVarsType], bool | None]
 
 def condition_trace_append(variables: TemplateVarsType, path: str) -> TraceElement:
     """Append a TraceElement to trace[path]."""
+    if not trace_enabled_cv.get():
+        return NOOP_TRACE_ELEMENT
     trace_element = TraceElement(variables, path)
     trace_append_element(trace_element)
     return trace_element
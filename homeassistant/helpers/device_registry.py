@@ -343,6 +343,8 @@ def format_mac(mac: str) -> str:
 class DeviceRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
+    _journal_collections = ("devices", "deleted_devices")
+
     async def _async_migrate_func(
         self,
         old_major_version: int,
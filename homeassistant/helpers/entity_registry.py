@@ -348,6 +348,8 @@ class DeletedRegistryEntry:
 class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
     """Store entity registry data."""
 
+    _journal_collections = ("entities", "deleted_entities")
+
     async def _async_migrate_func(
         self,
         old_major_version: int,
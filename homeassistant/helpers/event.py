@@ -48,8 +48,9 @@ from .sun import get_astral_event_next
 from .template import RenderInfo, Template, result_as_boolean
 from .typing import EventType, TemplateVarsType
 
+# The listeners of async_track_state_change_event by entity_id, this is
+# the index of the event bus and is kept for compatibility
 TRACK_STATE_CHANGE_CALLBACKS = "track_state_change_callbacks"
-TRACK_STATE_CHANGE_LISTENER = "track_state_change_listener"
 
 TRACK_STATE_ADDED_DOMAIN_CALLBACKS = "track_state_added_domain_callbacks"
 TRACK_STATE_ADDED_DOMAIN_LISTENER = "track_state_added_domain_listener"
@@ -108,6 +109,31 @@ class TrackTemplate:
     rate_limit: timedelta | None = None
 
 
+@dataclass(slots=True)
+class TemplateRenderStats:
+    """Class for statistics about the renders of a tracked template.
+
+    renders
+        The number of times the template was rendered.
+    skipped
+        The number of state changes of referenced entities that did not
+        cause a render because the template did not read what changed.
+    total_duration
+        The time spent rendering the template in seconds.
+    last_duration
+        The time the last render took in seconds.
+    last_trigger
+        The entity_id whose state change caused the last render or
+        None if the render was not caused by a state change.
+    """
+
+    renders: int = 0
+    skipped: int = 0
+    total_duration: float = 0.0
+    last_duration: float = 0.0
+    last_trigger: str | None = None
+
+
 @dataclass(slots=True)
 class TrackTemplateResult:
     """Class for result of template tracking.
@@ -273,8 +299,8 @@ def async_track_state_change_event(
 
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
-    for each one, we keep a dict of entity ids that
-    care about the state change events so we can
+    for each one, the event bus keeps a dict of entity ids
+    that care about the state change events so it can
     do a fast dict lookup to route events.
     """
     if not (entity_ids := _async_string_to_lower_list(entity_ids)):
@@ -282,36 +308,6 @@ def async_track_state_change_event(
     return _async_track_state_change_event(hass, entity_ids, action)
 
 
-@callback
-def _async_dispatch_entity_id_event(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> None:
-    """Dispatch to listeners."""
-    if not (callbacks_list := callbacks.get(event.data["entity_id"])):
-        return
-    for job in callbacks_list.copy():
-        try:
-            hass.async_run_hass_job(job, event)
-        except Exception:  # pylint: disable=broad-except
-            _LOGGER.exception(
-                "Error while dispatching event for %s to %s",
-                event.data["entity_id"],
-                job,
-            )
-
-
-@callback
-def _async_state_change_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[EventType[EventStateChangedData]], Any]]],
-    event: EventType[EventStateChangedData],
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event.data["entity_id"] in callbacks
-
-
 @bind_hass
 def _async_track_state_change_event(
     hass: HomeAssistant,
@@ -319,16 +315,20 @@ def _async_track_state_change_event(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """async_track_state_change_event without lowercasing."""
-    return _async_track_event(
-        hass,
-        entity_ids,
-        TRACK_STATE_CHANGE_CALLBACKS,
-        TRACK_STATE_CHANGE_LISTENER,
+    if not entity_ids:
+        return _remove_empty_listener
+    if isinstance(entity_ids, str):
+        entity_ids = [entity_ids]
+    remove_listener = hass.bus.async_listen_keyed(
         EVENT_STATE_CHANGED,
-        _async_dispatch_entity_id_event,
-        _async_state_change_filter,
-        action,
+        "entity_id",
+        entity_ids,
+        action,  # type: ignore[arg-type]
     )
+    hass.data[TRACK_STATE_CHANGE_CALLBACKS] = hass.bus.async_keyed_listener_jobs(
+        EVENT_STATE_CHANGED, "entity_id"
+    )
+    return remove_listener
 
 
 @callback
@@ -581,6 +581,8 @@ def _async_track_state_added_domain(
     action: Callable[[EventType[EventStateChangedData]], Any],
 ) -> CALLBACK_TYPE:
     """Track state change events when an entity is added to domains."""
+    # The event data has no domain the event bus could route by and only
+    # added entities are wanted, so domains keep their own index and filter
     return _async_track_event(
         hass,
         domains,
@@ -912,6 +914,10 @@ class TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
+        self._render_stats: dict[Template, TemplateRenderStats] = {
+            track_template_.template: TemplateRenderStats()
+            for track_template_ in track_templates
+        }
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
 
@@ -932,8 +938,8 @@ class TrackTemplateResultInfo:
         if super_template is not None:
             template = super_template.template
             variables = super_template.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._async_render_to_info(
+                template, variables, None, strict=strict, log_fn=log_fn
             )
 
             # If the super template did not render to True, don't update other templates
@@ -953,8 +959,8 @@ class TrackTemplateResultInfo:
                 continue
             template = track_template_.template
             variables = track_template_.variables
-            self._info[template] = info = template.async_render_to_info(
-                variables, strict=strict, log_fn=log_fn
+            self._info[template] = info = self._async_render_to_info(
+                template, variables, None, strict=strict, log_fn=log_fn
             )
 
             if info.exception:
@@ -990,6 +996,31 @@ class TrackTemplateResultInfo:
             "time": bool(self._time_listeners),
         }
 
+    @property
+    def render_stats(self) -> dict[str, TemplateRenderStats]:
+        """Statistics about the renders of the tracked templates."""
+        return {
+            template.template: stats for template, stats in self._render_stats.items()
+        }
+
+    def _async_render_to_info(
+        self,
+        template: Template,
+        variables: TemplateVarsType,
+        trigger: str | None,
+        **kwargs: Any,
+    ) -> RenderInfo:
+        """Render a template to info and record the render."""
+        start = time.perf_counter()
+        info = template.async_render_to_info(variables, **kwargs)
+        duration = time.perf_counter() - start
+        stats = self._render_stats[template]
+        stats.renders += 1
+        stats.total_duration += duration
+        stats.last_duration = duration
+        stats.last_trigger = trigger
+        return info
+
     @callback
     def _setup_time_listener(self, template: Template, has_time: bool) -> None:
         if not has_time:
@@ -1058,6 +1089,14 @@ class TrackTemplateResultInfo:
             if not _event_triggers_rerender(event, info):
                 return False
 
+            if not info.state_change_affects_result(
+                event.data["entity_id"],
+                event.data["old_state"],
+                event.data["new_state"],
+            ):
+                self._render_stats[template].skipped += 1
+                return False
+
             had_timer = self._rate_limit.async_has_timer(template)
 
             if self._rate_limit.async_schedule_action(
@@ -1078,8 +1117,10 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
+        self._info[template] = info = self._async_render_to_info(
+            template,
+            track_template_.variables,
+            event.data["entity_id"] if event else None,
         )
 
         try:
@@ -45,6 +45,9 @@ async def _async_process_single_integration_platform_component(
         return
 
     platform_name = integration_platform.platform_name
+    if not integration.platforms_exists((platform_name,)):
+        # The integration is known to not have the platform
+        return
 
     try:
         platform = integration.get_platform(platform_name)
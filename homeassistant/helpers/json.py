@@ -170,6 +170,17 @@ def save_json(
     atomic_writes: bool = False,
 ) -> None:
     """Save JSON data to a file."""
+    json_data = json_bytes_for_save(filename, data, encoder)
+    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
+    method(filename, json_data, private, mode="wb")
+
+
+def json_bytes_for_save(
+    filename: str,
+    data: list | dict,
+    encoder: type[json.JSONEncoder] | None = None,
+) -> bytes:
+    """Serialize JSON data that is saved to filename."""
     dump: Callable[[Any], Any]
     try:
         # For backwards compatibility, if they pass in the
@@ -178,13 +189,10 @@ def save_json(
         if encoder and encoder is not JSONEncoder:
             # If they pass a custom encoder that is not the
             # default JSONEncoder, we use the slow path of json.dumps
-            mode = "w"
             dump = json.dumps
-            json_data: str | bytes = json.dumps(data, indent=2, cls=encoder)
-        else:
-            mode = "wb"
-            dump = _orjson_default_encoder
-            json_data = _orjson_bytes_default_encoder(data)
+            return json.dumps(data, indent=2, cls=encoder).encode("utf-8")
+        dump = _orjson_default_encoder
+        return _orjson_bytes_default_encoder(data)
     except TypeError as error:
         formatted_data = format_unserializable_data(
             find_paths_unserializable_data(data, dump=dump)
@@ -193,9 +201,6 @@ def save_json(
         _LOGGER.error(msg)
         raise SerializationError(msg) from error
 
-    method = write_utf8_file_atomic if atomic_writes else write_utf8_file
-    method(filename, json_data, private, mode=mode)
-
 
 def find_paths_unserializable_data(
     bad_data: Any, *, dump: Callable[[Any], str] = json.dumps
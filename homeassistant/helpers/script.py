@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator, Callable, Mapping, Sequence
+from collections.abc import AsyncGenerator, Callable, Coroutine, Mapping, Sequence
 from contextlib import asynccontextmanager, suppress
 from contextvars import ContextVar
 from copy import copy
@@ -83,10 +83,12 @@ from .dispatcher import SignalType, async_dispatcher_connect, async_dispatcher_s
 from .event import async_call_later, async_track_template
 from .script_variables import ScriptVariables
 from .trace import (
+    NOOP_TRACE_ELEMENT,
     TraceElement,
     async_trace_path,
     script_execution_set,
     trace_append_element,
+    trace_enabled_cv,
     trace_id_get,
     trace_path,
     trace_path_get,
@@ -158,6 +160,8 @@ script_stack_cv: ContextVar[list[int] | None] = ContextVar("script_stack", defau
 
 def action_trace_append(variables, path):
     """Append a TraceElement to trace[path]."""
+    if not trace_enabled_cv.get():
+        return NOOP_TRACE_ELEMENT
     trace_element = TraceElement(variables, path)
     trace_append_element(trace_element, ACTION_TRACE_NODE_MAX_LEN)
     return trace_element
@@ -372,6 +376,36 @@ class _StopScript(_HaltScript):
         self.response = response
 
 
+class _ScriptStep:
+    """A step of a script sequence.
+
+    The parts of the step that are the same for every run are resolved
+    when the script runs for the first time.
+    """
+
+    __slots__ = (
+        "action",
+        "action_type",
+        "condition",
+        "continue_on_error",
+        "enabled",
+        "handler",
+        "trace_path",
+    )
+
+    def __init__(self, step: int, action: dict[str, Any]) -> None:
+        """Initialize the step."""
+        self.action = action
+        self.action_type = cv.determine_script_action(action)
+        self.condition: ConditionCheckerType | None = None
+        self.continue_on_error: bool = action.get(CONF_CONTINUE_ON_ERROR, False)
+        self.enabled: bool = action.get(CONF_ENABLED, True)
+        self.handler: Callable[[_ScriptRun], Coroutine[Any, Any, None]] = getattr(
+            _ScriptRun, f"_async_{self.action_type}_step"
+        )
+        self.trace_path = str(step)
+
+
 class _ScriptRun:
     """Manage Script sequence run."""
 
@@ -428,11 +462,13 @@ class _ScriptRun:
 
         try:
             self._log("Running %s", self._script.running_description)
-            for self._step, self._action in enumerate(self._script.sequence):
+            # pylint: disable-next=protected-access
+            for self._step, script_step in enumerate(self._script._get_steps()):
                 if self._stop.is_set():
                     script_execution_set("cancelled")
                     break
-                await self._async_step(log_exceptions=False)
+                self._action = script_step.action
+                await self._async_step(script_step, log_exceptions=False)
             else:
                 script_execution_set("finished")
         except _AbortScript:
@@ -461,31 +497,29 @@ class _ScriptRun:
 
         return ScriptRunResult(self._conversation_response, response, self._variables)
 
-    async def _async_step(self, log_exceptions: bool) -> None:
-        continue_on_error = self._action.get(CONF_CONTINUE_ON_ERROR, False)
-
-        with trace_path(str(self._step)):
+    async def _async_step(self, script_step: _ScriptStep, log_exceptions: bool) -> None:
+        with trace_path(script_step.trace_path):
             async with trace_action(
                 self._hass, self, self._stop, self._variables
             ) as trace_element:
                 if self._stop.is_set():
                     return
 
-                action = cv.determine_script_action(self._action)
-
-                if not self._action.get(CONF_ENABLED, True):
+                if not script_step.enabled:
                     self._log(
-                        "Skipped disabled step %s", self._action.get(CONF_ALIAS, action)
+                        "Skipped disabled step %s",
+                        self._action.get(CONF_ALIAS, script_step.action_type),
                     )
                     trace_set_result(enabled=False)
                     return
 
                 try:
-                    handler = f"_async_{action}_step"
-                    await getattr(self, handler)()
+                    await script_step.handler(self)
                 except Exception as ex:  # pylint: disable=broad-except
                     self._handle_exception(
-                        ex, continue_on_error, self._log_exceptions or log_exceptions
+                        ex,
+                        script_step.continue_on_error,
+                        self._log_exceptions or log_exceptions,
                     )
                 finally:
                     trace_element.update_variables(self._variables)
@@ -779,7 +813,10 @@ class _ScriptRun:
         self._script.last_action = self._action.get(
             CONF_ALIAS, self._action[CONF_CONDITION]
         )
-        cond = await self._async_get_condition(self._action)
+        # pylint: disable-next=protected-access
+        script_step = self._script._get_steps()[self._step]
+        if (cond := script_step.condition) is None:
+            cond = script_step.condition = await self._async_get_condition(self._action)
         try:
             trace_element = trace_stack_top(trace_stack_cv)
             if trace_element:
@@ -1291,6 +1328,7 @@ class Script:
         if script_mode == SCRIPT_MODE_QUEUED:
             self._queue_lck = asyncio.Lock()
         self._config_cache: dict[set[tuple], Callable[..., bool]] = {}
+        self._steps: list[_ScriptStep] | None = None
         self._repeat_script: dict[int, Script] = {}
         self._choose_data: dict[int, _ChooseData] = {}
         self._if_data: dict[int, _IfData] = {}
@@ -1634,6 +1672,13 @@ class Script:
             self._config_cache[config_cache_key] = cond
         return cond
 
+    def _get_steps(self) -> list[_ScriptStep]:
+        if (steps := self._steps) is None:
+            steps = self._steps = [
+                _ScriptStep(step, action) for step, action in enumerate(self.sequence)
+            ]
+        return steps
+
     def _prep_repeat_script(self, step: int) -> Script:
         action = self.sequence[step]
         step_name = action.get(CONF_ALIAS, f"Repeat at step {step+1}")
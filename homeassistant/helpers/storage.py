@@ -2,14 +2,15 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Mapping, Sequence
+from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
 import os
-from typing import TYPE_CHECKING, Any, Generic, TypeVar
+import tempfile
+from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
 
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import (
@@ -27,6 +28,7 @@ import homeassistant.util.dt as dt_util
 from homeassistant.util.file import WriteError
 
 from . import json as json_helper
+from .singleton import singleton
 
 if TYPE_CHECKING:
     from functools import cached_property
@@ -41,6 +43,12 @@ STORAGE_DIR = ".storage"
 _LOGGER = logging.getLogger(__name__)
 
 STORAGE_SEMAPHORE = "storage_semaphore"
+STORAGE_WRITER = "storage_writer"
+
+JOURNAL_SUFFIX = ".journal"
+# The journal is compacted into the data once it holds more records
+# than this fraction of the number of journaled items
+JOURNAL_MAX_RECORDS_RATIO = 0.5
 
 _T = TypeVar("_T", bound=Mapping[str, Any] | Sequence[Any])
 
@@ -85,9 +93,300 @@ async def async_migrator(
     return config
 
 
+class _PendingWrite(NamedTuple):
+    """A store write waiting for the storage writer."""
+
+    key: str
+    path: str
+    data: dict[str, Any]
+    private: bool
+    encoder: type[JSONEncoder] | None
+    atomic_writes: bool
+    future: asyncio.Future[None]
+
+
+class _StorageWriter:
+    """Write the data of all stores from a single executor job at a time.
+
+    Writes that are requested while a batch is being written are written
+    together in the next batch. The data of a batch is written to temporary
+    files which are moved into place once all of them are written. The
+    temporary files of stores with atomic writes are synced to disk, and
+    each directory they are moved into is synced once per batch.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the storage writer."""
+        self._hass = hass
+        self._pending: list[_PendingWrite] = []
+        self._write_task: asyncio.Task[None] | None = None
+        self.batches = 0
+        self.bytes_written = 0
+        self.journal_appends = 0
+        self.save_requests = 0
+        self.syncs = 0
+        self.writes = 0
+
+    @property
+    def write_stats(self) -> dict[str, float]:
+        """Return statistics about the written data.
+
+        The write amplification is the number of bytes written to disk
+        for each time a store was asked to save its data.
+        """
+        return {
+            "batches": self.batches,
+            "bytes_written": self.bytes_written,
+            "journal_appends": self.journal_appends,
+            "save_requests": self.save_requests,
+            "syncs": self.syncs,
+            "writes": self.writes,
+            "write_amplification": (
+                self.bytes_written / self.save_requests if self.save_requests else 0
+            ),
+        }
+
+    async def async_write(self, pending_write: _PendingWrite) -> None:
+        """Write the data of a store with the next batch."""
+        self._pending.append(pending_write)
+        if self._write_task is None:
+            # Not a background task, shutdown has to wait for the writes
+            self._write_task = self._hass.async_create_task(
+                self._async_write_batches(), "storage writer"
+            )
+        await pending_write.future
+
+    async def _async_write_batches(self) -> None:
+        """Write batches until no writes are pending."""
+        try:
+            while batch := self._pending:
+                self._pending = []
+                try:
+                    results = await self._hass.async_add_executor_job(
+                        self._write_batch, batch
+                    )
+                except BaseException as err:
+                    for pending_write in batch:
+                        if not pending_write.future.done():
+                            pending_write.future.set_exception(err)
+                    raise
+                for pending_write, result in zip(batch, results):
+                    if result is None:
+                        pending_write.future.set_result(None)
+                    else:
+                        pending_write.future.set_exception(result)
+        finally:
+            self._write_task = None
+
+    def _write_batch(self, batch: list[_PendingWrite]) -> list[Exception | None]:
+        """Write a batch of stores.
+
+        Returns the error of each write or None if it succeeded.
+        """
+        results: list[Exception | None] = [None] * len(batch)
+        # The index in the batch and the temporary file of each written store
+        tmp_files: dict[int, str] = {}
+        bytes_written = 0
+        try:
+            for idx, pending_write in enumerate(batch):
+                try:
+                    tmp_files[idx], size = self._write_tmp_file(pending_write)
+                except (json_util.SerializationError, WriteError) as err:
+                    results[idx] = err
+                    continue
+                bytes_written += size
+
+            directories = {
+                os.path.dirname(batch[idx].path)
+                for idx in tmp_files
+                if batch[idx].atomic_writes
+            }
+            for idx in list(tmp_files):
+                path = batch[idx].path
+                try:
+                    os.replace(tmp_files[idx], path)
+                except OSError as err:
+                    _LOGGER.exception("Saving file failed: %s", path)
+                    results[idx] = WriteError(err)
+                    continue
+                del tmp_files[idx]
+            for directory in directories:
+                _fsync_directory(directory)
+        finally:
+            for tmp_path in tmp_files.values():
+                _remove_tmp_file(tmp_path)
+
+        written = results.count(None)
+        self.batches += 1
+        self.writes += written
+        self.bytes_written += bytes_written
+        _LOGGER.debug(
+            "Wrote %s of %s stores (%s bytes) in one batch, %s",
+            written,
+            len(batch),
+            bytes_written,
+            self.write_stats,
+        )
+        return results
+
+    def _write_tmp_file(self, pending_write: _PendingWrite) -> tuple[str, int]:
+        """Write the data of a store to a temporary file next to it.
+
+        Returns the path of the temporary file and the number of bytes written.
+        """
+        path = pending_write.path
+        _LOGGER.debug("Writing data for %s to %s", pending_write.key, path)
+        json_data = json_helper.json_bytes_for_save(
+            path, pending_write.data, pending_write.encoder
+        )
+        tmp_path = ""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            # Modern versions of Python tempfile create this file with mode 0o600
+            with tempfile.NamedTemporaryFile(
+                mode="wb", dir=os.path.dirname(path), delete=False
+            ) as fdesc:
+                tmp_path = fdesc.name
+                fdesc.write(json_data)
+                if not pending_write.private:
+                    os.fchmod(fdesc.fileno(), 0o644)
+                if pending_write.atomic_writes:
+                    fdesc.flush()
+                    os.fsync(fdesc.fileno())
+                    self.syncs += 1
+        except OSError as err:
+            _LOGGER.exception("Saving file failed: %s", path)
+            if tmp_path:
+                _remove_tmp_file(tmp_path)
+            raise WriteError(err) from err
+        return tmp_path, len(json_data)
+
+
+def _fsync_directory(directory: str) -> None:
+    """Sync a directory so files that were moved into it are on disk."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError as err:
+        _LOGGER.debug("Syncing directory %s failed: %s", directory, err)
+    finally:
+        os.close(fd)
+
+
+def _remove_tmp_file(tmp_path: str) -> None:
+    """Remove a temporary file that was not moved into place."""
+    try:
+        os.remove(tmp_path)
+    except FileNotFoundError:
+        pass
+    except OSError as err:
+        # If we are cleaning up then something else went wrong, so
+        # we should suppress likely follow-on errors in the cleanup
+        _LOGGER.error("File cleanup failed for %s: %s", tmp_path, err)
+
+
+def _append_journal(path: str, lines: bytes, private: bool, sync: bool) -> None:
+    """Append lines to the journal of a store."""
+    try:
+        fd = os.open(
+            path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600 if private else 0o644
+        )
+        with open(fd, "ab") as fdesc:
+            fdesc.write(lines)
+            if sync:
+                fdesc.flush()
+                os.fsync(fdesc.fileno())
+                created = fdesc.tell() == len(lines)
+            else:
+                created = False
+    except OSError as err:
+        _LOGGER.exception("Appending to journal failed: %s", path)
+        raise WriteError(err) from err
+    if created:
+        _fsync_directory(os.path.dirname(path))
+
+
+def _read_journal(path: str) -> list[list[Any]] | None:
+    """Read the records of a journal.
+
+    Returns None if there is no journal. Lines that can not be decoded
+    are the result of an interrupted append and are skipped.
+    """
+    try:
+        with open(path, "rb") as fdesc:
+            lines = fdesc.read().splitlines()
+    except FileNotFoundError:
+        return None
+    except OSError as err:
+        _LOGGER.exception("Reading journal failed: %s", path)
+        raise HomeAssistantError(err) from err
+    records: list[list[Any]] = []
+    for line in lines:
+        if not line:
+            continue
+        try:
+            record = json_util.json_loads(line)
+        except json_util.JSON_DECODE_EXCEPTIONS:
+            _LOGGER.warning("Skipping incomplete record in journal %s", path)
+            continue
+        records.append(record)  # type: ignore[arg-type]
+    return records
+
+
+def _remove_journal(path: str) -> None:
+    """Remove the journal of a store."""
+    with suppress(FileNotFoundError):
+        os.remove(path)
+
+
+def _apply_journal_records(
+    data: dict[str, Any], records: Iterable[Sequence[Any]]
+) -> None:
+    """Apply journal records to the data of a store.
+
+    Each record is a collection, the id of an item and the item or None if
+    the item was removed.
+    """
+    collections: dict[str, dict[str, Any]] = {}
+    for collection, item_id, item in records:
+        if (items := collections.get(collection)) is None:
+            items = collections[collection] = {
+                existing["id"]: existing for existing in data.get(collection, ())
+            }
+        if item is None:
+            items.pop(item_id, None)
+        else:
+            items[item_id] = item
+    for collection, items in collections.items():
+        data[collection] = list(items.values())
+
+
+@callback
+@singleton(STORAGE_WRITER)
+def _async_get_writer(hass: HomeAssistant) -> _StorageWriter:
+    """Return the storage writer."""
+    return _StorageWriter(hass)
+
+
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> dict[str, float]:
+    """Return statistics about the data written by all stores."""
+    return _async_get_writer(hass).write_stats
+
+
 @bind_hass
 class Store(Generic[_T]):
-    """Class to help storing data."""
+    """Class to help storing data.
+
+    Subclasses can set _journal_collections to the keys of lists of items
+    with an "id" in their data. Changes to these items are then appended
+    to a journal next to the data instead of writing all of the data.
+    """
+
+    _journal_collections: tuple[str, ...] = ()
 
     def __init__(
         self,
@@ -115,12 +414,23 @@ class Store(Generic[_T]):
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        # The journaled items as they are on disk
+        self._journal_items: dict[str, dict[str, Any]] | None = None
+        self._journal_other: dict[str, Any] = {}
+        self._journal_records = 0
+        self._journal_max_records = 0
+        self._journal_partial_line = False
 
     @cached_property
     def path(self):
         """Return the config path."""
         return self.hass.config.path(STORAGE_DIR, self.key)
 
+    @cached_property
+    def journal_path(self) -> str:
+        """Return the path of the journal."""
+        return f"{self.path}{JOURNAL_SUFFIX}"
+
     async def async_load(self) -> _T | None:
         """Load data.
 
@@ -164,9 +474,12 @@ class Store(Generic[_T]):
             data = deepcopy(data)
         else:
             try:
-                data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
-                )
+                if self._journal_collections:
+                    data = await self._async_load_journaled_data()
+                else:
+                    data = await self.hass.async_add_executor_job(
+                        json_util.load_json, self.path
+                    )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
                     # If we have a JSONDecodeError, it means the file is corrupt.
@@ -257,8 +570,47 @@ class Store(Generic[_T]):
 
         return stored
 
+    async def _async_load_journaled_data(self) -> json_util.JsonValueType:
+        """Load the data and compact the journal into it."""
+        data, records = await self.hass.async_add_executor_job(
+            self._read_journaled_data
+        )
+        self._journal_records = 0
+        if not isinstance(data, dict) or not isinstance(
+            stored := data.get("data"), dict
+        ):
+            if records is not None:
+                # The journal can not be applied without the data
+                await self._async_remove_journal()
+            return data
+        if records:
+            _LOGGER.debug("Applying %s journal records to %s", len(records), self.key)
+            _apply_journal_records(stored, records)
+            try:
+                await self._async_write_data(self.path, data)
+            except (json_util.SerializationError, WriteError) as err:
+                _LOGGER.error("Error compacting journal for %s: %s", self.key, err)
+                self._journal_records = len(records)
+        if records is not None and not self._journal_records:
+            await self._async_remove_journal()
+        if (
+            data.get("version") == self.version
+            and data.get("minor_version", 1) == self.minor_version
+        ):
+            # Journal the next changes against the loaded data, which
+            # is a copy as the caller may change the data it is given
+            self._async_set_journal_base(deepcopy(stored))
+        return data
+
+    def _read_journaled_data(
+        self,
+    ) -> tuple[json_util.JsonValueType, list[list[Any]] | None]:
+        """Read the data and the records of the journal."""
+        return json_util.load_json(self.path), _read_journal(self.journal_path)
+
     async def async_save(self, data: _T) -> None:
         """Save data."""
+        _async_get_writer(self.hass).save_requests += 1
         self._data = {
             "version": self.version,
             "minor_version": self.minor_version,
@@ -282,6 +634,7 @@ class Store(Generic[_T]):
         # pylint: disable-next=import-outside-toplevel
         from .event import async_call_later
 
+        _async_get_writer(self.hass).save_requests += 1
         self._data = {
             "version": self.version,
             "minor_version": self.minor_version,
@@ -332,6 +685,24 @@ class Store(Generic[_T]):
     async def _async_callback_final_write(self, _event: Event) -> None:
         """Handle a write because Home Assistant is in final write state."""
         self._unsub_final_write_listener = None
+        if (
+            self._data is None
+            and self._journal_records
+            and (items := self._journal_items) is not None
+        ):
+            # Compact the journal before shutting down
+            self._data = {
+                "version": self.version,
+                "minor_version": self.minor_version,
+                "key": self.key,
+                "data": {
+                    **self._journal_other,
+                    **{
+                        collection: list(collection_items.values())
+                        for collection, collection_items in items.items()
+                    },
+                },
+            }
         await self._async_handle_write_data()
 
     async def _async_handle_write_data(self, *_args):
@@ -355,24 +726,155 @@ class Store(Generic[_T]):
                 return
 
             try:
-                await self._async_write_data(self.path, data)
+                if self._journal_collections:
+                    await self._async_write_journaled_data(data)
+                else:
+                    await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    async def _async_write_journaled_data(self, data: dict[str, Any]) -> None:
+        """Append the changed items to the journal or write all of the data.
+
+        All of the data is written when anything besides the journaled
+        items changed, when the journal has grown too large or when Home
+        Assistant is shutting down.
+        """
+        changes = self._journal_changes(data["data"])
+        if changes is not None:
+            records, items = changes
+            if self.hass.state not in (
+                CoreState.stopping,
+                CoreState.final_write,
+            ) and (self._journal_records + len(records) <= self._journal_max_records):
+                if records:
+                    await self._async_append_journal(records)
+                    self._journal_records += len(records)
+                    self._journal_items = items
+                    self._async_ensure_final_write_listener()
+                return
+            if records and self._journal_records:
+                # Bring the journal up to date before writing the data
+                # so replaying it on the new data does not undo anything
+                # if we stop before it is removed
+                await self._async_append_journal(records)
+                self._journal_records += len(records)
+                self._journal_items = items
+
+        await self._async_write_data(self.path, data)
+        self._async_set_journal_base(data["data"])
+        if self._journal_records:
+            await self._async_remove_journal()
+            self._journal_records = 0
+
+    def _journal_changes(
+        self, stored: Any
+    ) -> tuple[list[tuple[str, str, Any]], dict[str, dict[str, Any]]] | None:
+        """Return the journal records and journaled items of the data.
+
+        Returns None if the changes can not be journaled.
+        """
+        if (
+            (base := self._journal_items) is None
+            or not isinstance(stored, dict)
+            or any(
+                not isinstance(stored.get(collection), list)
+                for collection in self._journal_collections
+            )
+            or {
+                key: value
+                for key, value in stored.items()
+                if key not in self._journal_collections
+            }
+            != self._journal_other
+        ):
+            return None
+        records: list[tuple[str, str, Any]] = []
+        items: dict[str, dict[str, Any]] = {}
+        for collection in self._journal_collections:
+            old_items = base[collection]
+            new_items = items[collection] = {
+                item["id"]: item for item in stored[collection]
+            }
+            records.extend(
+                (collection, item_id, item)
+                for item_id, item in new_items.items()
+                if old_items.get(item_id) != item
+            )
+            records.extend(
+                (collection, item_id, None)
+                for item_id in old_items
+                if item_id not in new_items
+            )
+        return records, items
+
+    @callback
+    def _async_set_journal_base(self, stored: Any) -> None:
+        """Set the data the journal is written against."""
+        if not isinstance(stored, dict) or any(
+            not isinstance(stored.get(collection), list)
+            for collection in self._journal_collections
+        ):
+            self._journal_items = None
+            return
+        self._journal_items = {
+            collection: {item["id"]: item for item in stored[collection]}
+            for collection in self._journal_collections
+        }
+        self._journal_other = {
+            key: value
+            for key, value in stored.items()
+            if key not in self._journal_collections
+        }
+        self._journal_max_records = int(
+            sum(len(items) for items in self._journal_items.values())
+            * JOURNAL_MAX_RECORDS_RATIO
+        )
+
+    async def _async_append_journal(self, records: list[tuple[str, str, Any]]) -> None:
+        """Append records to the journal."""
+        try:
+            lines = b"".join(
+                json_helper.json_bytes(record) + b"\n" for record in records
+            )
+        except TypeError as err:
+            raise json_util.SerializationError(
+                f"Failed to serialize to JSON: {self.journal_path}: {err}"
+            ) from err
+        if self._journal_partial_line:
+            # A failed append may have left an incomplete line behind
+            lines = b"\n" + lines
+        try:
+            await self.hass.async_add_executor_job(
+                _append_journal,
+                self.journal_path,
+                lines,
+                self._private,
+                self._atomic_writes,
+            )
+        except WriteError:
+            self._journal_partial_line = True
+            raise
+        self._journal_partial_line = False
+        writer = _async_get_writer(self.hass)
+        writer.journal_appends += 1
+        writer.bytes_written += len(lines)
+
+    async def _async_remove_journal(self) -> None:
+        """Remove the journal after the data has been written."""
+        await self.hass.async_add_executor_job(_remove_journal, self.journal_path)
+
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
-
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-
-        _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
+        await _async_get_writer(self.hass).async_write(
+            _PendingWrite(
+                self.key,
+                path,
+                data,
+                self._private,
+                self._encoder,
+                self._atomic_writes,
+                self.hass.loop.create_future(),
+            )
         )
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
@@ -386,3 +888,7 @@ class Store(Generic[_T]):
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._journal_collections:
+            await self._async_remove_journal()
+            self._journal_items = None
+            self._journal_records = 0
@@ -10,10 +10,15 @@ from contextlib import AbstractContextManager, suppress
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from functools import cache, lru_cache, partial, wraps
+import hashlib
+from importlib.util import MAGIC_NUMBER
 import json
 import logging
+import marshal
 import math
+import operator
 from operator import contains
+import os
 import pathlib
 import random
 import re
@@ -25,6 +30,7 @@ from typing import (
     Any,
     Concatenate,
     Literal,
+    NamedTuple,
     NoReturn,
     ParamSpec,
     TypeVar,
@@ -46,18 +52,23 @@ import voluptuous as vol
 
 from homeassistant.const import (
     ATTR_ENTITY_ID,
+    ATTR_FRIENDLY_NAME,
     ATTR_LATITUDE,
     ATTR_LONGITUDE,
     ATTR_PERSONS,
     ATTR_UNIT_OF_MEASUREMENT,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
     EVENT_HOMEASSISTANT_START,
+    EVENT_HOMEASSISTANT_STARTED,
     EVENT_HOMEASSISTANT_STOP,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
     UnitOfLength,
+    __version__,
 )
 from homeassistant.core import (
     Context,
+    Event,
     HomeAssistant,
     State,
     callback,
@@ -74,12 +85,14 @@ from homeassistant.util import (
     slugify as slugify_util,
 )
 from homeassistant.util.async_ import run_callback_threadsafe
+from homeassistant.util.file import WriteError, write_utf8_file
 from homeassistant.util.json import JSON_DECODE_EXCEPTIONS, json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.thread import ThreadWithException
 
 from . import area_registry, device_registry, entity_registry, location as loc_helper
 from .singleton import singleton
+from .storage import STORAGE_DIR
 from .translation import async_translate_state
 from .typing import TemplateVarsType
 
@@ -93,6 +106,10 @@ _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 _ENVIRONMENT_STRICT = "template.environment_strict"
 _HASS_LOADER = "template.hass_loader"
+_CODE_CACHE = "template.code_cache"
+
+CODE_CACHE_FILE = "core.template_code_cache"
+CODE_CACHE_VERSION = 1
 
 _RE_JINJA_DELIMITERS = re.compile(r"\{%|\{\{|\{#")
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
@@ -108,15 +125,25 @@ _RESERVED_NAMES = {
 _GROUP_DOMAIN_PREFIX = "group."
 _ZONE_DOMAIN_PREFIX = "zone."
 
-_COLLECTABLE_STATE_ATTRIBUTES = {
-    "state",
-    "attributes",
-    "last_changed",
-    "last_updated",
-    "context",
-    "domain",
-    "object_id",
-    "name",
+# Parts of a state a render can depend on
+_DEPENDENCY_STATE = "state"
+_DEPENDENCY_LAST_CHANGED = "last_changed"
+_DEPENDENCY_LAST_UPDATED = "last_updated"
+# The entity_id, domain and object_id never change
+_DEPENDENCY_ENTITY_ID = "entity_id"
+_DEPENDENCY_ATTRIBUTE_PREFIX = "attributes."
+
+# Maps the properties of a state that are collected when read to the
+# part of the state they depend on, None if they depend on all of it.
+_COLLECTABLE_STATE_ATTRIBUTES: dict[str, str | None] = {
+    "state": _DEPENDENCY_STATE,
+    "attributes": None,
+    "last_changed": _DEPENDENCY_LAST_CHANGED,
+    "last_updated": _DEPENDENCY_LAST_UPDATED,
+    "context": None,
+    "domain": _DEPENDENCY_ENTITY_ID,
+    "object_id": _DEPENDENCY_ENTITY_ID,
+    "name": f"{_DEPENDENCY_ATTRIBUTE_PREFIX}{ATTR_FRIENDLY_NAME}",
 }
 
 _T = TypeVar("_T")
@@ -344,6 +371,7 @@ class RenderInfo:
         "domains",
         "domains_lifecycle",
         "entities",
+        "entity_dependencies",
         "rate_limit",
         "has_time",
     )
@@ -362,6 +390,9 @@ class RenderInfo:
         self.domains: collections.abc.Set[str] = set()
         self.domains_lifecycle: collections.abc.Set[str] = set()
         self.entities: collections.abc.Set[str] = set()
+        # The parts of the states of the entities that were read,
+        # None if the whole state was read
+        self.entity_dependencies: dict[str, set[str] | None] = {}
         self.rate_limit: timedelta | None = None
         self.has_time = False
 
@@ -404,6 +435,43 @@ class RenderInfo:
         """
         return split_entity_id(entity_id)[0] in self.domains_lifecycle
 
+    def _collect_entity(self, entity_id: str, dependency: str | None) -> None:
+        """Collect a part of the state of an entity that was read.
+
+        A dependency of None means the whole state was read.
+        """
+        self.entities.add(entity_id)  # type: ignore[attr-defined]
+        dependencies = self.entity_dependencies
+        if dependency is None:
+            dependencies[entity_id] = None
+        elif entity_id not in dependencies:
+            dependencies[entity_id] = {dependency}
+        elif (entity_dependencies := dependencies[entity_id]) is not None:
+            entity_dependencies.add(dependency)
+
+    def state_change_affects_result(
+        self, entity_id: str, old_state: State | None, new_state: State | None
+    ) -> bool:
+        """Return if a change of the state of an entity can change the result.
+
+        Entities that had only some parts of their state read during the
+        render can only change the result when one of those parts changes.
+        """
+        if (
+            old_state is None
+            or new_state is None
+            or self.all_states
+            or entity_id not in self.entity_dependencies
+            or split_entity_id(entity_id)[0] in self.domains
+        ):
+            return True
+        if (dependencies := self.entity_dependencies[entity_id]) is None:
+            return True
+        return any(
+            _state_dependency_changed(dependency, old_state, new_state)
+            for dependency in dependencies
+        )
+
     def result(self) -> str:
         """Results of the template computation."""
         if self.exception is not None:
@@ -449,6 +517,24 @@ class RenderInfo:
             self.filter = _false
 
 
+def _state_dependency_changed(
+    dependency: str, old_state: State, new_state: State
+) -> bool:
+    """Return if the part of a state a render depends on changed."""
+    if dependency == _DEPENDENCY_STATE:
+        return old_state.state != new_state.state
+    if dependency == _DEPENDENCY_LAST_CHANGED:
+        return old_state.last_changed != new_state.last_changed
+    if dependency == _DEPENDENCY_LAST_UPDATED:
+        return old_state.last_updated != new_state.last_updated
+    if dependency == _DEPENDENCY_ENTITY_ID:
+        return False
+    if dependency.startswith(_DEPENDENCY_ATTRIBUTE_PREFIX):
+        name = dependency[len(_DEPENDENCY_ATTRIBUTE_PREFIX) :]
+        return old_state.attributes.get(name) != new_state.attributes.get(name)
+    return True
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -459,6 +545,7 @@ class Template:
         "is_static",
         "_compiled_code",
         "_compiled",
+        "_fast_path",
         "_exc_info",
         "_limited",
         "_strict",
@@ -475,6 +562,7 @@ class Template:
         self.template: str = template.strip()
         self._compiled_code: CodeType | None = None
         self._compiled: jinja2.Template | None = None
+        self._fast_path: _FastPath | None = None
         self.hass = hass
         self.is_static = not is_template_string(template)
         self._exc_info: sys._OptExcInfo | None = None
@@ -570,7 +658,12 @@ class Template:
             kwargs.update(variables)
 
         try:
-            render_result = _render_with_context(self.template, compiled, **kwargs)
+            if (fast_path := self._fast_path) is not None and (
+                not kwargs or fast_path.names.isdisjoint(kwargs)
+            ):
+                render_result = _render_fast_path_with_context(self.template, fast_path)
+            else:
+                render_result = _render_with_context(self.template, compiled, **kwargs)
         except Exception as err:
             raise TemplateError(err) from err
 
@@ -798,6 +891,7 @@ class Template:
         self._compiled = jinja2.Template.from_code(
             env, self._compiled_code, env.globals, None
         )
+        self._fast_path = _compile_fast_path(env, self.template)
 
         return self._compiled
 
@@ -985,9 +1079,16 @@ class TemplateStateBase(State):
         self._collect = collect
         self._entity_id = entity_id
 
-    def _collect_state(self) -> None:
+    def _collect_state(self, dependency: str | None = None) -> None:
         if self._collect and (render_info := _render_info.get()):
-            render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+            render_info._collect_entity(  # pylint: disable=protected-access
+                self._entity_id, dependency
+            )
+
+    def _attribute(self, name: str) -> Any:
+        """Return an attribute and only collect the attribute."""
+        self._collect_state(f"{_DEPENDENCY_ATTRIBUTE_PREFIX}{name}")
+        return self._state.attributes.get(name)
 
     # Jinja will try __getitem__ first and it avoids the need
     # to call is_safe_attribute
@@ -996,7 +1097,9 @@ class TemplateStateBase(State):
         if item in _COLLECTABLE_STATE_ATTRIBUTES:
             # _collect_state inlined here for performance
             if self._collect and (render_info := _render_info.get()):
-                render_info.entities.add(self._entity_id)  # type: ignore[attr-defined]
+                render_info._collect_entity(  # pylint: disable=protected-access
+                    self._entity_id, _COLLECTABLE_STATE_ATTRIBUTES[item]
+                )
             return getattr(self._state, item)
         if item == "entity_id":
             return self._entity_id
@@ -1015,7 +1118,7 @@ class TemplateStateBase(State):
     @property
     def state(self) -> str:  # type: ignore[override]
         """Wrap State.state."""
-        self._collect_state()
+        self._collect_state(_DEPENDENCY_STATE)
         return self._state.state
 
     @property
@@ -1027,13 +1130,13 @@ class TemplateStateBase(State):
     @property
     def last_changed(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_changed."""
-        self._collect_state()
+        self._collect_state(_DEPENDENCY_LAST_CHANGED)
         return self._state.last_changed
 
     @property
     def last_updated(self) -> datetime:  # type: ignore[override]
         """Wrap State.last_updated."""
-        self._collect_state()
+        self._collect_state(_DEPENDENCY_LAST_UPDATED)
         return self._state.last_updated
 
     @property
@@ -1045,19 +1148,19 @@ class TemplateStateBase(State):
     @property
     def domain(self) -> str:  # type: ignore[override]
         """Wrap State.domain."""
-        self._collect_state()
+        self._collect_state(_DEPENDENCY_ENTITY_ID)
         return self._state.domain
 
     @property
     def object_id(self) -> str:  # type: ignore[override]
         """Wrap State.object_id."""
-        self._collect_state()
+        self._collect_state(_DEPENDENCY_ENTITY_ID)
         return self._state.object_id
 
     @property
     def name(self) -> str:
         """Wrap State.name."""
-        self._collect_state()
+        self._collect_state(_COLLECTABLE_STATE_ATTRIBUTES["name"])
         return self._state.name
 
     @property
@@ -1131,7 +1234,9 @@ _create_template_state_no_collect = partial(TemplateState, collect=False)
 
 def _collect_state(hass: HomeAssistant, entity_id: str) -> None:
     if (entity_collect := _render_info.get()) is not None:
-        entity_collect.entities.add(entity_id)  # type: ignore[attr-defined]
+        entity_collect._collect_entity(  # pylint: disable=protected-access
+            entity_id, None
+        )
 
 
 def _state_generator(
@@ -1633,7 +1738,7 @@ def is_state_attr(hass: HomeAssistant, entity_id: str, name: str, value: Any) ->
 def state_attr(hass: HomeAssistant, entity_id: str, name: str) -> Any:
     """Get a specific attribute from a state."""
     if (state_obj := _get_state(hass, entity_id)) is not None:
-        return state_obj.attributes.get(name)
+        return state_obj._attribute(name)  # pylint: disable=protected-access
     return None
 
 
@@ -2364,6 +2469,191 @@ def _render_with_context(
         return template.render(**kwargs)
 
 
+def _render_fast_path_with_context(template_str: str, fast_path: _FastPath) -> str:
+    """Store template being rendered in a ContextVar and evaluate the fast path."""
+    with _template_context_manager as cm:
+        cm.set_template(template_str, "rendering")
+        # Jinja outputs the str of the expression
+        return str(fast_path.evaluate())
+
+
+class _FastPath(NamedTuple):
+    """A template that is evaluated without rendering it with Jinja."""
+
+    evaluate: Callable[[], Any]
+    # Variables with these names shadow the functions of the template
+    names: frozenset[str]
+
+
+class _FastPathUnsupported(Exception):
+    """The template uses something the fast path does not support."""
+
+
+# The functions and filters the fast path can call, they do
+# not depend on the Jinja context of the render.
+_FAST_PATH_FUNCTIONS = {
+    "has_value",
+    "is_state",
+    "is_state_attr",
+    "state_attr",
+    "states",
+}
+_FAST_PATH_FILTERS = {"float", "int", "round"}
+# The marker pass_context sets on functions that take the Jinja context
+_JINJA_PASS_CONTEXT = getattr(pass_context(lambda _: None), "jinja_pass_arg")
+_FAST_PATH_BINARY_OPERATORS: dict[
+    type[jinja2.nodes.BinExpr], Callable[[Any, Any], Any]
+] = {
+    jinja2.nodes.Add: operator.add,
+    jinja2.nodes.Sub: operator.sub,
+    jinja2.nodes.Mul: operator.mul,
+    jinja2.nodes.Div: operator.truediv,
+    jinja2.nodes.FloorDiv: operator.floordiv,
+    jinja2.nodes.Mod: operator.mod,
+}
+_FAST_PATH_COMPARE_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq,
+    "ne": operator.ne,
+    "gt": operator.gt,
+    "gteq": operator.ge,
+    "lt": operator.lt,
+    "lteq": operator.le,
+}
+
+
+def _compile_fast_path(env: TemplateEnvironment, source: str) -> _FastPath | None:
+    """Compile a template that is a single simple expression to a function.
+
+    The fast path supports constants, calls of the state functions, a few
+    filters, arithmetic, comparisons and boolean operators, which is what
+    most templates consist of. The function produces the same result as
+    rendering with Jinja without the overhead of the sandbox.
+
+    Returns None if the template is not supported.
+    """
+    if (
+        not source.startswith("{{")
+        or not source.endswith("}}")
+        or "{%" in source
+        or "{#" in source
+    ):
+        return None
+    try:
+        body = env.parse(source).body
+    except jinja2.TemplateSyntaxError:
+        return None
+    if (
+        len(body) != 1
+        or not isinstance(output := body[0], jinja2.nodes.Output)
+        or len(output.nodes) != 1
+        or isinstance(output.nodes[0], jinja2.nodes.TemplateData)
+    ):
+        return None
+    names: set[str] = set()
+    try:
+        evaluate = _compile_fast_path_node(env, output.nodes[0], names)
+    except _FastPathUnsupported:
+        return None
+    return _FastPath(evaluate, frozenset(names))
+
+
+def _compile_fast_path_node(
+    env: TemplateEnvironment, node: jinja2.nodes.Node, names: set[str]
+) -> Callable[[], Any]:
+    """Compile an expression node to a function that evaluates it."""
+    if isinstance(node, jinja2.nodes.Const):
+        value = node.value
+        return lambda: value
+
+    if isinstance(node, jinja2.nodes.Call):
+        if (
+            not isinstance(node.node, jinja2.nodes.Name)
+            or (name := node.node.name) not in _FAST_PATH_FUNCTIONS
+            or (global_ := env.globals.get(name)) is None
+            or node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+        ):
+            raise _FastPathUnsupported
+        func = cast(Callable[..., Any], global_)
+        names.add(name)
+        args = [_compile_fast_path_node(env, arg, names) for arg in node.args]
+        if (pass_arg := getattr(func, "jinja_pass_arg", None)) is None:
+            return lambda: func(*[arg() for arg in args])
+        if pass_arg is not _JINJA_PASS_CONTEXT:
+            raise _FastPathUnsupported
+        # The hass functions ignore the Jinja context
+        return lambda: func(None, *[arg() for arg in args])
+
+    if isinstance(node, jinja2.nodes.Filter):
+        if (
+            node.node is None
+            or node.name not in _FAST_PATH_FILTERS
+            or (jinja_filter := env.filters.get(node.name)) is None
+            or hasattr(jinja_filter, "jinja_pass_arg")
+            or node.kwargs
+            or node.dyn_args
+            or node.dyn_kwargs
+        ):
+            raise _FastPathUnsupported
+        filter_ = cast(Callable[..., Any], jinja_filter)
+        value_ = _compile_fast_path_node(env, node.node, names)
+        args = [_compile_fast_path_node(env, arg, names) for arg in node.args]
+        return lambda: filter_(value_(), *[arg() for arg in args])
+
+    if isinstance(node, jinja2.nodes.And):
+        left = _compile_fast_path_node(env, node.left, names)
+        right = _compile_fast_path_node(env, node.right, names)
+        return lambda: left() and right()
+
+    if isinstance(node, jinja2.nodes.Or):
+        left = _compile_fast_path_node(env, node.left, names)
+        right = _compile_fast_path_node(env, node.right, names)
+        return lambda: left() or right()
+
+    if isinstance(node, jinja2.nodes.Not):
+        operand = _compile_fast_path_node(env, node.node, names)
+        return lambda: not operand()
+
+    if (
+        isinstance(node, jinja2.nodes.BinExpr)
+        and (binary_operator := _FAST_PATH_BINARY_OPERATORS.get(type(node))) is not None
+    ):
+        left = _compile_fast_path_node(env, node.left, names)
+        right = _compile_fast_path_node(env, node.right, names)
+        return lambda: binary_operator(left(), right())
+
+    if isinstance(node, jinja2.nodes.Compare):
+        first = _compile_fast_path_node(env, node.expr, names)
+        operands: list[tuple[Callable[[Any, Any], Any], Callable[[], Any]]] = []
+        for operand_node in node.ops:
+            if (
+                compare_operator := _FAST_PATH_COMPARE_OPERATORS.get(operand_node.op)
+            ) is None:
+                raise _FastPathUnsupported
+            operands.append(
+                (
+                    compare_operator,
+                    _compile_fast_path_node(env, operand_node.expr, names),
+                )
+            )
+
+        def _compare() -> Any:
+            """Evaluate a comparison chain like Python does."""
+            left = first()
+            result: Any = True
+            for compare_operator, right_ in operands:
+                right = right_()
+                if not (result := compare_operator(left, right)):
+                    return result
+                left = right
+            return result
+
+        return _compare
+
+    raise _FastPathUnsupported
+
+
 def make_logging_undefined(
     strict: bool | None, log_fn: Callable[[int, str], None] | None
 ) -> type[jinja2.Undefined]:
@@ -2470,6 +2760,117 @@ class HassLoader(jinja2.BaseLoader):
         return self._sources[template], template, lambda: cur_reload == self._reload
 
 
+async def async_load_code_cache(hass: HomeAssistant) -> None:
+    """Load the compiled code of the templates of the previous run.
+
+    The cache is saved once Home Assistant has started and
+    again when it is stopped.
+    """
+    code_cache = _get_code_cache(hass)
+    await code_cache.async_load()
+
+    async def _async_save(_: Event) -> None:
+        await code_cache.async_save()
+
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STARTED, _async_save)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_FINAL_WRITE, _async_save)
+
+
+@singleton(_CODE_CACHE)
+def _get_code_cache(hass: HomeAssistant) -> TemplateCodeCache:
+    return TemplateCodeCache(hass)
+
+
+class TemplateCodeCache:
+    """Cache the compiled code of templates across restarts.
+
+    The code is keyed by a hash of the template source and the flavor
+    of the environment that compiled it. Code objects are marshaled,
+    so the cache is only used with the Python, Jinja and Home Assistant
+    version that wrote it.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.path = hass.config.path(STORAGE_DIR, CODE_CACHE_FILE)
+        self.hits = 0
+        self.misses = 0
+        self._loaded: dict[str, CodeType] = {}
+        self._used: dict[str, CodeType] = {}
+        self._dirty = False
+
+    @staticmethod
+    def key(flavor: str, source: str) -> str:
+        """Return the key of the code of a template source."""
+        return f"{flavor}:{hashlib.sha256(source.encode()).hexdigest()}"
+
+    def get(self, key: str) -> CodeType | None:
+        """Return the code of a key used in this run or loaded from the previous run."""
+        if (code := self._used.get(key)) is None:
+            if (code := self._loaded.pop(key, None)) is None:
+                self.misses += 1
+                return None
+            self._used[key] = code
+        self.hits += 1
+        return code
+
+    def set(self, key: str, code: CodeType) -> None:
+        """Store the code of a template that was compiled."""
+        self._used[key] = code
+        self._dirty = True
+
+    async def async_load(self) -> None:
+        """Load the cache from disk."""
+        self._loaded = await self.hass.async_add_executor_job(self._load)
+
+    def _load(self) -> dict[str, CodeType]:
+        """Load the cache from disk in the executor."""
+        try:
+            with open(self.path, "rb") as file:
+                version, codes = marshal.load(file)
+        except FileNotFoundError:
+            return {}
+        except (OSError, EOFError, ValueError, TypeError) as err:
+            _LOGGER.debug("Unable to load template code cache: %s", err)
+            return {}
+        if version != self._version():
+            _LOGGER.debug("Discarding template code cache of another version")
+            return {}
+        if not isinstance(codes, dict):
+            _LOGGER.debug("Discarding corrupt template code cache")
+            return {}
+        return {
+            key: code
+            for key, code in codes.items()
+            if isinstance(key, str) and isinstance(code, CodeType)
+        }
+
+    async def async_save(self) -> None:
+        """Save the code of the templates used in this run to disk."""
+        _LOGGER.debug(
+            "Template code cache hits: %s, misses: %s", self.hits, self.misses
+        )
+        if not self._dirty:
+            return
+        self._dirty = False
+        data = marshal.dumps((self._version(), dict(self._used)))
+        await self.hass.async_add_executor_job(self._write, data)
+
+    def _write(self, data: bytes) -> None:
+        """Write the cache to disk in the executor."""
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        try:
+            write_utf8_file(self.path, data, private=True, mode="wb")
+        except WriteError as err:
+            _LOGGER.debug("Unable to save template code cache: %s", err)
+
+    @staticmethod
+    def _version() -> tuple[int, bytes, str, str]:
+        """Return the versions the code depends on."""
+        return (CODE_CACHE_VERSION, MAGIC_NUMBER, jinja2.__version__, __version__)
+
+
 class TemplateEnvironment(ImmutableSandboxedEnvironment):
     """The Home Assistant template environment."""
 
@@ -2483,6 +2884,12 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        if limited:
+            self._code_cache_flavor = "limited"
+        elif strict:
+            self._code_cache_flavor = "strict"
+        else:
+            self._code_cache_flavor = "normal"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | str | None
         ] = weakref.WeakValueDictionary()
@@ -2787,9 +3194,22 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             )
 
         if (cached := self.template_cache.get(source)) is None:
-            cached = self.template_cache[source] = super().compile(source)
+            cached = self.template_cache[source] = self._compile_with_code_cache(source)
 
         return cached
 
+    def _compile_with_code_cache(self, source: str | jinja2.nodes.Template) -> CodeType:
+        """Compile the template or load the code from the previous run."""
+        if self.hass is None or not isinstance(source, str):
+            return super().compile(source)
+        code_cache: TemplateCodeCache | None = self.hass.data.get(_CODE_CACHE)
+        if code_cache is None:
+            return super().compile(source)
+        key = TemplateCodeCache.key(self._code_cache_flavor, source)
+        if (code := code_cache.get(key)) is None:
+            code = super().compile(source)
+            code_cache.set(key, code)
+        return code
+
 
 _NO_HASS_ENV = TemplateEnvironment(None)
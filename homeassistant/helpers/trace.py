@@ -73,10 +73,13 @@ class TraceElement:
             variables = {}
         last_variables = self._last_variables
         variables_cv.set(dict(variables))
+        # Variables such as this and trigger are passed on unchanged
+        # from step to step, check identity first to not compare them
         changed_variables = {
             key: value
             for key, value in variables.items()
-            if key not in last_variables or last_variables[key] != value
+            if key not in last_variables
+            or (last_variables[key] is not value and last_variables[key] != value)
         }
         self._variables = changed_variables
 
@@ -99,6 +102,40 @@ class TraceElement:
         return result
 
 
+class _NoopTraceElement(TraceElement):
+    """Trace element of a run which is not recorded."""
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        """Initialize the no-op trace element."""
+        self.path = ""
+        self.reuse_by_child = False
+
+    def set_child_id(self, child_key: str, child_run_id: str) -> None:
+        """Ignore the trace id of a nested script run."""
+
+    def set_error(self, ex: Exception) -> None:
+        """Ignore the error."""
+
+    def set_result(self, **kwargs: Any) -> None:
+        """Ignore the result."""
+
+    def update_result(self, **kwargs: Any) -> None:
+        """Ignore the result."""
+
+    def update_variables(self, variables: TemplateVarsType) -> None:
+        """Ignore the variables."""
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return dictionary version of this TraceElement."""
+        return {"path": self.path}
+
+
+# Shared by every step of a run which is not recorded
+NOOP_TRACE_ELEMENT: TraceElement = _NoopTraceElement()
+
+
 # Context variables for tracing
 # Current trace
 trace_cv: ContextVar[dict[str, deque[TraceElement]] | None] = ContextVar(
@@ -118,6 +155,8 @@ variables_cv: ContextVar[Any | None] = ContextVar("variables_cv", default=None)
 trace_id_cv: ContextVar[tuple[str, str] | None] = ContextVar(
     "trace_id_cv", default=None
 )
+# If the steps of the current run are recorded
+trace_enabled_cv: ContextVar[bool] = ContextVar("trace_enabled_cv", default=True)
 # Reason for stopped script execution
 script_execution_cv: ContextVar[StopReason | None] = ContextVar(
     "script_execution_cv", default=None
@@ -183,6 +222,8 @@ def trace_append_element(
     maxlen: int | None = None,
 ) -> None:
     """Append a TraceElement to trace[path]."""
+    if not trace_enabled_cv.get():
+        return
     if (trace := trace_cv.get()) is None:
         trace = {}
         trace_cv.set(trace)
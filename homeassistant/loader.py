@@ -12,8 +12,10 @@ from dataclasses import dataclass
 import functools as ft
 import importlib
 import logging
+import os
 import pathlib
 import sys
+import threading
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, Protocol, TypedDict, TypeVar, cast
 
@@ -25,6 +27,7 @@ from awesomeversion import (
 import voluptuous as vol
 
 from . import generated
+from .const import __version__
 from .core import HomeAssistant, callback
 from .generated.application_credentials import APPLICATION_CREDENTIALS
 from .generated.bluetooth import BLUETOOTH
@@ -43,6 +46,7 @@ if TYPE_CHECKING:
     # because they would cause a circular import otherwise.
     from .config_entries import ConfigEntry
     from .helpers import device_registry as dr
+    from .helpers.storage import Store
     from .helpers.typing import ConfigType
 else:
     from .backports.functools import cached_property
@@ -54,6 +58,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_INTEGRATION_INDEX = "integration_index"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -67,6 +72,10 @@ _UNDEF = object()  # Internal; not helpers.typing.UNDEFINED due to circular depe
 
 MAX_LOAD_CONCURRENTLY = 4
 
+INTEGRATION_INDEX_STORAGE_KEY = "core.integration_index"
+INTEGRATION_INDEX_STORAGE_VERSION = 1
+INTEGRATION_INDEX_SAVE_DELAY = 60
+
 MOVED_ZEROCONF_PROPS = ("macaddress", "model", "manufacturer")
 
 
@@ -198,6 +207,133 @@ def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     }
 
 
+def _integration_stamp(integration_dir: pathlib.Path) -> list[int] | None:
+    """Return the modification times of an integration directory and manifest."""
+    try:
+        return [
+            integration_dir.stat().st_mtime_ns,
+            (integration_dir / "manifest.json").stat().st_mtime_ns,
+        ]
+    except OSError:
+        return None
+
+
+class _IntegrationIndex:
+    """Index of the manifests and top level files of resolved integrations.
+
+    Reading the index replaces reading the manifest and listing the files of
+    every integration on startup. The entries of built-in integrations are
+    valid until the version of Home Assistant changes. The entries of custom
+    integrations, and of all integrations in development versions, are
+    validated with the modification times of their directory and manifest.
+    """
+
+    def __init__(
+        self, store: Store[dict[str, Any]], entries: dict[str, dict[str, Any]]
+    ) -> None:
+        """Initialize the index."""
+        self._store = store
+        self._entries = entries
+        self._lock = threading.Lock()
+        self._changed = False
+        self._validate_built_in = "dev" in __version__
+
+    def get(
+        self, integration_dir: pathlib.Path, built_in: bool
+    ) -> tuple[Manifest, list[str]] | None:
+        """Return the manifest and top level files of an integration.
+
+        This method is thread-safe.
+        """
+        with self._lock:
+            entry = self._entries.get(str(integration_dir))
+        if entry is None or (
+            (self._validate_built_in or not built_in)
+            and entry["stamp"] != _integration_stamp(integration_dir)
+        ):
+            return None
+        return cast(Manifest, dict(entry["manifest"])), entry["files"]
+
+    def add(
+        self, integration_dir: pathlib.Path, manifest: Manifest
+    ) -> list[str] | None:
+        """Add an integration and return its top level files.
+
+        This method is thread-safe.
+        """
+        if (stamp := _integration_stamp(integration_dir)) is None:
+            return None
+        try:
+            files = sorted(os.listdir(integration_dir))
+        except OSError:
+            return None
+        with self._lock:
+            self._entries[str(integration_dir)] = {
+                "stamp": stamp,
+                "manifest": dict(manifest),
+                "files": files,
+            }
+            self._changed = True
+        return files
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the index if integrations were added."""
+        if self._changed:
+            self._changed = False
+            self._store.async_delay_save(
+                self._data_to_save, INTEGRATION_INDEX_SAVE_DELAY
+            )
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the index to save."""
+        with self._lock:
+            return {"ha_version": __version__, "integrations": dict(self._entries)}
+
+
+@callback
+def async_disable_integration_index(hass: HomeAssistant) -> None:
+    """Resolve integrations without loading or saving the integration index."""
+    hass.data[DATA_INTEGRATION_INDEX] = None
+
+
+async def _async_get_integration_index(
+    hass: HomeAssistant,
+) -> _IntegrationIndex | None:
+    """Return the cached integration index, None if it is disabled."""
+    if DATA_INTEGRATION_INDEX not in hass.data:
+        future = hass.data[DATA_INTEGRATION_INDEX] = hass.loop.create_future()
+
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        store: Store[dict[str, Any]] = Store(
+            hass, INTEGRATION_INDEX_STORAGE_VERSION, INTEGRATION_INDEX_STORAGE_KEY
+        )
+        entries: dict[str, dict[str, Any]] = {}
+        try:
+            data = await store.async_load()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Error loading the integration index")
+        else:
+            if data is not None and data.get("ha_version") == __version__:
+                entries = data["integrations"]
+        index = _IntegrationIndex(store, entries)
+
+        hass.data[DATA_INTEGRATION_INDEX] = index
+        future.set_result(index)
+        return index
+
+    index_or_future: _IntegrationIndex | asyncio.Future[
+        _IntegrationIndex
+    ] | None = hass.data[DATA_INTEGRATION_INDEX]
+    if isinstance(index_or_future, asyncio.Future):
+        return await index_or_future
+
+    return index_or_future
+
+
 async def _async_get_custom_components(
     hass: HomeAssistant,
 ) -> dict[str, Integration]:
@@ -223,12 +359,16 @@ async def _async_get_custom_components(
         get_sub_directories, custom_components.__path__
     )
 
+    index = await _async_get_integration_index(hass)
     integrations = await hass.async_add_executor_job(
         _resolve_integrations_from_root,
         hass,
         custom_components,
         [comp.name for comp in dirs],
+        index,
     )
+    if index is not None:
+        index.async_schedule_save()
     return {
         integration.domain: integration
         for integration in integrations.values()
@@ -563,28 +703,43 @@ class Integration:
 
     @classmethod
     def resolve_from_root(
-        cls, hass: HomeAssistant, root_module: ModuleType, domain: str
+        cls,
+        hass: HomeAssistant,
+        root_module: ModuleType,
+        domain: str,
+        index: _IntegrationIndex | None = None,
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        built_in = root_module.__name__ == PACKAGE_BUILTIN
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
+            integration_dir = pathlib.Path(base) / domain
+            top_level_files: list[str] | None = None
 
-            if not manifest_path.is_file():
-                continue
+            if index is not None and (indexed := index.get(integration_dir, built_in)):
+                manifest, top_level_files = indexed
+            else:
+                manifest_path = integration_dir / "manifest.json"
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
-                )
-                continue
+                if not manifest_path.is_file():
+                    continue
+
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                if index is not None:
+                    top_level_files = index.add(integration_dir, manifest)
 
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
-                manifest_path.parent,
+                integration_dir,
                 manifest,
+                top_level_files=top_level_files,
             )
 
             if integration.is_built_in:
@@ -637,6 +792,7 @@ class Integration:
         pkg_path: str,
         file_path: pathlib.Path,
         manifest: Manifest,
+        top_level_files: Iterable[str] | None = None,
     ) -> None:
         """Initialize an integration."""
         self.hass = hass
@@ -644,6 +800,10 @@ class Integration:
         self.file_path = file_path
         self.manifest = manifest
         manifest["is_built_in"] = self.is_built_in
+        # The files and directories in the integration directory, if known
+        self._top_level_files = (
+            set(top_level_files) if top_level_files is not None else None
+        )
 
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
@@ -761,6 +921,20 @@ class Integration:
         """Test if package is a built-in integration."""
         return self.pkg_path.startswith(PACKAGE_BUILTIN)
 
+    def platforms_exists(self, platform_names: Iterable[str]) -> list[str]:
+        """Return the platforms that exist for the integration.
+
+        All platforms are assumed to exist if the files of the integration
+        are not known.
+        """
+        if (files := self._top_level_files) is None:
+            return list(platform_names)
+        return [
+            platform_name
+            for platform_name in platform_names
+            if f"{platform_name}.py" in files or platform_name in files
+        ]
+
     @property
     def version(self) -> AwesomeVersion | None:
         """Return the version of the integration."""
@@ -868,13 +1042,18 @@ class Integration:
 
 
 def _resolve_integrations_from_root(
-    hass: HomeAssistant, root_module: ModuleType, domains: Iterable[str]
+    hass: HomeAssistant,
+    root_module: ModuleType,
+    domains: Iterable[str],
+    index: _IntegrationIndex | None = None,
 ) -> dict[str, Integration]:
     """Resolve multiple integrations from root."""
     integrations: dict[str, Integration] = {}
     for domain in domains:
         try:
-            integration = Integration.resolve_from_root(hass, root_module, domain)
+            integration = Integration.resolve_from_root(
+                hass, root_module, domain, index
+            )
         except Exception:  # pylint: disable=broad-except
             _LOGGER.exception("Error loading integration: %s", domain)
         else:
@@ -961,9 +1140,12 @@ async def async_get_integrations(
     if needed:
         from . import components  # pylint: disable=import-outside-toplevel
 
+        index = await _async_get_integration_index(hass)
         integrations = await hass.async_add_executor_job(
-            _resolve_integrations_from_root, hass, components, needed
+            _resolve_integrations_from_root, hass, components, needed, index
         )
+        if index is not None:
+            index.async_schedule_save()
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
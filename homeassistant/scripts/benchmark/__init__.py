@@ -6,6 +6,8 @@ import asyncio
 import collections
 from collections.abc import Callable
 from contextlib import suppress
+from datetime import timedelta
+from functools import partial
 import json
 import logging
 from timeit import default_timer as timer
@@ -19,6 +21,7 @@ from homeassistant.helpers.event import (
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP, JSONEncoder
+import homeassistant.util.dt as dt_util
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -227,6 +230,50 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_event_helper_10k_listeners(hass):
+    """Run a million events through 10,000 state changed event helpers.
+
+    Each helper tracks its own entity, so every event is routed to exactly
+    one of the listeners.
+    """
+    count = 0
+    entity_id = "light.kitchen"
+    listeners = 10**4
+    events_to_fire = 10**6
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(listeners):
+        async_track_state_change_event(hass, f"{entity_id}{idx}", listener)
+
+    old_state = core.State(entity_id, "off")
+    new_state = core.State(entity_id, "on")
+    events_data = [
+        {
+            "entity_id": f"{entity_id}{idx}",
+            "old_state": old_state,
+            "new_state": new_state,
+        }
+        for idx in range(listeners)
+    ]
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % listeners])
+
+    start = timer()
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def filtering_entity_id(hass):
     """Run a 100k state changes through entity filter."""
@@ -314,6 +361,179 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def websocket_event_fanout(hass):
+    """Forward 10000 state changes to 50 websocket connections.
+
+    Each connection subscribes to the events and the entities
+    like the frontend does.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.auth.models import User
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.websocket_api import commands
+
+    sent_bytes = 0
+
+    @core.callback
+    def send_message(message):
+        """Count the bytes sent to a connection."""
+        nonlocal sent_bytes
+        sent_bytes += len(message)
+
+    user = User(name="Benchmark", perm_lookup=None, is_owner=True, is_active=True)
+    for msg_id in range(50):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                # pylint: disable-next=protected-access
+                commands._forward_events_unconditional,
+                send_message,
+                msg_id,
+            ),
+            run_immediately=True,
+        )
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED,
+            partial(
+                # pylint: disable-next=protected-access
+                commands._forward_entity_changes,
+                send_message,
+                set(),
+                user,
+                msg_id,
+                None,
+            ),
+            run_immediately=True,
+        )
+
+    start = timer()
+    for idx in range(10**4):
+        hass.states.async_set(
+            "sensor.power", str(idx), {"unit_of_measurement": "W", "icon": "mdi:flash"}
+        )
+    runtime = timer() - start
+    print(f"Sent {sent_bytes} bytes")
+    return runtime
+
+
+@benchmark
+async def template_fast_path(hass):
+    """Render 10000 simple templates with and without the fast path."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.template import Template
+
+    hass.states.async_set("sensor.power", "42.5", {"unit_of_measurement": "W"})
+    templates = [
+        Template(template_string, hass)
+        for template_string in (
+            "{{ states('sensor.power') | float(0) * 2 }}",
+            "{{ is_state('sensor.power', '42.5') and has_value('sensor.power') }}",
+            "{{ state_attr('sensor.power', 'unit_of_measurement') }}",
+            "{{ 10 < states('sensor.power') | float < 100 }}",
+        )
+    ]
+    for tpl in templates:
+        tpl.ensure_valid()
+        tpl.async_render()
+
+    start = timer()
+    for _ in range(10**4):
+        for tpl in templates:
+            tpl.async_render()
+    runtime = timer() - start
+
+    for tpl in templates:
+        # pylint: disable-next=protected-access
+        tpl._fast_path = None
+    jinja_start = timer()
+    for _ in range(10**4):
+        for tpl in templates:
+            tpl.async_render()
+    print(f"Rendering with Jinja took {timer() - jinja_start:.3f}s")
+    return runtime
+
+
+@benchmark
+async def script_ten_steps(hass):
+    """Run a script with 10 steps 10000 times."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.helpers.script import Script
+
+    await er.async_load(hass)
+
+    @core.callback
+    def noop_service(call):
+        """Handle a service call."""
+
+    hass.services.async_register("benchmark", "noop", noop_service)
+    hass.states.async_set("binary_sensor.motion", "on")
+    hass.states.async_set("light.kitchen", "off")
+    sequence = [
+        {"variables": {"brightness": 255}},
+        {"condition": "state", "entity_id": "binary_sensor.motion", "state": "on"},
+        {"condition": "template", "value_template": "{{ brightness > 100 }}"},
+        {"service": "benchmark.noop", "target": {"entity_id": "light.kitchen"}},
+        {"event": "benchmark_event", "event_data": {"step": 5}},
+        {
+            "service": "benchmark.noop",
+            "data": {"brightness": "{{ brightness }}"},
+            "target": {"entity_id": "light.kitchen"},
+        },
+        {"condition": "state", "entity_id": "light.kitchen", "state": "off"},
+        {"event": "benchmark_event", "event_data": {"step": 8}, "enabled": False},
+        {"service": "benchmark.noop", "continue_on_error": True},
+        {"event": "benchmark_event", "event_data": {"step": 10}},
+    ]
+    script = Script(hass, cv.SCRIPT_SCHEMA(sequence), "Benchmark", "benchmark")
+
+    start = timer()
+    for _ in range(10**4):
+        await script.async_run(context=core.Context())
+    return timer() - start
+
+
+@benchmark
+async def sensor_time_weighted_average(hass):
+    """Compile the time weighted average of 1000 sensor states 1000 times.
+
+    The states are columns of database rows like the ones the sensor
+    statistics are compiled from.
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.recorder.models.state_attributes import (
+        decode_attributes_from_source,
+    )
+
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components.sensor.recorder import (
+        _entity_columns_to_float_and_timestamp,
+        _time_weighted_average,
+    )
+
+    end = dt_util.utcnow()
+    start = end - timedelta(minutes=5)
+    start_ts = start.timestamp()
+    states = [str(idx % 100) for idx in range(1000)]
+    timestamps = [start_ts + idx * 0.3 for idx in range(1000)]
+    attributes = ['{"unit_of_measurement": "W"}'] * 1000
+
+    bench_start = timer()
+    for _ in range(1000):
+        attr_cache: dict[str, dict] = {}
+        fstates, _units = _entity_columns_to_float_and_timestamp(
+            states,
+            timestamps,
+            [decode_attributes_from_source(attrs, attr_cache) for attrs in attributes],
+        )
+        _time_weighted_average(fstates, start, end)
+    return timer() - bench_start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
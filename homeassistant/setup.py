@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Generator, Iterable
 import contextlib
+from dataclasses import dataclass, field
 from datetime import timedelta
 import logging.handlers
 from timeit import default_timer as timer
@@ -53,6 +54,16 @@ DATA_SETUP_STARTED = "setup_started"
 # setting up a component.
 DATA_SETUP_TIME = "setup_time"
 
+# DATA_SETUP_EARLY_DOMAINS is a set[str] of domains which are set up early
+# during bootstrap. Early domains only wait for after dependencies which are
+# early domains too.
+DATA_SETUP_EARLY_DOMAINS = "setup_early_domains"
+
+# DATA_SETUP_TIMINGS is a dict[str, SetupTiming], indicating when the setup
+# of a component was requested, when its dependencies were set up and when
+# it finished.
+DATA_SETUP_TIMINGS = "setup_timings"
+
 DATA_DEPS_REQS = "deps_reqs_processed"
 
 DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
@@ -66,6 +77,16 @@ SLOW_SETUP_WARNING = 10
 SLOW_SETUP_MAX_WAIT = 300
 
 
+@dataclass(slots=True)
+class SetupTiming:
+    """Timestamps of the setup of a component."""
+
+    queued: float
+    dependencies_done: float | None = None
+    done: float | None = None
+    waited_for: list[str] = field(default_factory=list)
+
+
 @callback
 def async_notify_setup_error(
     hass: HomeAssistant, component: str, display_link: str | None = None
@@ -97,15 +118,21 @@ def async_notify_setup_error(
 
 
 @core.callback
-def async_set_domains_to_be_loaded(hass: core.HomeAssistant, domains: set[str]) -> None:
+def async_set_domains_to_be_loaded(
+    hass: core.HomeAssistant, domains: set[str], *, early: bool = False
+) -> None:
     """Set domains that are going to be loaded from the config.
 
     This allow us to:
      - Properly handle after_dependencies.
      - Keep track of domains which will load but have not yet finished loading
+
+    Early domains do not wait for after dependencies that are not early.
     """
     hass.data.setdefault(DATA_SETUP_DONE, {})
     hass.data[DATA_SETUP_DONE].update({domain: asyncio.Event() for domain in domains})
+    if early:
+        hass.data.setdefault(DATA_SETUP_EARLY_DOMAINS, set()).update(domains)
 
 
 def setup_component(hass: core.HomeAssistant, domain: str, config: ConfigType) -> bool:
@@ -130,6 +157,7 @@ async def async_setup_component(
     if domain in setup_tasks:
         return await setup_tasks[domain]
 
+    hass.data.setdefault(DATA_SETUP_TIMINGS, {})[domain] = SetupTiming(timer())
     task = setup_tasks[domain] = hass.async_create_task(
         _async_setup_component(hass, domain, config), f"setup component {domain}"
     )
@@ -137,6 +165,8 @@ async def async_setup_component(
     try:
         return await task
     finally:
+        if (timing := hass.data[DATA_SETUP_TIMINGS].get(domain)) is not None:
+            timing.done = timer()
         if domain in hass.data.get(DATA_SETUP_DONE, {}):
             hass.data[DATA_SETUP_DONE].pop(domain).set()
 
@@ -156,11 +186,14 @@ async def _async_process_dependencies(
 
     after_dependencies_tasks = {}
     to_be_loaded = hass.data.get(DATA_SETUP_DONE, {})
+    early_domains: set[str] = hass.data.get(DATA_SETUP_EARLY_DOMAINS, set())
+    only_early = integration.domain in early_domains
     for dep in integration.after_dependencies:
         if (
             dep not in dependencies_tasks
             and dep in to_be_loaded
             and dep not in hass.config.components
+            and (not only_early or dep in early_domains)
         ):
             after_dependencies_tasks[dep] = hass.loop.create_task(
                 to_be_loaded[dep].wait()
@@ -187,6 +220,12 @@ async def _async_process_dependencies(
             *dependencies_tasks.values(), *after_dependencies_tasks.values()
         )
 
+    if (
+        timing := hass.data.get(DATA_SETUP_TIMINGS, {}).get(integration.domain)
+    ) is not None and timing.dependencies_done is None:
+        timing.waited_for = [*dependencies_tasks, *after_dependencies_tasks]
+        timing.dependencies_done = timer()
+
     failed = [
         domain for idx, domain in enumerate(dependencies_tasks) if not results[idx]
     ]
@@ -244,6 +283,11 @@ async def _async_setup_component(
     except HomeAssistantError as err:
         log_error(str(err))
         return False
+    finally:
+        if (
+            timing := hass.data.get(DATA_SETUP_TIMINGS, {}).get(domain)
+        ) is not None and timing.dependencies_done is None:
+            timing.dependencies_done = timer()
 
     # Some integrations fail on import because they call functions incorrectly.
     # So we do it before validating config to catch these errors.
@@ -572,3 +616,74 @@ def async_start_setup(
             setup_time[integration] += time_taken
         else:
             setup_time[integration] = time_taken
+
+
+@callback
+def async_get_setup_critical_path(hass: core.HomeAssistant) -> list[str]:
+    """Return the setups that bounded the setup of the last finished component.
+
+    Starting from the component that finished last, each component is
+    preceded by the dependency it waited for that finished last.
+    """
+    timings: dict[str, SetupTiming] = {
+        domain: timing
+        for domain, timing in hass.data.get(DATA_SETUP_TIMINGS, {}).items()
+        if timing.done is not None
+    }
+    if not timings:
+        return []
+    domain = max(timings, key=lambda domain: timings[domain].done or 0)
+    path = [domain]
+    while waited_for := [
+        dep for dep in timings[domain].waited_for if dep in timings and dep not in path
+    ]:
+        domain = max(waited_for, key=lambda dep: timings[dep].done or 0)
+        path.append(domain)
+    path.reverse()
+    return path
+
+
+@callback
+def async_get_setup_trace(hass: core.HomeAssistant) -> dict[str, Any]:
+    """Return the setup timings in the Chrome trace event format.
+
+    Every component has its own row with the time spent waiting for its
+    dependencies and the time spent setting it up.
+    """
+    timings: dict[str, SetupTiming] = hass.data.get(DATA_SETUP_TIMINGS, {})
+    events: list[dict[str, Any]] = []
+    if not timings:
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+    critical_path = set(async_get_setup_critical_path(hass))
+    start = min(timing.queued for timing in timings.values())
+    for tid, (domain, timing) in enumerate(
+        sorted(timings.items(), key=lambda item: item[1].queued)
+    ):
+        dependencies_done = timing.dependencies_done or timing.queued
+        if dependencies_done > timing.queued:
+            events.append(
+                {
+                    "name": f"{domain} (dependencies)",
+                    "cat": "dependencies",
+                    "ph": "X",
+                    "ts": round((timing.queued - start) * 1e6),
+                    "dur": round((dependencies_done - timing.queued) * 1e6),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"waited_for": timing.waited_for},
+                }
+            )
+        if timing.done is not None:
+            events.append(
+                {
+                    "name": domain,
+                    "cat": "setup",
+                    "ph": "X",
+                    "ts": round((dependencies_done - start) * 1e6),
+                    "dur": round((timing.done - dependencies_done) * 1e6),
+                    "pid": 1,
+                    "tid": tid,
+                    "args": {"critical_path": domain in critical_path},
+                }
+            )
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
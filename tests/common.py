@@ -160,6 +160,8 @@ def get_test_home_assistant() -> Generator[HomeAssistant, None, None]:
     asyncio.set_event_loop(loop)
     context_manager = async_test_home_assistant(loop)
     hass = loop.run_until_complete(context_manager.__aenter__())
+    # Storage is not mocked, keep the integration index out of the test config dir
+    loader.async_disable_integration_index(hass)
 
     loop_stop_event = threading.Event()
 
@@ -1319,9 +1321,23 @@ def mock_storage(
             dump = _orjson_default_encoder
         data[store.key] = json.loads(dump(data_to_write))
 
+    async def mock_append_journal(
+        store: storage.Store, records: list[tuple[str, str, Any]]
+    ) -> None:
+        """Mock version of appending to the journal."""
+        _LOGGER.debug("Appending journal records to %s: %s", store.key, records)
+        raise_contains_mocks(records)
+        storage._apply_journal_records(
+            data[store.key]["data"], json.loads(_orjson_default_encoder(records))
+        )
+
+    async def mock_remove_journal(store: storage.Store) -> None:
+        """Mock version of removing the journal."""
+
     async def mock_remove(store: storage.Store) -> None:
         """Remove data."""
         data.pop(store.key, None)
+        store._journal_items = None
 
     with patch(
         "homeassistant.helpers.storage.Store._async_load",
@@ -1331,6 +1347,14 @@ def mock_storage(
         "homeassistant.helpers.storage.Store._async_write_data",
         side_effect=mock_write_data,
         autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store._async_append_journal",
+        side_effect=mock_append_journal,
+        autospec=True,
+    ), patch(
+        "homeassistant.helpers.storage.Store._async_remove_journal",
+        side_effect=mock_remove_journal,
+        autospec=True,
     ), patch(
         "homeassistant.helpers.storage.Store.async_remove",
         side_effect=mock_remove,
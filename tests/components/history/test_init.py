@@ -446,6 +446,42 @@ async def test_fetch_period_api_with_minimal_response(
     ).replace('"', "")
 
 
+async def test_fetch_period_api_with_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test the fetch period view downsamples numeric states with max_points."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+
+    for value in range(20):
+        hass.states.async_set("sensor.power", value % 2 * value)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_client()
+    response = await client.get(
+        f"/api/history/period/{now.isoformat()}",
+        params={
+            "filter_entity_id": "sensor.power",
+            "end_time": end_time.isoformat(),
+            "max_points": "4",
+        },
+    )
+    assert response.status == HTTPStatus.OK
+    state_list = (await response.json())[0]
+    assert 2 <= len(state_list) <= 6
+    assert state_list[0]["state"] == "0"
+    assert state_list[-1]["state"] == "19"
+
+    for max_points in ("1", "INVALID"):
+        response = await client.get(
+            f"/api/history/period/{now.isoformat()}",
+            params={"filter_entity_id": "sensor.power", "max_points": max_points},
+        )
+        assert response.status == HTTPStatus.BAD_REQUEST
+        assert await response.json() == {"message": "Invalid max_points"}
+
+
 async def test_fetch_period_api_with_no_timestamp(
     recorder_mock: Recorder, hass: HomeAssistant, hass_client: ClientSessionGenerator
 ) -> None:
@@ -9,6 +9,7 @@ import pytest
 from homeassistant.components import history
 from homeassistant.components.history import websocket_api
 from homeassistant.components.recorder import Recorder
+from homeassistant.components.websocket_api.connection import ActiveConnection
 from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
@@ -230,6 +231,208 @@ async def test_history_during_period_impossible_conditions(
     assert response["result"] == {}
 
 
+async def test_history_during_period_chunked(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period sends the states in chunks."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for state in ("on", "off", "on", "off", "on"):
+        hass.states.async_set("sensor.one", state, attributes={"any": state})
+        hass.states.async_set("sensor.two", state, attributes={"any": state})
+        await async_recorder_block_till_done(hass)
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    for minimal_response in (False, True):
+        request = {
+            "type": "history/history_during_period",
+            "start_time": now.isoformat(),
+            "entity_ids": ["sensor.one", "sensor.two"],
+            "significant_changes_only": False,
+            "minimal_response": minimal_response,
+        }
+        await client.send_json_auto_id(request)
+        response = await client.receive_json()
+        assert response["success"]
+        expected = response["result"]
+        assert len(expected["sensor.one"]) == 5
+
+        with patch.object(websocket_api, "MAX_STATES_PER_HISTORY_CHUNK", 2):
+            await client.send_json_auto_id({**request, "chunked": True})
+            response = await client.receive_json()
+            assert response["success"]
+            assert response["result"] is None
+
+            states: dict[str, list] = {}
+            chunks = 0
+            done = False
+            while not done:
+                response = await client.receive_json()
+                assert response["type"] == "event"
+                done = response["event"]["done"]
+                chunk = response["event"]["states"]
+                assert sum(len(chunk_states) for chunk_states in chunk.values()) <= 2
+                for entity_id, chunk_states in chunk.items():
+                    states.setdefault(entity_id, []).extend(chunk_states)
+                chunks += 1
+
+        assert chunks == 5
+        assert states == expected
+
+    await client.send_json_auto_id(
+        {
+            "type": "history/history_during_period",
+            "start_time": (now + timedelta(days=1)).isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response["event"] == {"states": {}, "done": True}
+
+
+async def test_history_during_period_chunked_many_chunks(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test each chunk is sent before the next one is fetched."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(50):
+        hass.states.async_set("sensor.one", str(value))
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "MAX_STATES_PER_HISTORY_CHUNK", 1), patch(
+        "homeassistant.components.websocket_api.http.MAX_PENDING_MSG", 5
+    ):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "minimal_response": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+
+        states: list[dict] = []
+        done = False
+        while not done:
+            response = await client.receive_json()
+            done = response["event"]["done"]
+            states.extend(response["event"]["states"].get("sensor.one", []))
+
+    assert [state["s"] for state in states] == [str(value) for value in range(50)]
+
+
+async def test_history_during_period_chunked_waits_for_client(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the next chunk is only fetched once the client has read the last one."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(5):
+        hass.states.async_set("sensor.one", str(value))
+    await async_wait_recording_done(hass)
+
+    waits = 0
+    wait_cancelled = asyncio.Event()
+
+    async def _wait_drained_forever(_connection: ActiveConnection) -> None:
+        nonlocal waits
+        waits += 1
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            wait_cancelled.set()
+            raise
+
+    client = await hass_ws_client()
+    with patch.object(websocket_api, "MAX_STATES_PER_HISTORY_CHUNK", 1), patch.object(
+        websocket_api, "HISTORY_CHUNK_ABORT_CHECK_INTERVAL", 0.01
+    ), patch.object(ActiveConnection, "async_wait_drained", _wait_drained_forever):
+        await client.send_json_auto_id(
+            {
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "significant_changes_only": False,
+                "minimal_response": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+        assert response["event"]["done"] is False
+        await asyncio.sleep(0.1)
+        assert waits == 1
+
+        # The read job stops waiting once the client has gone away
+        read_jobs_cancelled = recorder_mock.read_jobs_cancelled
+        await client.close()
+        async with asyncio.timeout(5):
+            await wait_cancelled.wait()
+        assert recorder_mock.read_jobs_cancelled == read_jobs_cancelled + 1
+        assert waits == 1
+
+
+async def test_history_during_period_max_points(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test history_during_period downsamples numeric states with max_points."""
+    now = dt_util.utcnow()
+
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    for value in range(20):
+        hass.states.async_set("sensor.power", value % 2 * value)
+    await async_wait_recording_done(hass)
+    end_time = dt_util.utcnow()
+
+    client = await hass_ws_client()
+    request = {
+        "type": "history/history_during_period",
+        "start_time": now.isoformat(),
+        "end_time": end_time.isoformat(),
+        "entity_ids": ["sensor.power"],
+        "minimal_response": True,
+        "max_points": 4,
+    }
+    await client.send_json_auto_id(request)
+    response = await client.receive_json()
+    assert response["success"]
+    states = response["result"]["sensor.power"]
+    # The first and last state and the minimum and maximum of 2 buckets
+    assert 2 <= len(states) <= 6
+    assert states[0]["s"] == "0"
+    assert states[-1]["s"] == "19"
+
+    await client.send_json_auto_id({**request, "chunked": True})
+    response = await client.receive_json()
+    assert response["success"]
+    response = await client.receive_json()
+    assert response["event"] == {"states": {"sensor.power": states}, "done": True}
+
+    await client.send_json_auto_id({**request, "max_points": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "invalid_format"
+
+
 @pytest.mark.parametrize(
     "time_zone", ["UTC", "Europe/Berlin", "America/Chicago", "US/Hawaii"]
 )
@@ -46,6 +46,7 @@ async def test_entry_diagnostics(
     await get_diagnostics_for_config_entry(hass, hass_client, config_entry)
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
+        "message_statistics": ANY,
         "devices": [],
         "mqtt_config": default_config,
         "mqtt_debug_info": {"entities": [], "triggers": []},
@@ -130,6 +131,7 @@ async def test_entry_diagnostics(
 
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
+        "message_statistics": ANY,
         "devices": [expected_device],
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
@@ -139,6 +141,7 @@ async def test_entry_diagnostics(
         hass, hass_client, config_entry, device_entry
     ) == {
         "connected": True,
+        "message_statistics": ANY,
         "device": expected_device,
         "mqtt_config": default_config,
         "mqtt_debug_info": expected_debug_info,
@@ -257,6 +260,7 @@ async def test_redact_diagnostics(
     await get_diagnostics_for_config_entry(hass, hass_client, config_entry)
     assert await get_diagnostics_for_config_entry(hass, hass_client, config_entry) == {
         "connected": True,
+        "message_statistics": ANY,
         "devices": [expected_device],
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
@@ -266,6 +270,7 @@ async def test_redact_diagnostics(
         hass, hass_client, config_entry, device_entry
     ) == {
         "connected": True,
+        "message_statistics": ANY,
         "device": expected_device,
         "mqtt_config": expected_config,
         "mqtt_debug_info": expected_debug_info,
@@ -9,12 +9,17 @@ from typing import Any, TypedDict
 from unittest.mock import ANY, MagicMock, call, mock_open, patch
 
 from freezegun.api import FrozenDateTimeFactory
+from paho.mqtt.client import MQTTMessage
 import pytest
 import voluptuous as vol
 
 from homeassistant.components import mqtt
 from homeassistant.components.mqtt import debug_info
-from homeassistant.components.mqtt.client import EnsureJobAfterCooldown
+from homeassistant.components.mqtt.client import (
+    EnsureJobAfterCooldown,
+    Subscription,
+    SubscriptionTrie,
+)
 from homeassistant.components.mqtt.mixins import MQTT_ENTITY_DEVICE_INFO_SCHEMA
 from homeassistant.components.mqtt.models import MessageCallbackType, ReceiveMessage
 from homeassistant.config_entries import ConfigEntryDisabler, ConfigEntryState
@@ -29,7 +34,7 @@ from homeassistant.const import (
     UnitOfTemperature,
 )
 import homeassistant.core as ha
-from homeassistant.core import CoreState, HomeAssistant, callback
+from homeassistant.core import CoreState, HassJob, HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import device_registry as dr, entity_registry as er, template
 from homeassistant.helpers.entity import Entity
@@ -1314,6 +1319,174 @@ async def test_subscribe_special_characters(
     assert calls[0].payload == payload
 
 
+def test_subscription_trie() -> None:
+    """Test matching topics against the wildcard subscription trie."""
+    trie = SubscriptionTrie()
+    subscriptions = {
+        topic: Subscription(topic, HassJob(lambda msg: None))
+        for topic in (
+            "#",
+            "+",
+            "home/#",
+            "home/+/state",
+            "home/+/+",
+            "+/kitchen/#",
+            "$SYS/#",
+        )
+    }
+    for subscription in subscriptions.values():
+        trie.add(subscription)
+
+    def _matches(topic: str) -> set[str]:
+        return {subscription.topic for subscription in trie.match(topic)}
+
+    assert _matches("home") == {"#", "+", "home/#"}
+    assert _matches("home/kitchen/state") == {
+        "#",
+        "home/#",
+        "home/+/state",
+        "home/+/+",
+        "+/kitchen/#",
+    }
+    assert _matches("home/kitchen") == {"#", "home/#", "+/kitchen/#"}
+    assert _matches("home/kitchen/light/state") == {"#", "home/#", "+/kitchen/#"}
+    assert _matches("$SYS/broker/uptime") == {"$SYS/#"}
+    assert _matches("$SYS") == {"$SYS/#"}
+    assert "home/+/state" in trie
+    assert "home/+" not in trie
+
+    trie.remove(subscriptions["home/+/state"])
+    assert "home/+/state" not in trie
+    assert _matches("home/kitchen/state") == {
+        "#",
+        "home/#",
+        "home/+/+",
+        "+/kitchen/#",
+    }
+    with pytest.raises(ValueError):
+        trie.remove(subscriptions["home/+/state"])
+
+    for topic in ("#", "+", "home/#", "home/+/+", "+/kitchen/#", "$SYS/#"):
+        trie.remove(subscriptions[topic])
+    assert not list(trie)
+    assert _matches("home/kitchen/state") == set()
+
+
+async def test_subscribe_many_wildcard_topics(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test matching is updated without flushing when subscriptions change."""
+    await mqtt_mock_entry()
+    unsubs = [
+        await mqtt.async_subscribe(hass, f"zigbee2mqtt/device_{idx}/+", record_calls)
+        for idx in range(100)
+    ]
+
+    async_fire_mqtt_message(hass, "zigbee2mqtt/device_42/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0].topic == "zigbee2mqtt/device_42/state"
+
+    unsubs[42]()
+    async_fire_mqtt_message(hass, "zigbee2mqtt/device_42/state", "off")
+    async_fire_mqtt_message(hass, "zigbee2mqtt/device_43/state", "off")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert calls[1].topic == "zigbee2mqtt/device_43/state"
+
+    await mqtt.async_subscribe(hass, "zigbee2mqtt/#", record_calls)
+    async_fire_mqtt_message(hass, "zigbee2mqtt/device_42/state", "on")
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert calls[2].subscribed_topic == "zigbee2mqtt/#"
+
+
+async def test_inbound_messages_are_drained_in_bulk(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    mqtt_client_mock: MqttMockPahoClient,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test a burst of inbound messages is handled in one event loop wakeup."""
+    mqtt_mock = await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    batches = mqtt_mock.message_statistics.as_dict()["batches"]
+
+    for idx in range(5):
+        msg = MQTTMessage(topic=f"test-topic/{idx}".encode())
+        msg.payload = str(idx).encode()
+        mqtt_client_mock.on_message(None, None, msg)
+    await hass.async_block_till_done()
+
+    assert [call.payload for call in calls] == ["0", "1", "2", "3", "4"]
+    statistics = mqtt_mock.message_statistics.as_dict()
+    assert statistics["batches"] == batches + 1
+    assert statistics["received"] == 5
+    assert statistics["dispatched"] == 5
+
+
+async def test_subscribe_coalesce_window(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test only the latest message per topic is delivered within the window."""
+    mqtt_mock = await mqtt_mock_entry()
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls, coalesce_window=1.0)
+
+    for payload in ("1", "2", "3"):
+        async_fire_mqtt_message(hass, "test-topic/a", payload)
+    async_fire_mqtt_message(hass, "test-topic/b", "4")
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert [(call.topic, call.payload) for call in calls] == [
+        ("test-topic/a", "3"),
+        ("test-topic/b", "4"),
+    ]
+    statistics = mqtt_mock.message_statistics.as_dict()
+    assert statistics["coalesced"] == 2
+    assert statistics["dispatched"] == 2
+
+    # A new window starts with the next message
+    async_fire_mqtt_message(hass, "test-topic/a", "5")
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert calls[2].payload == "5"
+
+
+async def test_unsubscribe_drops_coalesced_messages(
+    hass: HomeAssistant,
+    mqtt_mock_entry: MqttMockHAClientGenerator,
+    calls: list[ReceiveMessage],
+    record_calls: MessageCallbackType,
+) -> None:
+    """Test pending coalesced messages are dropped on unsubscribe."""
+    mqtt_mock = await mqtt_mock_entry()
+    unsub = await mqtt.async_subscribe(
+        hass, "test-topic", record_calls, coalesce_window=1.0
+    )
+
+    async_fire_mqtt_message(hass, "test-topic", "test-payload")
+    await hass.async_block_till_done()
+    unsub()
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+    assert mqtt_mock.message_statistics.as_dict()["dropped"] == 1
+
+
 @patch("homeassistant.components.mqtt.client.INITIAL_SUBSCRIBE_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.DISCOVERY_COOLDOWN", 0.0)
 @patch("homeassistant.components.mqtt.client.SUBSCRIBE_COOLDOWN", 0.0)
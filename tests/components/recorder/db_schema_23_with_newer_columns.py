@@ -209,6 +209,7 @@ class EventData(Base):  # type: ignore[misc,valid-type]
     hash = Column(BigInteger, index=True)
     # Note that this is not named attributes to avoid confusion with the states table
     shared_data = Column(Text().with_variant(mysql.LONGTEXT, "mysql"))
+    refcount = Column(Integer, index=True)
 
 
 # *** Not originally in v23, only added for recorder to startup ok
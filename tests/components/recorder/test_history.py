@@ -454,6 +454,106 @@ def test_get_significant_states(hass_recorder: Callable[..., HomeAssistant]) ->
     assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+def test_get_significant_states_chunks(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test significant states can be fetched in chunks."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    for minimal_response in (False, True):
+        hist = history.get_significant_states(
+            hass,
+            zero,
+            four,
+            entity_ids=list(states),
+            minimal_response=minimal_response,
+            compressed_state_format=True,
+        )
+        chunked_hist: dict[str, list] = {}
+        for chunk in history.get_significant_states_chunks(
+            hass,
+            zero,
+            four,
+            list(states),
+            minimal_response=minimal_response,
+            compressed_state_format=True,
+            max_states=3,
+        ):
+            assert sum(len(chunk_states) for chunk_states in chunk.values()) <= 3
+            for entity_id, chunk_states in chunk.items():
+                chunked_hist.setdefault(entity_id, []).extend(chunk_states)
+        assert chunked_hist == hist
+
+
+def test_get_significant_states_columns(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test significant states can be fetched as columns."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    hist = history.get_significant_states(hass, zero, four, entity_ids=list(states))
+    with session_scope(hass=hass, read_only=True) as session:
+        columns = history.get_significant_states_columns_with_session(
+            hass, session, zero, four, list(states)
+        )
+    assert columns == {
+        entity_id: (
+            [state.state for state in entity_states],
+            [state.last_updated_timestamp for state in entity_states],
+            [dict(state.attributes) for state in entity_states],
+        )
+        for entity_id, entity_states in hist.items()
+    }
+
+
+def test_get_significant_states_max_points(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test numeric states are downsampled to about max_points states."""
+    hass = hass_recorder()
+    entity_id = "sensor.power"
+    start = dt_util.utcnow()
+    end = start + timedelta(seconds=40)
+
+    with freeze_time(start) as freezer:
+        for second in range(1, 40):
+            freezer.move_to(start + timedelta(seconds=second))
+            if second == 25:
+                state = "unavailable"
+            elif second == 17:
+                state = "100"
+            else:
+                state = str((second * 7) % 10)
+            hass.states.set(entity_id, state)
+        wait_recording_done(hass)
+
+    hist = history.get_significant_states(hass, start, end, entity_ids=[entity_id])
+    states = [state.state for state in hist[entity_id]]
+    assert len(states) == 39
+
+    for minimal_response in (False, True):
+        downsampled = history.get_significant_states(
+            hass,
+            start,
+            end,
+            entity_ids=[entity_id],
+            minimal_response=minimal_response,
+            compressed_state_format=True,
+            max_points=8,
+        )[entity_id]
+        # The first and last state, the minimum and maximum of 4 buckets
+        # and the unavailable state which splits its bucket in two
+        assert len(downsampled) <= 13
+        times = [state["lu"] for state in downsampled]
+        assert times == sorted(times)
+        kept = [state["s"] for state in downsampled]
+        assert kept[0] == states[0]
+        assert kept[-1] == states[-1]
+        assert "100" in kept
+        assert "unavailable" in kept
+        assert "0" in kept
+
+
 def test_get_significant_states_minimal_response(
     hass_recorder: Callable[..., HomeAssistant],
 ) -> None:
@@ -1198,3 +1298,138 @@ def test_get_last_state_changes_with_non_existent_entity_ids_returns_empty(
     """Test get_last_state_changes returns an empty dict when entities not in the db."""
     hass = hass_recorder()
     assert history.get_last_state_changes(hass, 1, "nonexistent.entity") == {}
+
+
+@pytest.mark.parametrize("significant_changes_only", [True, False])
+@pytest.mark.parametrize("minimal_response", [True, False])
+@pytest.mark.parametrize("no_attributes", [True, False])
+@pytest.mark.parametrize("compressed_state_format", [True, False])
+@pytest.mark.parametrize("start_offset", [timedelta(0), timedelta(seconds=2)])
+def test_get_significant_states_from_history_cache(
+    hass_recorder: Callable[..., HomeAssistant],
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+    compressed_state_format: bool,
+    start_offset: timedelta,
+) -> None:
+    """Test recent history served from the history cache matches the database."""
+    hass = hass_recorder()
+    zero, four, states = record_states(hass)
+    history_cache = get_instance(hass).states_history_cache
+
+    def _get_significant_states(entity_ids: list[str]) -> dict[str, list]:
+        return {
+            entity_id: [
+                state.as_dict() if isinstance(state, State) else state
+                for state in entity_states
+            ]
+            for entity_id, entity_states in history.get_significant_states(
+                hass,
+                zero + start_offset,
+                four,
+                entity_ids=entity_ids,
+                significant_changes_only=significant_changes_only,
+                minimal_response=minimal_response,
+                no_attributes=no_attributes,
+                compressed_state_format=compressed_state_format,
+            ).items()
+        }
+
+    for entity_ids in (list(states), ["media_player.test"]):
+        hits = history_cache.hits
+        from_cache = _get_significant_states(entity_ids)
+        # The state before the start time of a single entity may have been
+        # recorded in an earlier run, so it must come from the database
+        expected_hits = 0 if len(entity_ids) == 1 and not start_offset else 1
+        assert history_cache.hits == hits + expected_hits
+        with patch.object(history_cache, "get_significant_states", return_value=None):
+            from_database = _get_significant_states(entity_ids)
+        assert from_cache == from_database
+
+
+def test_history_cache_miss_after_ring_is_full(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test the database is used when the cache no longer holds the period."""
+    hass = hass_recorder()
+    history_cache = get_instance(hass).states_history_cache
+    history_cache.max_states_per_entity = 2
+    start = dt_util.utcnow()
+    entity_id = "sensor.test"
+    for idx in range(3):
+        with freeze_time(start + timedelta(seconds=idx + 1)):
+            hass.states.set(entity_id, str(idx))
+            wait_recording_done(hass)
+
+    hits = history_cache.hits
+    misses = history_cache.misses
+    hist = history.get_significant_states(hass, start, entity_ids=[entity_id])
+    assert [state.state for state in hist[entity_id]] == ["0", "1", "2"]
+    assert history_cache.hits == hits
+    assert history_cache.misses == misses + 1
+
+    # The start state and the states after it are still in the cache
+    hist = history.get_significant_states(
+        hass, start + timedelta(seconds=2.5), entity_ids=[entity_id]
+    )
+    assert [state.state for state in hist[entity_id]] == ["1", "2"]
+    assert history_cache.hits == hits + 1
+
+
+def test_history_cache_evicts_least_recently_used_entities(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test the states of the least recently used entities are evicted first."""
+    hass = hass_recorder()
+    history_cache = get_instance(hass).states_history_cache
+    history_cache.max_states = 2
+    start = dt_util.utcnow()
+    for idx, entity_id in enumerate(("sensor.one", "sensor.two")):
+        with freeze_time(start + timedelta(seconds=idx + 1)):
+            hass.states.set(entity_id, str(idx))
+            wait_recording_done(hass)
+
+    hits = history_cache.hits
+    hist = history.get_significant_states(
+        hass, start + timedelta(seconds=1.5), entity_ids=["sensor.one"]
+    )
+    assert [state.state for state in hist["sensor.one"]] == ["0"]
+    assert history_cache.hits == hits + 1
+
+    # sensor.two is now the least recently used entity
+    with freeze_time(start + timedelta(seconds=3)):
+        hass.states.set("sensor.three", "2")
+        wait_recording_done(hass)
+
+    misses = history_cache.misses
+    hist = history.get_significant_states(
+        hass, start + timedelta(seconds=2.5), entity_ids=["sensor.two"]
+    )
+    assert [state.state for state in hist["sensor.two"]] == ["1"]
+    assert history_cache.misses == misses + 1
+
+    hits = history_cache.hits
+    hist = history.get_significant_states(
+        hass, start + timedelta(seconds=3.5), entity_ids=["sensor.one", "sensor.three"]
+    )
+    assert [state.state for state in hist["sensor.one"]] == ["0"]
+    assert [state.state for state in hist["sensor.three"]] == ["2"]
+    assert history_cache.hits == hits + 1
+
+
+def test_history_cache_disabled(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test history is read from the database when the history cache is disabled."""
+    hass = hass_recorder({"history_cache_max_states": 0})
+    history_cache = get_instance(hass).states_history_cache
+    start = dt_util.utcnow()
+    with freeze_time(start + timedelta(seconds=1)):
+        hass.states.set("sensor.test", "on")
+        wait_recording_done(hass)
+
+    hist = history.get_significant_states(hass, start, entity_ids=["sensor.test"])
+    assert [state.state for state in hist["sensor.test"]] == ["on"]
+    assert history_cache.hits == 0
+    assert history_cache.misses == 0
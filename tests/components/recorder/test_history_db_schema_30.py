@@ -292,6 +292,29 @@ def test_get_significant_states(hass_recorder: Callable[..., HomeAssistant]) ->
         assert_dict_of_states_equal_without_context_and_last_changed(states, hist)
 
 
+def test_get_significant_states_columns(
+    hass_recorder: Callable[..., HomeAssistant],
+) -> None:
+    """Test significant states can be fetched as columns."""
+    hass = hass_recorder()
+    instance = recorder.get_instance(hass)
+    with patch.object(instance.states_meta_manager, "active", False):
+        zero, four, states = record_states(hass)
+        hist = history.get_significant_states(hass, zero, four, entity_ids=list(states))
+        with session_scope(hass=hass) as session:
+            columns = history.get_significant_states_columns_with_session(
+                hass, session, zero, four, list(states)
+            )
+    assert columns == {
+        entity_id: (
+            [state.state for state in entity_states],
+            [state.last_updated_timestamp for state in entity_states],
+            [dict(state.attributes) for state in entity_states],
+        )
+        for entity_id, entity_states in hist.items()
+    }
+
+
 def test_get_significant_states_minimal_response(
     hass_recorder: Callable[..., HomeAssistant],
 ) -> None:
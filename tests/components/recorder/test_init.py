@@ -12,6 +12,7 @@ from unittest.mock import MagicMock, Mock, patch
 
 from freezegun.api import FrozenDateTimeFactory
 import pytest
+from sqlalchemy import text
 from sqlalchemy.exc import DatabaseError, OperationalError, SQLAlchemyError
 
 from homeassistant.components import recorder
@@ -32,6 +33,7 @@ from homeassistant.components.recorder import (
     statistics,
 )
 from homeassistant.components.recorder.const import (
+    DB_READ_WORKER_PREFIX,
     EVENT_RECORDER_5MIN_STATISTICS_GENERATED,
     EVENT_RECORDER_HOURLY_STATISTICS_GENERATED,
     KEEPALIVE_TIME,
@@ -215,6 +217,82 @@ async def test_shutdown_closes_connections(
         assert instance.get_session()
 
 
+async def test_read_executor(
+    async_setup_recorder_instance: RecorderInstanceGenerator,
+    hass: HomeAssistant,
+    recorder_db_url: str,
+    tmp_path: Path,
+) -> None:
+    """Test read jobs run on read-only connections and can be interrupted."""
+    if recorder_db_url.startswith(("mysql://", "postgresql://")):
+        # Interrupting queries is only supported with SQLite
+        return
+
+    if recorder_db_url == "sqlite://":
+        # In memory databases cannot be shared with the read engine
+        recorder_db_url = "sqlite:///" + str(tmp_path / "pytest.db")
+    instance = await async_setup_recorder_instance(
+        hass, {recorder.CONF_DB_URL: recorder_db_url}
+    )
+    hass.states.async_set("sensor.test", "on")
+    await async_wait_recording_done(hass)
+    assert instance.read_engine is not None
+
+    def _read_states() -> tuple[str, int]:
+        with session_scope(hass=hass, read_only=True) as session:
+            assert session.get_bind() is instance.read_engine
+            return threading.current_thread().name, session.query(States).count()
+
+    thread_name, count = await instance.async_add_read_executor_job(_read_states)
+    assert thread_name.startswith(DB_READ_WORKER_PREFIX)
+    assert count == 1
+
+    def _delete_states() -> None:
+        with session_scope(hass=hass) as session:
+            session.execute(text("DELETE FROM states"))
+
+    with pytest.raises(OperationalError, match="readonly database"):
+        await instance.async_add_read_executor_job(_delete_states)
+
+    interrupted = threading.Event()
+
+    def _endless_query() -> None:
+        with session_scope(hass=hass, read_only=True) as session:
+            try:
+                session.execute(
+                    text(
+                        "WITH RECURSIVE cnt(x) AS "
+                        "(SELECT 1 UNION ALL SELECT x + 1 FROM cnt) "
+                        "SELECT count(*) FROM cnt"
+                    )
+                ).all()
+            except OperationalError:
+                interrupted.set()
+                raise
+
+    with pytest.raises(TimeoutError):
+        await instance.async_add_read_executor_job(_endless_query, timeout=0.1)
+    assert instance.read_jobs_timed_out == 1
+    assert await hass.async_add_executor_job(interrupted.wait, 5)
+
+    task = hass.async_create_task(instance.async_add_read_executor_job(_endless_query))
+    await asyncio.sleep(0.1)
+    interrupted.clear()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert instance.read_jobs_cancelled == 1
+    assert await hass.async_add_executor_job(interrupted.wait, 5)
+
+    thread_name, count = await instance.async_add_read_executor_job(_read_states)
+    assert count == 1
+
+    with patch.object(instance, "_db_read_executor", None), pytest.raises(
+        RuntimeError, match="read executor is not running"
+    ):
+        await instance.async_add_read_executor_job(_read_states)
+
+
 async def test_state_gets_saved_when_set_before_start_event(
     async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
 ) -> None:
@@ -408,6 +486,49 @@ def test_saving_state_with_exception(
     assert "Error saving events" not in caplog.text
 
 
+def test_saving_state_with_exception_bulk_insert(
+    hass_recorder: Callable[..., HomeAssistant],
+    hass: HomeAssistant,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test saving a state when bulk inserting the states fails."""
+    hass = hass_recorder({"bulk_insert_states": True})
+    assert get_instance(hass)._bulk_insert_states
+
+    entity_id = "test.recorder"
+    state = "restoring_from_db"
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+
+    states_manager = get_instance(hass).states_manager
+
+    def _throw_if_state_pending(*args, **kwargs):
+        # States are inserted in bulk instead of being added to the session
+        if states_manager._pending_inserts:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+
+    with patch("time.sleep"), patch.object(
+        states_manager,
+        "insert_pending",
+        side_effect=_throw_if_state_pending,
+    ):
+        hass.states.set(entity_id, "fail", attributes)
+        wait_recording_done(hass)
+
+    assert "Error executing query" in caplog.text
+    assert "Error saving events" not in caplog.text
+
+    caplog.clear()
+    hass.states.set(entity_id, state, attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) >= 1
+
+    assert "Error executing query" not in caplog.text
+    assert "Error saving events" not in caplog.text
+
+
 def test_saving_state_with_sqlalchemy_exception(
     hass_recorder: Callable[..., HomeAssistant],
     hass: HomeAssistant,
@@ -1392,6 +1513,59 @@ def test_saving_sets_old_state(hass_recorder: Callable[..., HomeAssistant]) -> N
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("bulk_insert_states", [False, True])
+def test_saving_sets_old_state_in_same_commit(
+    hass_recorder: Callable[..., HomeAssistant], bulk_insert_states: bool
+) -> None:
+    """Test saving sets old state when the old state is in the same commit."""
+    hass = hass_recorder(
+        {"commit_interval": 30, "bulk_insert_states": bulk_insert_states}
+    )
+
+    hass.states.set("test.one", "s1", {"attr": 1})
+    hass.states.set("test.two", "s2", {"attr": 1})
+    hass.states.set("test.one", "s3", {"attr": 2})
+    hass.states.set("test.one", "s4", {"attr": 1})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                States.attributes_id,
+            ).outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+        )
+        assert len(states) == 4
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].entity_id == "test.one"
+        assert states_by_state["s2"].entity_id == "test.two"
+        assert states_by_state["s3"].entity_id == "test.one"
+        assert states_by_state["s4"].entity_id == "test.one"
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s3"].state_id
+
+        assert (
+            states_by_state["s1"].attributes_id == states_by_state["s4"].attributes_id
+        )
+        assert (
+            states_by_state["s1"].attributes_id != states_by_state["s3"].attributes_id
+        )
+
+    hass.states.set("test.one", "s5", {})
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        state = session.query(States).filter(States.state == "s5").one()
+        assert state.old_state_id == states_by_state["s4"].state_id
+
+
 def test_saving_state_with_serializable_data(
     hass_recorder: Callable[..., HomeAssistant], caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -12,6 +12,7 @@ from sqlalchemy.orm.session import Session
 from homeassistant.components import recorder
 from homeassistant.components.recorder.const import SupportedDialect
 from homeassistant.components.recorder.db_schema import (
+    EventData,
     Events,
     EventTypes,
     RecorderRuns,
@@ -1985,3 +1986,233 @@ async def test_purge_entities_keep_days(
     )
     assert len(states["sensor.keep"]) == 2
     assert "sensor.purge" not in states
+
+
+async def test_purge_partitions(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test states and events are purged in whole partitions by id range."""
+    instance = await async_setup_recorder_instance(hass, {"purge_partition": "day"})
+    assert instance.purge_partition == timedelta(days=1)
+    await async_wait_recording_done(hass)
+
+    purge_before = dt_util.utcnow().replace(hour=12) + timedelta(days=3)
+    partition_start = purge_before.replace(hour=0, minute=0, second=0, microsecond=0)
+    old_ts = dt_util.utc_to_timestamp(partition_start - timedelta(days=1))
+    late_ts = dt_util.utc_to_timestamp(partition_start - timedelta(hours=2))
+    keep_ts = dt_util.utc_to_timestamp(partition_start + timedelta(hours=1))
+
+    def _insert_rows() -> int:
+        with session_scope(hass=hass) as session:
+            states_meta = StatesMeta(entity_id="sensor.partition")
+            purge_attributes = StateAttributes(shared_attrs='{"any":"purge"}')
+            keep_attributes = StateAttributes(shared_attrs='{"any":"keep"}')
+            session.add_all((states_meta, purge_attributes, keep_attributes))
+            session.flush()
+            old_state = None
+            for state, timestamp, attributes in (
+                *(("purge", old_ts, purge_attributes),) * 5,
+                *(("keep", keep_ts, keep_attributes),) * 3,
+                # Recorded after the partition it belongs to
+                ("late", late_ts, purge_attributes),
+            ):
+                old_state = States(
+                    metadata_id=states_meta.metadata_id,
+                    state=state,
+                    last_updated_ts=timestamp,
+                    old_state=old_state,
+                    state_attributes=attributes,
+                )
+                session.add(old_state)
+            for time_fired_ts in (old_ts, old_ts, keep_ts, late_ts):
+                session.add(
+                    Events(
+                        event_type="EVENT_TEST_PARTITION", time_fired_ts=time_fired_ts
+                    )
+                )
+            convert_pending_events_to_event_types(instance, session)
+            session.flush()
+            return old_state.state_id
+
+    late_state_id = await instance.async_add_executor_job(_insert_rows)
+
+    with patch(
+        "homeassistant.components.recorder.purge._purge_state_ids",
+        wraps=recorder.purge._purge_state_ids,
+    ) as purge_state_ids, session_scope(hass=hass) as session:
+        finished = purge_old_data(instance, purge_before, repack=False)
+        assert finished
+
+        states = session.query(States).join(StatesMeta)
+        states = states.filter(StatesMeta.entity_id == "sensor.partition")
+        assert [state.state for state in states] == ["keep"] * 3
+        assert states[0].old_state_id is None
+        assert [attrs.shared_attrs for attrs in session.query(StateAttributes)] == [
+            '{"any":"keep"}'
+        ]
+        events = session.query(Events).filter(
+            Events.event_type_id.in_(select_event_type_ids(("EVENT_TEST_PARTITION",)))
+        )
+        assert [event.time_fired_ts for event in events] == [keep_ts]
+
+    # Only the late state was purged by state_id
+    assert [call.args[2] for call in purge_state_ids.mock_calls] == [{late_state_id}]
+
+
+async def test_purge_refcounts(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test shared attributes and event data are counted and purged by refcount."""
+    instance = await async_setup_recorder_instance(hass)
+    assert instance.state_attributes_manager.refcounts_active
+    assert instance.event_data_manager.refcounts_active
+
+    for state in ("one", "two", "three"):
+        hass.states.async_set("sensor.refcount", state, {"shared": True})
+        hass.bus.async_fire("EVENT_TEST_REFCOUNT", {"shared": True})
+        await async_wait_recording_done(hass)
+
+    def _refcounts() -> tuple[list[int | None], list[int | None]]:
+        with session_scope(hass=hass) as session:
+            return (
+                [
+                    attributes.refcount
+                    for attributes in session.query(StateAttributes).filter(
+                        StateAttributes.shared_attrs == '{"shared":true}'
+                    )
+                ],
+                [
+                    event_data.refcount
+                    for event_data in session.query(EventData).filter(
+                        EventData.shared_data == '{"shared":true}'
+                    )
+                ],
+            )
+
+    assert await instance.async_add_executor_job(_refcounts) == ([3], [3])
+
+    old_ts = dt_util.utc_to_timestamp(dt_util.utcnow() - timedelta(days=10))
+
+    def _age_rows(count: int) -> None:
+        with session_scope(hass=hass) as session:
+            for state in (
+                session.query(States)
+                .join(StatesMeta)
+                .filter(StatesMeta.entity_id == "sensor.refcount")
+                .order_by(States.state_id)
+                .limit(count)
+            ):
+                state.last_updated_ts = old_ts
+            for event in (
+                session.query(Events)
+                .filter(
+                    Events.event_type_id.in_(
+                        select_event_type_ids(("EVENT_TEST_REFCOUNT",))
+                    )
+                )
+                .order_by(Events.event_id)
+                .limit(count)
+            ):
+                event.time_fired_ts = old_ts
+
+    await instance.async_add_executor_job(_age_rows, 2)
+    await hass.services.async_call(recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 5})
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+    assert await instance.async_add_executor_job(_refcounts) == ([1], [1])
+
+    await instance.async_add_executor_job(_age_rows, 1)
+    await hass.services.async_call(recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 5})
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+    assert await instance.async_add_executor_job(_refcounts) == ([], [])
+
+
+async def test_refcounts_written_again_when_commit_is_retried(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test references are counted again when a failed commit is retried."""
+    instance = await async_setup_recorder_instance(hass, {"bulk_insert_states": True})
+    hass.states.async_set("sensor.retry", "one", {"shared": True})
+    await async_wait_recording_done(hass)
+
+    session = instance.event_session
+    assert session is not None
+    original_commit = session.commit
+    failed_commits = 0
+
+    def _fail_first_commit() -> None:
+        nonlocal failed_commits
+        if not failed_commits:
+            failed_commits += 1
+            session.rollback()
+            raise OperationalError("commit", {}, Exception("forced to fail"))
+        original_commit()
+
+    with patch.object(instance, "db_retry_wait", 0.01), patch.object(
+        session, "commit", side_effect=_fail_first_commit
+    ):
+        hass.states.async_set("sensor.retry", "two", {"shared": True})
+        hass.states.async_set("sensor.retry", "three", {"shared": True})
+        await async_wait_recording_done(hass)
+    assert failed_commits == 1
+
+    def _refcount_and_states() -> tuple[int | None, int]:
+        with session_scope(hass=hass) as session:
+            attributes = (
+                session.query(StateAttributes)
+                .filter(StateAttributes.shared_attrs == '{"shared":true}')
+                .one()
+            )
+            return (
+                attributes.refcount,
+                session.query(States)
+                .filter(States.attributes_id == attributes.attributes_id)
+                .count(),
+            )
+
+    assert await instance.async_add_executor_job(_refcount_and_states) == (3, 3)
+
+
+async def test_purge_counts_uncounted_refs(
+    async_setup_recorder_instance: RecorderInstanceGenerator, hass: HomeAssistant
+) -> None:
+    """Test shared attributes recorded before refcounts are counted by the purge."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass)
+
+    old_ts = dt_util.utc_to_timestamp(dt_util.utcnow() - timedelta(days=10))
+    new_ts = dt_util.utc_to_timestamp(dt_util.utcnow())
+
+    def _insert_rows() -> None:
+        with session_scope(hass=hass) as session:
+            states_meta = StatesMeta(entity_id="sensor.uncounted")
+            state_attributes = StateAttributes(shared_attrs='{"uncounted":true}')
+            session.add_all((states_meta, state_attributes))
+            for timestamp in (old_ts, new_ts, new_ts):
+                session.add(
+                    States(
+                        metadata_id=states_meta.metadata_id,
+                        states_meta_rel=states_meta,
+                        state="on",
+                        last_updated_ts=timestamp,
+                        state_attributes=state_attributes,
+                    )
+                )
+
+    def _refcounts() -> list[int | None]:
+        with session_scope(hass=hass) as session:
+            return [
+                attributes.refcount
+                for attributes in session.query(StateAttributes).filter(
+                    StateAttributes.shared_attrs == '{"uncounted":true}'
+                )
+            ]
+
+    await instance.async_add_executor_job(_insert_rows)
+    assert await instance.async_add_executor_job(_refcounts) == [None]
+
+    await hass.services.async_call(recorder.DOMAIN, SERVICE_PURGE, {"keep_days": 5})
+    await async_recorder_block_till_done(hass)
+    await async_wait_purge_done(hass)
+    assert await instance.async_add_executor_job(_refcounts) == [2]
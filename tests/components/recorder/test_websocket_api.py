@@ -2087,6 +2087,7 @@ async def test_recorder_info(
     assert response["result"] == {
         "backlog": 0,
         "max_backlog": 65000,
+        "read_queue_depth": 0,
         "migration_in_progress": False,
         "migration_is_live": False,
         "recording": True,
@@ -33,6 +33,7 @@ from homeassistant.components.recorder.statistics import (
 )
 from homeassistant.components.recorder.util import get_instance, session_scope
 from homeassistant.components.sensor import ATTR_OPTIONS, SensorDeviceClass
+from homeassistant.components.sensor.recorder import _time_weighted_average
 from homeassistant.const import ATTR_FRIENDLY_NAME, STATE_UNAVAILABLE
 from homeassistant.core import HomeAssistant, State
 from homeassistant.setup import async_setup_component, setup_component
@@ -5212,3 +5213,26 @@ async def test_exclude_attributes(
     assert len(states) == 1
     assert ATTR_OPTIONS not in states[0].attributes
     assert ATTR_FRIENDLY_NAME in states[0].attributes
+
+
+def test_time_weighted_average() -> None:
+    """Test the time weighted average of states."""
+    start = dt_util.utcnow()
+    end = start + timedelta(minutes=5)
+    start_ts = start.timestamp()
+    fstates = [
+        # Last known state before the period
+        (10.0, start_ts - 3600),
+        (20.0, start_ts + 60),
+        (30.0, start_ts + 240),
+    ]
+    assert _time_weighted_average(fstates, start, end) == pytest.approx(
+        (10 * 60 + 20 * 180 + 30 * 60) / 300
+    )
+    # Without a last known state the period starts at the first state
+    assert _time_weighted_average(fstates[1:], start, end) == pytest.approx(
+        (20 * 180 + 30 * 60) / 240
+    )
+    # A single state at the end of the period
+    assert _time_weighted_average([(30.0, end.timestamp())], start, end) == 0.0
+    assert _time_weighted_average([], start, end) == 0.0
@@ -18,7 +18,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.components.statistics import DOMAIN as STATISTICS_DOMAIN
-from homeassistant.components.statistics.sensor import StatisticsSensor
+from homeassistant.components.statistics.sensor import SampleWindow, StatisticsSensor
 from homeassistant.const import (
     ATTR_DEVICE_CLASS,
     ATTR_UNIT_OF_MEASUREMENT,
@@ -144,6 +144,20 @@ async def test_sensor_defaults_numeric(hass: HomeAssistant) -> None:
     )
     assert new_state.attributes.get("source_value_valid") is False
 
+    # Source sensor has a non-finite state, it is not added to the samples
+    for value in ("nan", "inf", "-inf"):
+        hass.states.async_set(
+            "sensor.test_monitored",
+            value,
+            {ATTR_UNIT_OF_MEASUREMENT: UnitOfTemperature.CELSIUS},
+        )
+        await hass.async_block_till_done()
+        new_state = hass.states.get("sensor.test")
+        assert new_state is not None
+        assert new_state.state == str(new_mean)
+        assert new_state.attributes.get("buffer_usage_ratio") == round(10 / 20, 2)
+        assert new_state.attributes.get("source_value_valid") is False
+
     # Source sensor has the STATE_UNKNOWN state, unit and state should not change
     state = hass.states.get("sensor.test")
     hass.states.async_set("sensor.test_monitored", STATE_UNKNOWN, {})
@@ -1434,3 +1448,36 @@ async def test_reload(recorder_mock: Recorder, hass: HomeAssistant) -> None:
 
     assert hass.states.get("sensor.test") is None
     assert hass.states.get("sensor.cputest")
+
+
+def test_sample_window_matches_full_recalculation() -> None:
+    """Test the incremental statistics match recalculating all samples."""
+    window = SampleWindow(4)
+    start = dt_util.utcnow()
+    values = [*VALUES_NUMERIC, 17, 3.8, 3.8, -2.5]
+    for idx, value in enumerate(values):
+        window.append(float(value), start + timedelta(seconds=idx * idx))
+        if idx % 3 == 2:
+            window.popleft()
+        states = list(window.states)
+        ages = list(window.ages)
+
+        assert window.sum == pytest.approx(sum(states))
+        assert window.mean == pytest.approx(statistics.mean(states))
+        assert window.sorted_states == sorted(states)
+        assert window.min == min(states)
+        assert window.max == max(states)
+        assert window.min_age == ages[states.index(min(states))]
+        assert window.max_age == ages[states.index(max(states))]
+        if len(states) < 2:
+            continue
+        assert window.variance == pytest.approx(statistics.variance(states))
+        assert window.sum_differences == pytest.approx(
+            sum(abs(j - i) for i, j in zip(states, states[1:]))
+        )
+        assert window.area_step == pytest.approx(
+            sum(
+                i * (newer - older).total_seconds()
+                for i, older, newer in zip(states, ages, ages[1:])
+            )
+        )
@@ -0,0 +1,47 @@
+"""Test template diagnostics."""
+from homeassistant.components.template.const import DOMAIN
+from homeassistant.core import HomeAssistant
+
+from tests.common import MockConfigEntry
+from tests.components.diagnostics import get_diagnostics_for_config_entry
+from tests.typing import ClientSessionGenerator
+
+
+async def test_diagnostics(
+    hass: HomeAssistant, hass_client: ClientSessionGenerator
+) -> None:
+    """Test diagnostics include the render statistics of the templates."""
+    hass.states.async_set("sensor.one", "1", {"unit": "W"})
+    hass.states.async_set("sensor.two", "2")
+    template_config_entry = MockConfigEntry(
+        data={},
+        domain=DOMAIN,
+        options={
+            "name": "My template",
+            "state": "{{ states('sensor.one') | int + states('sensor.two') | int }}",
+            "template_type": "sensor",
+        },
+        title="My template",
+    )
+    template_config_entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(template_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "1", {"unit": "kW"})
+    hass.states.async_set("sensor.two", "3")
+    await hass.async_block_till_done()
+    assert hass.states.get("sensor.my_template").state == "4"
+
+    result = await get_diagnostics_for_config_entry(
+        hass, hass_client, template_config_entry
+    )
+    assert result["config_entry"]["options"]["template_type"] == "sensor"
+    render_stats = result["render_stats"]["sensor.my_template"]
+    stats = render_stats[
+        "{{ states('sensor.one') | int + states('sensor.two') | int }}"
+    ]
+    # Rendered when set up, refreshed at start and once for sensor.two
+    assert stats["renders"] == 3
+    assert stats["skipped"] == 1
+    assert stats["last_trigger"] == "sensor.two"
+    assert stats["total_duration"] > 0
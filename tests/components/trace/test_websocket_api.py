@@ -9,15 +9,19 @@ import pytest
 from pytest_unordered import unordered
 
 from homeassistant.bootstrap import async_setup_component
-from homeassistant.components.trace.const import DEFAULT_STORED_TRACES
+from homeassistant.components.trace.const import DATA_TRACE_RUNS, DEFAULT_STORED_TRACES
 from homeassistant.const import EVENT_HOMEASSISTANT_STOP
-from homeassistant.core import Context, CoreState, HomeAssistant, callback
+from homeassistant.core import Context, CoreState, HomeAssistant, ServiceCall, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.json import json_bytes
 from homeassistant.helpers.typing import UNDEFINED
 from homeassistant.util.uuid import random_uuid_hex
 
 from tests.common import load_fixture
 from tests.typing import WebSocketGenerator
 
+_ACTION_PREFIX = {"automation": "action", "script": "sequence"}
+
 
 def _find_run_id(traces, trace_type, item_id):
     """Find newest run_id for a script or automation."""
@@ -38,7 +42,7 @@ def _find_traces(traces, trace_type, item_id):
 
 
 async def _setup_automation_or_script(
-    hass, domain, configs, script_config=None, stored_traces=None
+    hass, domain, configs, script_config=None, stored_traces=None, trace_config=None
 ):
     """Set up automations or scripts from automation config."""
     if domain == "script":
@@ -53,14 +57,15 @@ async def _setup_automation_or_script(
             configs = {**configs, **script_config}
 
     if stored_traces is not None:
+        trace_config = {**(trace_config or {}), "stored_traces": stored_traces}
+
+    if trace_config is not None:
         if domain == "script":
             for config in configs.values():
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
         else:
             for config in configs:
-                config["trace"] = {}
-                config["trace"]["stored_traces"] = stored_traces
+                config["trace"] = dict(trace_config)
 
     assert await async_setup_component(hass, domain, {domain: configs})
 
@@ -587,6 +592,160 @@ async def test_trace_overflow(
     assert len(_find_traces(response["result"], domain, "sun")) == 1
 
 
+@pytest.mark.parametrize("domain", ["automation", "script"])
+@pytest.mark.parametrize(
+    ("trace_config", "stored_runs"),
+    [
+        ({"level": "full"}, [0, 1, 2, 3, 4]),
+        ({"level": "sampled", "sample_rate": 3}, [0, 3]),
+        ({"level": "errors"}, []),
+        ({"level": "off"}, []),
+        ({"max_stored_bytes": 1}, [4]),
+    ],
+)
+async def test_trace_level(
+    hass: HomeAssistant,
+    hass_ws_client: WebSocketGenerator,
+    domain,
+    trace_config,
+    stored_runs,
+) -> None:
+    """Test which runs are stored depending on the trace config."""
+    trace_uuids = []
+
+    def mock_random_uuid_hex():
+        trace_uuids.append(random_uuid_hex())
+        return trace_uuids[-1]
+
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"event": "some_event"}, {"event": "another_event"}],
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config=trace_config
+    )
+    client = await hass_ws_client()
+
+    with patch(
+        "homeassistant.components.trace.models.uuid_util.random_uuid_hex",
+        wraps=mock_random_uuid_hex,
+    ):
+        for _ in range(5):
+            await _run_automation_or_script(hass, domain, sun_config, "test_event")
+            await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": domain})
+    response = await client.receive_json()
+    assert response["success"]
+    assert [trace["run_id"] for trace in response["result"]] == [
+        trace_uuids[run] for run in stored_runs
+    ]
+
+    for msg_id, run_id in enumerate(
+        (trace["run_id"] for trace in response["result"]), start=2
+    ):
+        await client.send_json(
+            {
+                "id": msg_id,
+                "type": "trace/get",
+                "domain": domain,
+                "item_id": "sun",
+                "run_id": run_id,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert f"{_ACTION_PREFIX[domain]}/1" in response["result"]["trace"]
+
+
+async def test_trace_level_errors(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test only failed runs are stored with the errors trace level."""
+
+    def failing_service(call: ServiceCall) -> None:
+        if call.data["fail"]:
+            raise HomeAssistantError("Failed")
+
+    hass.services.async_register("test", "failing", failing_service)
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {
+            "service": "test.failing",
+            "data": {"fail": "{{ trigger.event.data.fail }}"},
+        },
+        "trace": {"level": "errors"},
+    }
+    assert await async_setup_component(hass, "automation", {"automation": sun_config})
+    client = await hass_ws_client()
+
+    for fail in (False, True, False):
+        hass.bus.async_fire("test_event", {"fail": fail})
+        await hass.async_block_till_done()
+
+    await client.send_json({"id": 1, "type": "trace/list", "domain": "automation"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]) == 1
+    assert response["result"][0]["error"] == "Failed"
+    assert response["result"][0]["state"] == "stopped"
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_size_calculated_once(hass: HomeAssistant, domain: str) -> None:
+    """Test each trace is serialized once to check the byte limit."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": [{"event": "some_event"}, {"event": "another_event"}],
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"max_stored_bytes": 1000000}
+    )
+
+    with patch(
+        "homeassistant.components.trace.models.json_bytes", wraps=json_bytes
+    ) as mock_json_bytes:
+        for _ in range(3):
+            await _run_automation_or_script(hass, domain, sun_config, "test_event")
+            await hass.async_block_till_done()
+
+    assert mock_json_bytes.call_count == 3
+    # Only the steps are counted, they only hold the variables that changed
+    steps = mock_json_bytes.call_args[0][0]
+    assert set(steps) == {
+        f"{_ACTION_PREFIX[domain]}/0",
+        f"{_ACTION_PREFIX[domain]}/1",
+    } | ({"trigger/0"} if domain == "automation" else set())
+
+
+@pytest.mark.parametrize("domain", ["automation", "script"])
+async def test_trace_runs_removed(hass: HomeAssistant, domain: str) -> None:
+    """Test the run count of sampled traces is removed with the item."""
+    sun_config = {
+        "id": "sun",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"event": "some_event"},
+    }
+    await _setup_automation_or_script(
+        hass, domain, [sun_config], trace_config={"level": "sampled"}
+    )
+    await _run_automation_or_script(hass, domain, sun_config, "test_event")
+    await hass.async_block_till_done()
+    assert hass.data[DATA_TRACE_RUNS] == {f"{domain}.sun": 1}
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={domain: {}},
+    ):
+        await hass.services.async_call(domain, "reload", blocking=True)
+
+    assert hass.data[DATA_TRACE_RUNS] == {}
+
+
 @pytest.mark.parametrize(
     ("domain", "num_restored_moon_traces"), [("automation", 3), ("script", 1)]
 )
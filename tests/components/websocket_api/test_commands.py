@@ -16,14 +16,27 @@ from homeassistant.components.websocket_api.auth import (
     TYPE_AUTH_OK,
     TYPE_AUTH_REQUIRED,
 )
-from homeassistant.components.websocket_api.const import FEATURE_COALESCE_MESSAGES, URL
+from homeassistant.components.websocket_api.commands import (
+    SHARED_TEMPLATE_SUBSCRIPTIONS,
+)
+from homeassistant.components.websocket_api.const import (
+    FEATURE_COALESCE_MESSAGES,
+    FEATURE_COMPACT_ENTITY_IDS,
+    URL,
+)
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
 from homeassistant.core import Context, HomeAssistant, State, SupportsResponse, callback
 from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_template_result
 from homeassistant.loader import async_get_integration
-from homeassistant.setup import DATA_SETUP_TIME, async_setup_component
+from homeassistant.setup import (
+    DATA_SETUP_TIME,
+    DATA_SETUP_TIMINGS,
+    SetupTiming,
+    async_setup_component,
+)
 from homeassistant.util.json import json_loads
 
 from tests.common import (
@@ -1261,6 +1274,124 @@ async def test_subscribe_unsubscribe_entities_specific_entities(
     }
 
 
+async def test_subscribe_entities_compact_entity_ids(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test subscribe entities references entity_ids by id when supported."""
+    hass.states.async_set("light.kitchen", "off", {"color": "red"})
+    hass.states.async_set("light.bowl", "off")
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_COMPACT_ENTITY_IDS: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert list(msg["event"]["a"]) == ["light.kitchen", "light.bowl"]
+
+    hass.states.async_set("light.bowl", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == "event"
+    assert msg["event"] == {"c": {"1": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+
+    hass.states.async_set("light.kitchen", "off", {"color": "blue"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "c": {"0": {"+": {"a": {"color": "blue"}, "c": ANY, "lu": ANY}}}
+    }
+
+    hass.states.async_set("light.kitchen", "off", {"color": "blue"}, True)
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"0": {"+": {"c": ANY, "lc": ANY}}}}
+
+    hass.states.async_remove("light.bowl")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"r": [1]}
+
+    hass.states.async_set("light.bowl", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.bowl": {"a": {}, "c": ANY, "lc": ANY, "s": "off"}}
+    }
+
+    hass.states.async_set("light.bowl", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"1": {"+": {"c": ANY, "lc": ANY, "s": "on"}}}}
+
+    hass.states.async_set("light.new", "on")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {
+        "a": {"light.new": {"a": {}, "c": ANY, "lc": ANY, "s": "on"}}
+    }
+
+    hass.states.async_set("light.new", "off")
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"2": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}}
+
+
+async def test_subscribe_entities_compact_entity_ids_unknown_entity(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test a change of an entity the client does not know is sent as an add."""
+
+    class CannotSerializeMe:
+        """Cannot serialize this."""
+
+    hass.states.async_set("light.permitted", "off")
+    hass.states.async_set(
+        "light.cannot_serialize", "off", {"cannot_serialize": CannotSerializeMe()}
+    )
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {FEATURE_COMPACT_ENTITY_IDS: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 7, "type": "subscribe_entities"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]["a"]) == ["light.permitted"]
+
+    hass.states.async_set("light.cannot_serialize", "on", {"color": "red"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["event"] == {
+        "a": {
+            "light.cannot_serialize": {
+                "a": {"color": "red"},
+                "c": ANY,
+                "lc": ANY,
+                "s": "on",
+            }
+        }
+    }
+
+    hass.states.async_set("light.cannot_serialize", "off", {"color": "red"})
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"c": {"1": {"+": {"c": ANY, "lc": ANY, "s": "off"}}}}
+
+
 async def test_render_template_renders_template(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -1310,6 +1441,85 @@ async def test_render_template_renders_template(
     }
 
 
+async def test_render_template_shares_tracker(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test identical render_template subscriptions share one tracker."""
+    hass.states.async_set("light.test", "on")
+    client_1 = await hass_ws_client(hass)
+    client_2 = await hass_ws_client(hass)
+    listeners = {
+        "all": False,
+        "domains": [],
+        "entities": ["light.test"],
+        "time": False,
+    }
+
+    with patch(
+        "homeassistant.components.websocket_api.commands.async_track_template_result",
+        wraps=async_track_template_result,
+    ) as mock_track:
+        for client, msg_id in ((client_1, 5), (client_1, 6), (client_2, 5)):
+            await client.send_json(
+                {
+                    "id": msg_id,
+                    "type": "render_template",
+                    "template": "State is: {{ states('light.test') }}",
+                    "variables": {"a": 1, "b": 2},
+                }
+            )
+            msg = await client.receive_json()
+            assert msg["id"] == msg_id
+            assert msg["success"]
+            msg = await client.receive_json()
+            assert msg["id"] == msg_id
+            assert msg["event"] == {"result": "State is: on", "listeners": listeners}
+
+        # Different variables are rendered with their own tracker
+        await client_2.send_json(
+            {
+                "id": 6,
+                "type": "render_template",
+                "template": "State is: {{ states('light.test') }}",
+                "variables": {"a": 2},
+            }
+        )
+        msg = await client_2.receive_json()
+        assert msg["success"]
+        msg = await client_2.receive_json()
+        assert msg["id"] == 6
+
+    assert mock_track.call_count == 2
+
+    hass.states.async_set("light.test", "off")
+    for client, msg_ids in ((client_1, {5, 6}), (client_2, {5, 6})):
+        for _ in range(2):
+            msg = await client.receive_json()
+            msg_ids.remove(msg["id"])
+            assert msg["event"] == {"result": "State is: off", "listeners": listeners}
+
+    await client_1.send_json({"id": 7, "type": "unsubscribe_events", "subscription": 5})
+    msg = await client_1.receive_json()
+    assert msg["success"]
+    await client_1.close()
+    await hass.async_block_till_done()
+
+    hass.states.async_set("light.test", "on")
+    msg = await client_2.receive_json()
+    assert msg["event"]["result"] == "State is: on"
+    msg = await client_2.receive_json()
+    assert msg["event"]["result"] == "State is: on"
+    assert len(hass.data[SHARED_TEMPLATE_SUBSCRIPTIONS]) == 2
+
+    for msg_id in (5, 6):
+        await client_2.send_json(
+            {"id": msg_id + 2, "type": "unsubscribe_events", "subscription": msg_id}
+        )
+        msg = await client_2.receive_json()
+        assert msg["success"]
+    assert hass.data[SHARED_TEMPLATE_SUBSCRIPTIONS] == {}
+
+
 async def test_render_template_with_timeout_and_variables(
     hass: HomeAssistant, websocket_client
 ) -> None:
@@ -2509,6 +2719,69 @@ async def test_integration_setup_info(
     ]
 
 
+async def test_integration_setup_trace(
+    hass: HomeAssistant,
+    websocket_client: MockHAClientWebSocket,
+    hass_admin_user: MockUser,
+) -> None:
+    """Test getting the integration setup timings as a Chrome trace."""
+    hass.data[DATA_SETUP_TIMINGS] = {
+        "http": SetupTiming(10.0, 10.5, 11.0),
+        "august": SetupTiming(10.0, 11.0, 13.0, ["http"]),
+    }
+    await websocket_client.send_json({"id": 7, "type": "integration/setup_trace"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 7
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"] == {
+        "displayTimeUnit": "ms",
+        "traceEvents": [
+            {
+                "name": "http (dependencies)",
+                "cat": "dependencies",
+                "ph": "X",
+                "ts": 0,
+                "dur": 500000,
+                "pid": 1,
+                "tid": 0,
+                "args": {"waited_for": []},
+            },
+            {
+                "name": "http",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 500000,
+                "dur": 500000,
+                "pid": 1,
+                "tid": 0,
+                "args": {"critical_path": True},
+            },
+            {
+                "name": "august (dependencies)",
+                "cat": "dependencies",
+                "ph": "X",
+                "ts": 0,
+                "dur": 1000000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"waited_for": ["http"]},
+            },
+            {
+                "name": "august",
+                "cat": "setup",
+                "ph": "X",
+                "ts": 1000000,
+                "dur": 2000000,
+                "pid": 1,
+                "tid": 1,
+                "args": {"critical_path": True},
+            },
+        ],
+    }
+
+
 @pytest.mark.parametrize(
     ("key", "config"),
     (
@@ -1,4 +1,5 @@
 """Test WebSocket Connection class."""
+import asyncio
 import logging
 from typing import Any
 from unittest.mock import AsyncMock, Mock, patch
@@ -130,3 +131,37 @@ async def test_binary_handler_registration() -> None:
     # Verify we reuse an unsubscribed prefix
     prefix, unsub = connection.async_register_binary_handler(None)
     assert prefix == 15
+
+
+async def test_cancel_on_close(hass: HomeAssistant) -> None:
+    """Test tasks are cancelled when the connection closes inside the block."""
+    connection = websocket_api.ActiveConnection(
+        logging.getLogger(__name__),
+        Mock(data={websocket_api.DOMAIN: None}),
+        Mock(),
+        None,
+        Mock(),
+    )
+    started = asyncio.Event()
+
+    async def _fetch(msg_id: int) -> None:
+        with connection.cancel_on_close(msg_id):
+            started.set()
+            await asyncio.Event().wait()
+
+    task = hass.async_create_task(_fetch(5))
+    await started.wait()
+    assert connection.cancel_on_close_tasks == {5: task}
+
+    # The task is not a subscription that unsubscribe_events could cancel
+    assert 5 not in connection.subscriptions
+
+    connection.async_handle_close()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert connection.cancel_on_close_tasks == {}
+
+    # Nothing is cancelled once the block is left
+    with connection.cancel_on_close(6):
+        assert 6 in connection.cancel_on_close_tasks
+    assert 6 not in connection.cancel_on_close_tasks
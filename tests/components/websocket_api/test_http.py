@@ -9,6 +9,7 @@ import pytest
 
 from homeassistant.components.websocket_api import (
     async_register_command,
+    async_response,
     const,
     http,
     websocket_command,
@@ -184,6 +185,38 @@ async def test_delayed_response_handler(
     assert "on closed connection" in caplog.text
 
 
+async def test_wait_drained(
+    hass: HomeAssistant, websocket_client: MockHAClientWebSocket
+) -> None:
+    """Test waiting until the queued messages have been written to the client."""
+    queue_sizes: list[int] = []
+
+    @websocket_command({"type": "send_many"})
+    @async_response
+    async def async_send_many(
+        hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+    ) -> None:
+        msg_id: int = msg["id"]
+        for idx in range(3):
+            connection.send_event(msg_id, {"idx": idx})
+        assert connection._wait_drained is not None
+        handler = cast(http.WebSocketHandler, connection._wait_drained.__self__)
+        queue_sizes.append(len(handler._message_queue))
+        await connection.async_wait_drained()
+        queue_sizes.append(len(handler._message_queue))
+        connection.send_result(msg_id)
+
+    async_register_command(hass, async_send_many)
+
+    await websocket_client.send_json({"id": 5, "type": "send_many"})
+    for idx in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["event"] == {"idx": idx}
+    msg = await websocket_client.receive_json()
+    assert msg["type"] == "result"
+    assert queue_sizes == [3, 0]
+
+
 async def test_ensure_disconnect_invalid_json(
     hass: HomeAssistant,
     websocket_client: MockHAClientWebSocket,
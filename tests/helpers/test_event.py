@@ -1940,6 +1940,57 @@ async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     assert "cover.office_skylight=open" in specific_runs[0]
 
 
+async def test_track_template_result_only_renders_on_read_changes(
+    hass: HomeAssistant,
+) -> None:
+    """Test a template only renders when a part of a state it read changes."""
+    hass.states.async_set("sensor.a", "1", {"x": 1, "y": 1})
+    hass.states.async_set("sensor.b", "off", {"z": 1})
+    template = Template(
+        "{{ state_attr('sensor.a', 'x') }} {{ is_state('sensor.b', 'on') }}", hass
+    )
+    runs = []
+
+    @ha.callback
+    def _run_callback(
+        event: EventType[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(updates.pop().result)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template, None)], _run_callback
+    )
+    await hass.async_block_till_done()
+    stats = info.render_stats[template.template]
+    assert stats.renders == 1
+    assert stats.last_trigger is None
+
+    hass.states.async_set("sensor.a", "2", {"x": 1, "y": 2})
+    hass.states.async_set("sensor.b", "off", {"z": 2})
+    await hass.async_block_till_done()
+    assert runs == []
+    assert stats.renders == 1
+    assert stats.skipped == 2
+
+    hass.states.async_set("sensor.a", "2", {"x": 2, "y": 2})
+    await hass.async_block_till_done()
+    assert runs == ["2 False"]
+    assert stats.renders == 2
+    assert stats.last_trigger == "sensor.a"
+
+    hass.states.async_set("sensor.b", "on", {"z": 2})
+    await hass.async_block_till_done()
+    assert runs == ["2 False", "2 True"]
+    assert stats.renders == 3
+    assert stats.last_trigger == "sensor.b"
+    assert stats.total_duration >= stats.last_duration > 0
+
+    hass.states.async_remove("sensor.a")
+    await hass.async_block_till_done()
+    assert runs == ["2 False", "2 True", "None True"]
+
+
 async def test_track_template_result_with_group(hass: HomeAssistant) -> None:
     """Test tracking template with a group."""
     hass.states.async_set("sensor.power_1", 0)
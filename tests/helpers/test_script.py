@@ -33,6 +33,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import (
+    condition,
     config_validation as cv,
     device_registry as dr,
     entity_registry as er,
@@ -178,6 +179,35 @@ async def test_firing_event_basic(
     )
 
 
+async def test_steps_resolved_once(hass: HomeAssistant) -> None:
+    """Test the steps of a script are only resolved on the first run."""
+    events = async_capture_events(hass, "test_event")
+    hass.states.async_set("test.entity", "hello")
+    sequence = cv.SCRIPT_SCHEMA(
+        [
+            {"condition": "state", "entity_id": "test.entity", "state": "hello"},
+            {"event": "test_event"},
+            {"event": "test_event", "enabled": False},
+        ]
+    )
+    script_obj = script.Script(hass, sequence, "Test Name", "test_domain")
+
+    with patch(
+        "homeassistant.helpers.script.cv.determine_script_action",
+        wraps=cv.determine_script_action,
+    ) as mock_determine, patch(
+        "homeassistant.helpers.script.condition.async_from_config",
+        wraps=condition.async_from_config,
+    ) as mock_condition:
+        for _ in range(3):
+            await script_obj.async_run(context=Context())
+        await hass.async_block_till_done()
+
+    assert len(events) == 3
+    assert mock_determine.call_count == 3
+    assert mock_condition.call_count == 1
+
+
 async def test_firing_event_template(hass: HomeAssistant) -> None:
     """Test the firing of events."""
     event = "test_event"
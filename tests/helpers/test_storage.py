@@ -556,6 +556,221 @@ async def test_saving_load_round_trip(tmpdir: py.path.local) -> None:
         await hass.async_stop(force=True)
 
 
+async def test_writes_are_batched(tmpdir: py.path.local) -> None:
+    """Test stores that save at the same time are written in one batch."""
+    async with async_test_home_assistant() as hass:
+        config_dir = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+        hass.config.config_dir = config_dir
+        stores = [
+            storage.Store(hass, MOCK_VERSION, "batch-1"),
+            storage.Store(hass, MOCK_VERSION, "batch-2", atomic_writes=True),
+            storage.Store(hass, MOCK_VERSION, "batch-3", atomic_writes=True),
+            storage.Store(hass, MOCK_VERSION, "batch-4", encoder=json.JSONEncoder),
+        ]
+
+        with patch(
+            "homeassistant.helpers.storage.os.fsync", wraps=os.fsync
+        ) as mock_fsync, patch("homeassistant.helpers.storage.os.sync") as mock_sync:
+            await asyncio.gather(
+                *(store.async_save({"index": idx}) for idx, store in enumerate(stores))
+            )
+
+        # The files of the two atomic stores and their directory once
+        assert len(mock_fsync.mock_calls) == 3
+        assert not mock_sync.mock_calls
+        for idx, store in enumerate(stores):
+            assert await store.async_load() == {"index": idx}
+        assert sorted(
+            await hass.async_add_executor_job(
+                os.listdir, os.path.join(config_dir, ".storage")
+            )
+        ) == ["batch-1", "batch-2", "batch-3", "batch-4"]
+
+        stats = storage.async_get_write_stats(hass)
+        assert stats["batches"] == 1
+        assert stats["writes"] == 4
+        assert stats["save_requests"] == 4
+        assert stats["syncs"] == 2
+        assert stats["write_amplification"] == stats["bytes_written"] / 4
+
+        await hass.async_stop(force=True)
+
+
+async def test_batch_write_error(
+    tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test an error writing one store does not fail the other stores."""
+    async with async_test_home_assistant() as hass:
+        config_dir = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+        hass.config.config_dir = config_dir
+        good_store = storage.Store(hass, MOCK_VERSION, "good")
+        bad_store = storage.Store(hass, MOCK_VERSION, "bad")
+
+        await asyncio.gather(
+            good_store.async_save(MOCK_DATA), bad_store.async_save({"bad": object()})
+        )
+
+        assert "Error writing config for bad" in caplog.text
+        assert await good_store.async_load() == MOCK_DATA
+        assert await hass.async_add_executor_job(
+            os.listdir, os.path.join(config_dir, ".storage")
+        ) == ["good"]
+        assert storage.async_get_write_stats(hass)["writes"] == 1
+
+        await hass.async_stop(force=True)
+
+
+class JournaledStore(storage.Store):
+    """Store that journals changes to its items."""
+
+    _journal_collections = ("items",)
+
+
+def _read_file(path: str) -> str | None:
+    """Read a file if it exists."""
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as fdesc:
+        return fdesc.read()
+
+
+async def test_journaled_store(tmpdir: py.path.local) -> None:
+    """Test changed items are appended to the journal and replayed on load."""
+    async with async_test_home_assistant() as hass:
+        config_dir = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+        hass.config.config_dir = config_dir
+        store = JournaledStore(hass, MOCK_VERSION, MOCK_KEY, atomic_writes=True)
+        items = [{"id": str(idx), "value": idx} for idx in range(10)]
+
+        await store.async_save({"items": items, "other": 1})
+        assert await hass.async_add_executor_job(_read_file, store.journal_path) is None
+        snapshot = await hass.async_add_executor_job(_read_file, store.path)
+
+        # Only the changed and removed items are written
+        items[1] = {"id": "1", "value": "changed"}
+        del items[2]
+        await store.async_save({"items": items, "other": 1})
+        assert await hass.async_add_executor_job(_read_file, store.path) == snapshot
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        assert [json.loads(line) for line in journal.splitlines()] == [
+            ["items", "1", {"id": "1", "value": "changed"}],
+            ["items", "2", None],
+        ]
+
+        # Saving the same data again does not write anything
+        await store.async_save({"items": items, "other": 1})
+        assert (
+            await hass.async_add_executor_job(_read_file, store.journal_path) == journal
+        )
+
+        # An incomplete record of an interrupted append is skipped
+        def _append_incomplete_record() -> None:
+            with open(store.journal_path, "a", encoding="utf-8") as fdesc:
+                fdesc.write('["items", "3", {"id": "3", "va')
+
+        await hass.async_add_executor_job(_append_incomplete_record)
+
+        stats = storage.async_get_write_stats(hass)
+        assert stats["writes"] == 1
+        assert stats["journal_appends"] == 1
+
+        # Loading compacts the journal into the data
+        store2 = JournaledStore(hass, MOCK_VERSION, MOCK_KEY, atomic_writes=True)
+        assert await store2.async_load() == {"items": items, "other": 1}
+        assert await hass.async_add_executor_job(_read_file, store.journal_path) is None
+        snapshot = await hass.async_add_executor_job(_read_file, store.path)
+        assert json.loads(snapshot)["data"] == {"items": items, "other": 1}
+        stats = storage.async_get_write_stats(hass)
+        assert stats["writes"] == 2
+        assert stats["batches"] == 2
+
+        # Changes after loading are journaled against the loaded data
+        loaded = await store2.async_load()
+        loaded["items"][0]["value"] = "changed by the caller"
+        items[0] = {"id": "0", "value": "changed after loading"}
+        await store2.async_save({"items": items, "other": 1})
+        assert await hass.async_add_executor_job(_read_file, store.path) == snapshot
+        journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+        assert [json.loads(line) for line in journal.splitlines()] == [
+            ["items", "0", {"id": "0", "value": "changed after loading"}],
+        ]
+        assert storage.async_get_write_stats(hass)["writes"] == 2
+
+        store3 = JournaledStore(hass, MOCK_VERSION, MOCK_KEY, atomic_writes=True)
+        assert await store3.async_load() == {"items": items, "other": 1}
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_not_seeded_when_migrating(
+    tmpdir: py.path.local,
+) -> None:
+    """Test changes are not journaled against data that has to be migrated."""
+    async with async_test_home_assistant() as hass:
+        config_dir = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+        hass.config.config_dir = config_dir
+        items = [{"id": str(idx), "value": idx} for idx in range(10)]
+        store = JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        await store.async_save({"items": items})
+
+        store2 = JournaledStore(hass, MOCK_VERSION_2, MOCK_KEY)
+        with patch.object(store2, "_async_migrate_func", return_value={"items": items}):
+            assert await store2.async_load() == {"items": items}
+        assert await hass.async_add_executor_job(_read_file, store.journal_path) is None
+        data = json.loads(await hass.async_add_executor_job(_read_file, store.path))
+        assert data["version"] == MOCK_VERSION_2
+
+        await hass.async_stop(force=True)
+
+
+async def test_journaled_store_compaction(tmpdir: py.path.local) -> None:
+    """Test the journal is compacted into the data."""
+    async with async_test_home_assistant() as hass:
+        config_dir = await hass.async_add_executor_job(tmpdir.mkdir, "temp_storage")
+        hass.config.config_dir = config_dir
+        store = JournaledStore(hass, MOCK_VERSION, MOCK_KEY)
+        items = [{"id": str(idx), "value": idx} for idx in range(4)]
+
+        async def _async_save_and_read() -> tuple[dict[str, Any], str | None]:
+            await store.async_save({"items": items, "other": 1})
+            data = await hass.async_add_executor_job(_read_file, store.path)
+            journal = await hass.async_add_executor_job(_read_file, store.journal_path)
+            return json.loads(data)["data"]["items"], journal
+
+        assert await _async_save_and_read() == (items, None)
+        first_items = list(items)
+
+        # The journal may hold half as many records as there are items
+        items[0] = {"id": "0", "value": "changed"}
+        assert (await _async_save_and_read())[0] == first_items
+        items.append({"id": "4", "value": 4})
+        assert (await _async_save_and_read())[0] == first_items
+        items.append({"id": "5", "value": 5})
+        assert await _async_save_and_read() == (items, None)
+        compacted_items = list(items)
+
+        # Other data is not journaled
+        items[0] = {"id": "0", "value": "changed again"}
+        assert (await _async_save_and_read())[0] == compacted_items
+        await store.async_save({"items": items, "other": 2})
+        data = await hass.async_add_executor_job(_read_file, store.path)
+        assert json.loads(data)["data"] == {"items": items, "other": 2}
+        assert await hass.async_add_executor_job(_read_file, store.journal_path) is None
+
+        # The journal is compacted when Home Assistant stops
+        items[1] = {"id": "1", "value": "changed"}
+        await store.async_save({"items": items, "other": 2})
+        assert await hass.async_add_executor_job(_read_file, store.journal_path)
+        hass.set_state(CoreState.final_write)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        data = await hass.async_add_executor_job(_read_file, store.path)
+        assert json.loads(data)["data"] == {"items": items, "other": 2}
+        assert await hass.async_add_executor_job(_read_file, store.journal_path) is None
+
+        await hass.async_stop(force=True)
+
+
 async def test_loading_corrupt_core_file(
     tmpdir: py.path.local, caplog: pytest.LogCaptureFixture
 ) -> None:
@@ -5,13 +5,16 @@ from collections.abc import Iterable
 from datetime import datetime, timedelta
 import json
 import logging
+import marshal
 import math
+from pathlib import Path
 import random
 from types import MappingProxyType
 from typing import Any
-from unittest.mock import patch
+from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+import jinja2
 import orjson
 import pytest
 import voluptuous as vol
@@ -4585,6 +4588,246 @@ async def test_cache_garbage_collection() -> None:
     assert not template._NO_HASS_ENV.template_cache.get(template_string)
 
 
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states('sensor.power') | float(0) * 2 }}",
+        "{{ states('sensor.power') | int(0) // 3 + 1 - 2 }}",
+        "{{ states('sensor.power') | float / 4 }}",
+        "{{ states('sensor.power') | round(1) % 3 }}",
+        "{{ is_state('light.a', 'on') and is_state('light.b', 'off') }}",
+        "{{ is_state('light.a', 'off') or not has_value('light.missing') }}",
+        "{{ is_state_attr('light.a', 'brightness', 100) }}",
+        "{{ state_attr('light.a', 'brightness') }}",
+        "{{ state_attr('light.a', 'missing') }}",
+        "{{ 10 < states('sensor.power') | float < 100 }}",
+        "{{ states('sensor.power') == '42.5' != False }}",
+        "{{ states('light.missing') }}",
+        "{{ 'on' }}",
+    ],
+)
+async def test_fast_path_matches_jinja(
+    hass: HomeAssistant, template_string: str
+) -> None:
+    """Test templates evaluated by the fast path render the same as Jinja."""
+    hass.states.async_set("sensor.power", "42.5")
+    hass.states.async_set("light.a", "on", {"brightness": 100})
+    hass.states.async_set("light.b", "off")
+
+    fast_tpl = template.Template(template_string, hass)
+    fast_info = fast_tpl.async_render_to_info()
+    assert fast_tpl._fast_path is not None
+
+    jinja_tpl = template.Template(template_string, hass)
+    jinja_tpl.ensure_valid()
+    jinja_tpl._ensure_compiled()
+    jinja_tpl._fast_path = None
+    jinja_info = jinja_tpl.async_render_to_info()
+
+    assert repr(fast_info.result()) == repr(jinja_info.result())
+    assert fast_info.entities == jinja_info.entities
+    assert fast_info.entity_dependencies == jinja_info.entity_dependencies
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states('sensor.power') | float }}",
+        "{{ 1 / states('sensor.power') | float(0) }}",
+        "{{ states('sensor.power') + 1 }}",
+    ],
+)
+async def test_fast_path_errors_match_jinja(
+    hass: HomeAssistant, template_string: str
+) -> None:
+    """Test the fast path raises the same errors as Jinja."""
+    hass.states.async_set("sensor.power", "unavailable")
+
+    fast_tpl = template.Template(template_string, hass)
+    with pytest.raises(TemplateError) as fast_err:
+        fast_tpl.async_render()
+    assert fast_tpl._fast_path is not None
+
+    jinja_tpl = template.Template(template_string, hass)
+    jinja_tpl.ensure_valid()
+    jinja_tpl._ensure_compiled()
+    jinja_tpl._fast_path = None
+    with pytest.raises(TemplateError) as jinja_err:
+        jinja_tpl.async_render()
+
+    assert str(fast_err.value) == str(jinja_err.value)
+
+
+@pytest.mark.parametrize(
+    "template_string",
+    [
+        "{{ states.sensor.power.state }}",
+        "{{ states('sensor.power') ~ 'W' }}",
+        "{{ states('sensor.power') | float(default=0) }}",
+        "{{ now() }}",
+        "{{ value }}",
+        "Power {{ states('sensor.power') }}",
+        "{% if true %}{{ states('sensor.power') }}{% endif %}",
+        "{{ states('sensor.power') }}{{ states('sensor.power') }}",
+    ],
+)
+async def test_fast_path_not_used(hass: HomeAssistant, template_string: str) -> None:
+    """Test templates outside of the fast path subset are rendered by Jinja."""
+    tpl = template.Template(template_string, hass)
+    tpl.async_render({"value": 1})
+    assert tpl._fast_path is None
+
+
+async def test_fast_path_shadowed_by_variables(hass: HomeAssistant) -> None:
+    """Test variables that shadow the functions of the fast path are used."""
+    hass.states.async_set("sensor.power", "42")
+    tpl = template.Template("{{ states('sensor.power') }}", hass)
+    assert tpl.async_render() == 42
+    assert tpl._fast_path is not None
+    assert tpl.async_render({"states": lambda entity_id: "shadowed"}) == "shadowed"
+    assert tpl.async_render({"other": 1}) == 42
+
+
+async def test_fast_path_limited(hass: HomeAssistant) -> None:
+    """Test the fast path does not bypass limited templates."""
+    hass.states.async_set("sensor.power", "42")
+    tpl = template.Template("{{ states('sensor.power') }}", hass)
+    with pytest.raises(TemplateError, match="not supported in limited templates"):
+        tpl.async_render(limited=True)
+    assert tpl._fast_path is not None
+
+
+async def test_render_info_entity_dependencies(hass: HomeAssistant) -> None:
+    """Test the parts of the states that are read are collected."""
+    hass.states.async_set("light.a", "on", {"brightness": 100, "friendly_name": "A"})
+    hass.states.async_set("light.b", "on")
+    hass.states.async_set("light.c", "on")
+
+    info = render_to_info(
+        hass,
+        "{{ state_attr('light.a', 'brightness') }} {{ states.light.a.name }}"
+        " {{ states('light.b') }} {{ states.light.b.last_changed }}"
+        " {{ states.light.c.attributes }} {{ states('light.c') }}",
+    )
+    assert info.entity_dependencies == {
+        "light.a": {"attributes.brightness", "attributes.friendly_name"},
+        "light.b": {"state", "last_changed"},
+        "light.c": None,
+    }
+    assert_result_info(info, ANY, {"light.a", "light.b", "light.c"})
+
+    old_state = hass.states.get("light.a")
+    hass.states.async_set("light.a", "off", {"brightness": 100, "friendly_name": "A"})
+    assert not info.state_change_affects_result(
+        "light.a", old_state, hass.states.get("light.a")
+    )
+    old_state = hass.states.get("light.a")
+    hass.states.async_set("light.a", "off", {"brightness": 50, "friendly_name": "A"})
+    assert info.state_change_affects_result(
+        "light.a", old_state, hass.states.get("light.a")
+    )
+    old_state = hass.states.get("light.c")
+    hass.states.async_set("light.c", "on", {"color": "red"})
+    assert info.state_change_affects_result(
+        "light.c", old_state, hass.states.get("light.c")
+    )
+    assert info.state_change_affects_result("light.b", None, hass.states.get("light.b"))
+
+
+async def test_code_cache(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the compiled code of templates is reused after a restart."""
+    hass.config.config_dir = str(tmp_path)
+    template_string = "{{ states('sensor.code_cache') | float(0) + 1 }}"
+
+    await template.async_load_code_cache(hass)
+    code_cache = template._get_code_cache(hass)
+    template.Template(template_string, hass).ensure_valid()
+    assert code_cache.hits == 0
+    assert code_cache.misses == 1
+    await code_cache.async_save()
+    assert (tmp_path / ".storage" / template.CODE_CACHE_FILE).is_file()
+
+    # Restart with empty in memory caches
+    hass.data.pop(template._CODE_CACHE)
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_code_cache(hass)
+    code_cache = template._get_code_cache(hass)
+    with patch.object(jinja2.Environment, "compile") as mock_compile:
+        tpl = template.Template(template_string, hass)
+        tpl.ensure_valid()
+    assert not mock_compile.called
+    assert code_cache.hits == 1
+    assert code_cache.misses == 0
+    assert tpl.async_render() == 1.0
+
+    # Templates that are no longer used are dropped when saving
+    template.Template("{{ 1 + 2 }}", hass).ensure_valid()
+    await code_cache.async_save()
+    hass.data.pop(template._CODE_CACHE)
+    code_cache = template._get_code_cache(hass)
+    await code_cache.async_load()
+    assert len(code_cache._loaded) == 2
+
+
+async def test_code_cache_same_source(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test templates with the same source share the cached code."""
+    hass.config.config_dir = str(tmp_path)
+    template_string = "{{ states('sensor.code_cache') | float(0) + 1 }}"
+
+    await template.async_load_code_cache(hass)
+    template.Template(template_string, hass).ensure_valid()
+    await template._get_code_cache(hass).async_save()
+
+    # Restart with empty in memory caches
+    hass.data.pop(template._CODE_CACHE)
+    hass.data.pop(template._ENVIRONMENT)
+    await template.async_load_code_cache(hass)
+    code_cache = template._get_code_cache(hass)
+    with patch.object(jinja2.Environment, "compile") as mock_compile:
+        for _ in range(2):
+            tpl = template.Template(template_string, hass)
+            tpl.ensure_valid()
+            # Do not reuse the code of the first template from the environment
+            tpl._env.template_cache.clear()
+    assert not mock_compile.called
+    assert code_cache.hits == 2
+    assert code_cache.misses == 0
+    assert not code_cache._dirty
+
+
+async def test_code_cache_other_version(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the code cache is discarded when the version changes."""
+    hass.config.config_dir = str(tmp_path)
+    await template.async_load_code_cache(hass)
+    code_cache = template._get_code_cache(hass)
+    template.Template("{{ 1 + 1 }}", hass).ensure_valid()
+    await code_cache.async_save()
+
+    hass.data.pop(template._CODE_CACHE)
+    code_cache = template._get_code_cache(hass)
+    with patch.object(template, "CODE_CACHE_VERSION", 0):
+        await code_cache.async_load()
+    assert code_cache._loaded == {}
+
+    (tmp_path / ".storage" / template.CODE_CACHE_FILE).write_bytes(b"corrupt")
+    await code_cache.async_load()
+    assert code_cache._loaded == {}
+
+    version = code_cache._version()
+    (tmp_path / ".storage" / template.CODE_CACHE_FILE).write_bytes(
+        marshal.dumps((version, ["not", "a", "dict"]))
+    )
+    await code_cache.async_load()
+    assert code_cache._loaded == {}
+
+    code = compile("1", "<template>", "eval")
+    (tmp_path / ".storage" / template.CODE_CACHE_FILE).write_bytes(
+        marshal.dumps((version, {"valid": code, "corrupt": b"code", 1: code}))
+    )
+    await code_cache.async_load()
+    assert code_cache._loaded == {"valid": code}
+
+
 def test_is_template_string() -> None:
     """Test is template string."""
     assert template.is_template_string("{{ x }}") is True
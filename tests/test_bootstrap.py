@@ -8,7 +8,7 @@ from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
 
-from homeassistant import bootstrap, runner
+from homeassistant import bootstrap, runner, setup
 import homeassistant.config as config_util
 from homeassistant.config_entries import HANDLERS, ConfigEntry
 from homeassistant.const import SIGNAL_BOOTSTRAP_INTEGRATIONS
@@ -229,6 +229,54 @@ async def test_setup_after_deps_in_stage_1_ignored(hass: HomeAssistant) -> None:
     assert order == ["cloud", "an_after_dep", "normal_integration"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_stage_2_does_not_wait_for_stage_1(hass: HomeAssistant) -> None:
+    """Test stage 2 domains only wait for the stage 1 domains they depend on."""
+    # This test relies on this
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    order = []
+    cloud_can_finish = asyncio.Event()
+
+    async def async_setup_cloud(hass, config):
+        await cloud_can_finish.wait()
+        order.append("cloud")
+        return True
+
+    async def async_setup_normal_integration(hass, config):
+        order.append("normal_integration")
+        cloud_can_finish.set()
+        return True
+
+    async def async_setup_cloud_dependant(hass, config):
+        order.append("cloud_dependant")
+        return True
+
+    mock_integration(hass, MockModule(domain="cloud", async_setup=async_setup_cloud))
+    mock_integration(
+        hass,
+        MockModule(
+            domain="normal_integration", async_setup=async_setup_normal_integration
+        ),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="cloud_dependant",
+            async_setup=async_setup_cloud_dependant,
+            partial_manifest={"after_dependencies": ["cloud"]},
+        ),
+    )
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"cloud": {}, "normal_integration": {}, "cloud_dependant": {}}
+    )
+
+    assert order == ["normal_integration", "cloud", "cloud_dependant"]
+    timings = hass.data[setup.DATA_SETUP_TIMINGS]
+    assert timings["cloud_dependant"].waited_for == ["cloud"]
+    assert timings["normal_integration"].done < timings["cloud"].done
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_setup_frontend_before_recorder(hass: HomeAssistant) -> None:
     """Test frontend is setup before recorder."""
@@ -56,6 +56,7 @@ from homeassistant.exceptions import (
 )
 from homeassistant.helpers.json import json_dumps
 import homeassistant.util.dt as dt_util
+from homeassistant.util.json import json_loads
 from homeassistant.util.read_only_dict import ReadOnlyDict
 from homeassistant.util.unit_system import METRIC_SYSTEM
 
@@ -938,6 +939,75 @@ async def test_eventbus_run_immediately_not_callback(hass: HomeAssistant) -> Non
         hass.bus.async_listen("test", listener, run_immediately=True)
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test events are routed to keyed listeners by event data."""
+    old_count = hass.bus.async_listeners().get("test", 0)
+    calls_one = []
+    calls_both = []
+
+    @ha.callback
+    def listener_one(event):
+        """Mock listener."""
+        calls_one.append(event)
+
+    async def listener_both(event):
+        """Mock listener."""
+        calls_both.append(event)
+
+    unsub_one = hass.bus.async_listen_keyed("test", "key", ["one"], listener_one)
+    unsub_both = hass.bus.async_listen_keyed(
+        "test", "key", ["one", "two"], listener_both
+    )
+    # All keyed listeners share a single listener on the bus
+    assert hass.bus.async_listeners()["test"] == old_count + 1
+    assert hass.bus.async_keyed_listeners("test", "key") == {"one": 2, "two": 1}
+    assert hass.bus.async_keyed_listeners("test", "other") == {}
+    jobs = hass.bus.async_keyed_listener_jobs("test", "key")
+    assert [job.target for job in jobs["one"]] == [listener_one, listener_both]
+    assert [job.target for job in jobs["two"]] == [listener_both]
+    assert hass.bus.async_keyed_listener_jobs("test", "other") == {}
+
+    hass.bus.async_fire("test", {"key": "one"})
+    hass.bus.async_fire("test", {"key": "two"})
+    hass.bus.async_fire("test", {"key": "three"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["key"] for event in calls_one] == ["one"]
+    assert [event.data["key"] for event in calls_both] == ["one", "two"]
+
+    unsub_one()
+    assert hass.bus.async_keyed_listeners("test", "key") == {"one": 1, "two": 1}
+    hass.bus.async_fire("test", {"key": "one"})
+    await hass.async_block_till_done()
+    assert len(calls_one) == 1
+    assert len(calls_both) == 3
+
+    unsub_both()
+    assert hass.bus.async_keyed_listeners("test", "key") == {}
+    assert jobs == {}
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+
+async def test_eventbus_keyed_listener_removed_before_dispatch(
+    hass: HomeAssistant,
+) -> None:
+    """Test a keyed listener removed after the event is fired is not called."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed("test", "key", ["one"], listener)
+    hass.bus.async_fire("test", {"key": "one"})
+    unsub()
+    await hass.async_block_till_done()
+
+    assert calls == []
+
+
 async def test_eventbus_unsubscribe_listener(hass: HomeAssistant) -> None:
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -1266,6 +1336,36 @@ async def test_statemachine_avoids_updating_attributes(hass: HomeAssistant) -> N
     assert isinstance(new_state.attributes, ReadOnlyDict)
 
 
+async def test_statemachine_shares_attributes_json(hass: HomeAssistant) -> None:
+    """Test states with unchanged attributes share the serialized attributes."""
+    attrs = {"some_attr": "attr_value", "nested": {"key": [1, 2]}}
+
+    hass.states.async_set("light.bowl", "off", attrs)
+    state = hass.states.get("light.bowl")
+    assert json_loads(state.as_dict_json)["attributes"] == attrs
+    assert json_loads(b"{" + state.as_compressed_state_json + b"}") == {
+        "light.bowl": json_loads(json_dumps(state.as_compressed_state))
+    }
+
+    hass.states.async_set("light.bowl", "on", dict(attrs))
+    new_state = hass.states.get("light.bowl")
+    assert new_state.attributes is state.attributes
+    assert new_state._attributes_json is state._attributes_json
+    assert json_loads(new_state.as_dict_json) == json_loads(
+        json_dumps(new_state.as_dict())
+    )
+    assert json_loads(b"{" + new_state.as_compressed_state_json + b"}") == {
+        "light.bowl": json_loads(json_dumps(new_state.as_compressed_state))
+    }
+
+    hass.states.async_set("light.bowl", "on", {"some_attr": "changed"})
+    changed_state = hass.states.get("light.bowl")
+    assert changed_state._attributes_json is None
+    assert json_loads(changed_state.as_dict_json)["attributes"] == {
+        "some_attr": "changed"
+    }
+
+
 def test_service_call_repr() -> None:
     """Test ServiceCall repr."""
     call = ha.ServiceCall("homeassistant", "start")
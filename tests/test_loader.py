@@ -1,4 +1,6 @@
 """Test to verify that we can load components."""
+from datetime import timedelta
+from typing import Any
 from unittest.mock import patch
 
 import pytest
@@ -7,8 +9,14 @@ from homeassistant import loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -206,6 +214,136 @@ async def test_get_integration_custom_component(
     assert integration.name == "Test Package"
 
 
+async def test_integration_index(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test resolved integrations are added to the integration index."""
+    integrations = await loader.async_get_integrations(hass, ["http", "test_package"])
+    http_integration = integrations["http"]
+    test_package = integrations["test_package"]
+
+    assert http_integration.platforms_exists(["view", "not_a_platform"]) == ["view"]
+    assert test_package.platforms_exists(["const", "light"]) == ["const"]
+
+    async_fire_time_changed(
+        hass,
+        dt_util.utcnow() + timedelta(seconds=loader.INTEGRATION_INDEX_SAVE_DELAY),
+    )
+    await hass.async_block_till_done()
+
+    index = hass_storage[loader.INTEGRATION_INDEX_STORAGE_KEY]["data"]
+    assert index["ha_version"] == loader.__version__
+    http_entry = index["integrations"][str(http_integration.file_path)]
+    assert http_entry["manifest"]["domain"] == "http"
+    assert "view.py" in http_entry["files"]
+    assert len(http_entry["stamp"]) == 2
+    test_package_entry = index["integrations"][str(test_package.file_path)]
+    assert test_package_entry["manifest"]["name"] == "Test Package"
+    assert test_package_entry["files"] == [
+        "__init__.py",
+        "const.py",
+        "icons.json",
+        "manifest.json",
+    ]
+
+
+async def test_integration_index_used(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    enable_custom_integrations: None,
+) -> None:
+    """Test integrations are resolved from the integration index."""
+    integrations_path = loader.pathlib.Path(hass.config.path("custom_components"))
+    test_package_path = integrations_path / "test_package"
+    test_embedded_path = integrations_path / "test_embedded"
+    hass_storage[loader.INTEGRATION_INDEX_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_INDEX_STORAGE_VERSION,
+        "data": {
+            "ha_version": loader.__version__,
+            "integrations": {
+                str(test_package_path): {
+                    "stamp": loader._integration_stamp(test_package_path),
+                    "manifest": {
+                        "domain": "test_package",
+                        "name": "Indexed Test Package",
+                        "version": "1.2.3",
+                    },
+                    "files": ["__init__.py"],
+                },
+                # The manifest changed after the entry was indexed
+                str(test_embedded_path): {
+                    "stamp": [0, 0],
+                    "manifest": {
+                        "domain": "test_embedded",
+                        "name": "Indexed Test Embedded",
+                        "version": "1.2.3",
+                    },
+                    "files": ["__init__.py"],
+                },
+            },
+        },
+    }
+
+    integrations = await loader.async_get_integrations(
+        hass, ["test_package", "test_embedded"]
+    )
+    test_package = integrations["test_package"]
+    test_embedded = integrations["test_embedded"]
+
+    assert test_package.name == "Indexed Test Package"
+    assert test_package.platforms_exists(["const"]) == []
+    assert test_embedded.name == "Test Embedded"
+    assert test_embedded.platforms_exists(["switch"]) == ["switch"]
+
+
+async def test_integration_index_other_version(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test the integration index of another version is not used."""
+    http_path = loader.pathlib.Path(http.__file__).parent
+    hass_storage[loader.INTEGRATION_INDEX_STORAGE_KEY] = {
+        "version": loader.INTEGRATION_INDEX_STORAGE_VERSION,
+        "data": {
+            "ha_version": "2024.2.0",
+            "integrations": {
+                str(http_path): {
+                    "stamp": [0, 0],
+                    "manifest": {"domain": "http", "name": "Indexed HTTP"},
+                    "files": ["__init__.py"],
+                },
+            },
+        },
+    }
+
+    with patch("homeassistant.loader.__version__", "2024.2.0"):
+        integration = await loader.async_get_integration(hass, "http")
+
+    # Built-in integrations are not validated in release versions
+    assert integration.name == "Indexed HTTP"
+
+    hass.data.pop(loader.DATA_INTEGRATION_INDEX)
+    hass.data[loader.DATA_INTEGRATIONS].pop("http")
+    integration = await loader.async_get_integration(hass, "http")
+
+    assert integration.name == "HTTP"
+
+
+async def test_integration_index_disabled(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    """Test integrations are resolved without the disabled integration index."""
+    loader.async_disable_integration_index(hass)
+
+    integration = await loader.async_get_integration(hass, "http")
+
+    assert integration.name == "HTTP"
+    assert hass.data[loader.DATA_INTEGRATION_INDEX] is None
+    await hass.async_block_till_done()
+    assert loader.INTEGRATION_INDEX_STORAGE_KEY not in hass_storage
+
+
 def test_integration_properties(hass: HomeAssistant) -> None:
     """Test integration properties."""
     integration = loader.Integration(
@@ -791,3 +791,53 @@ async def test_setup_config_entry_from_yaml(
     caplog.clear()
     hass.data.pop(setup.DATA_SETUP)
     hass.config.components.remove("test_integration_only_entry")
+
+
+async def test_setup_timings(hass: HomeAssistant) -> None:
+    """Test the setup timings are recorded and exported as a Chrome trace."""
+    mock_integration(hass, MockModule("root"))
+    mock_integration(hass, MockModule("dep", dependencies=["root"]))
+    mock_integration(hass, MockModule("other"))
+    mock_integration(
+        hass,
+        MockModule(
+            "comp",
+            dependencies=["dep"],
+            partial_manifest={"after_dependencies": ["other"]},
+        ),
+    )
+    setup.async_set_domains_to_be_loaded(hass, {"other"})
+
+    await asyncio.gather(
+        setup.async_setup_component(hass, "comp", {}),
+        setup.async_setup_component(hass, "other", {}),
+    )
+
+    timings = hass.data[setup.DATA_SETUP_TIMINGS]
+    assert timings.keys() == {"root", "dep", "other", "comp"}
+    assert timings["comp"].waited_for == ["dep", "other"]
+    assert timings["dep"].waited_for == ["root"]
+    assert timings["root"].waited_for == []
+    for timing in timings.values():
+        assert timing.queued <= timing.dependencies_done <= timing.done
+    assert timings["comp"].dependencies_done >= timings["dep"].done
+
+    critical_path = setup.async_get_setup_critical_path(hass)
+    assert critical_path[-1] == "comp"
+    assert critical_path[0] in ("root", "other")
+
+    trace = setup.async_get_setup_trace(hass)
+    assert trace["displayTimeUnit"] == "ms"
+    setup_events = {
+        event["name"]: event
+        for event in trace["traceEvents"]
+        if event["cat"] == "setup"
+    }
+    assert setup_events.keys() == {"root", "dep", "other", "comp"}
+    assert setup_events["comp"]["args"] == {"critical_path": True}
+    assert setup_events["comp"]["ph"] == "X"
+    assert "comp (dependencies)" in {
+        event["name"]
+        for event in trace["traceEvents"]
+        if event["cat"] == "dependencies"
+    }